@@ -5,6 +5,7 @@ from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, B
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from pathlib import Path
+import asyncio
 import logging
 import uuid
 import aiofiles
@@ -14,6 +15,10 @@ from app.models.database import Map, PreprocessedMapData
 from app.models.enums import MapStatus
 from app.services.storage_service import StorageService
 from app.core.pathfinding.preprocessor import MapPreprocessor
+from app.core.pathfinding.hpa import HierarchicalGraph
+from app.core.pathfinding.asset_store import MapAssetStore, remove_stale_versions
+from app.core.pathfinding.alt import LandmarkTable, LANDMARKS_DIRNAME, landmarks_directory
+from app.core.pathfinding.flowfield import build_poi_flow_fields, flow_fields_directory, FLOW_FIELDS_DIRNAME
 from app.services.ml_service import get_ml_service, ProcessingMode
 from app.api.dependencies import get_db, get_storage_service
 from app.config import settings
@@ -256,14 +261,58 @@ async def preprocess_map_task(map_id: str, image_path: str, storage: StorageServ
                 except Exception as e:
                     logger.error(f"Failed to load grid data from {grid_path}: {e}")
 
+            # 재전처리 시에도 등록된 POI는 유지 (흐름장은 새 그리드로 다시 생성)
+            from sqlalchemy import select
+            previous = await db.execute(
+                select(PreprocessedMapData.poi_points).where(PreprocessedMapData.map_id == map_id)
+            )
+            poi_points = previous.scalars().first()
+
+            # HPA* 추상 그래프 / 메모리 맵 지도 배열 / ALT 랜드마크 테이블 / POI 흐름장 생성
+            # (실패해도 전처리는 계속 - 길찾기는 A*와 요청 시 생성한 인덱스로 대체)
+            # 모두 CPU를 오래 쓰므로 스레드에서 실행해 진행 중인 길찾기 요청의 이벤트 루프를 막지 않음
+            # 지도 배열은 전처리 데이터 ID로 버전을 나누므로 ID를 미리 정함
+            preprocessed_id = str(uuid.uuid4())
+            graph_data = None
+            if grid_data:
+                import numpy as np
+                grid_array = np.array(grid_data)
+                try:
+                    graph = await asyncio.to_thread(HierarchicalGraph.build, grid_array, settings.hpa_cluster_size)
+                    graph_data = graph.to_dict()
+                except Exception as e:
+                    logger.error(f"HPA* 추상 그래프 생성 실패: {e}")
+                try:
+                    await asyncio.to_thread(
+                        MapAssetStore(settings.storage_path, settings.routing_profiles).write,
+                        map_id, preprocessed_id, grid_array
+                    )
+                except Exception as e:
+                    logger.error(f"지도 배열 저장 실패: {e}")
+                try:
+                    landmarks = await asyncio.to_thread(
+                        LandmarkTable.build, grid_array, settings.alt_landmark_count, result.get('entrance_points')
+                    )
+                    await asyncio.to_thread(landmarks.save, landmarks_directory(output_dir, preprocessed_id))
+                except Exception as e:
+                    logger.error(f"ALT 랜드마크 테이블 생성 실패: {e}")
+                try:
+                    await asyncio.to_thread(
+                        build_poi_flow_fields, grid_array, poi_points, flow_fields_directory(output_dir, preprocessed_id)
+                    )
+                except Exception as e:
+                    logger.error(f"POI 흐름장 생성 실패: {e}")
+
             preprocessed_data = PreprocessedMapData(
+                id=preprocessed_id,
                 map_id=map_id,
                 binary_image_path=s3_paths.get('binary_image') if s3_paths else result.get('binary_image'),
                 edge_image_path=s3_paths.get('edge_image') if s3_paths else result.get('edge_image'),
                 segmented_image_path=s3_paths.get('walkable_mask') if s3_paths else (result.get('walkable_mask_path') or result.get('walkable_mask')),
-                graph_data=None,  # Phase 2에서 구현
+                graph_data=graph_data,  # HPA* 추상 그래프
                 walkable_grid=grid_data,
                 entrance_points=result.get('entrance_points'),
+                poi_points=poi_points,
                 processing_time=result['processing_time'],
                 algorithm_used=algorithm_used
             )
@@ -289,6 +338,11 @@ async def preprocess_map_task(map_id: str, image_path: str, storage: StorageServ
             await db.commit()
             logger.info(f"지도 전처리 완료: {map_id}")
 
+            # 이전 전처리 데이터의 지도 배열/랜드마크 테이블/흐름장 삭제 (새 데이터를 커밋한 뒤라 이전 그리드로 탐색하는 요청 없음)
+            MapAssetStore(settings.storage_path).prune(map_id, preprocessed_id)
+            remove_stale_versions(output_dir / LANDMARKS_DIRNAME, landmarks_directory(output_dir, preprocessed_id).name)
+            remove_stale_versions(output_dir / FLOW_FIELDS_DIRNAME, preprocessed_id)
+
             return result
 
         except Exception as e:
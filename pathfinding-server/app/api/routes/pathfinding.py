@@ -2,7 +2,8 @@
 길찾기 관련 API 엔드포인트
 Phase 2의 핵심 기능 - A* 알고리즘 기반 경로 찾기
 """
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Header
+from fastapi.responses import StreamingResponse, Response
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,12 +11,28 @@ from app.models.schemas import (
     PathfindingRequest,
     PathfindingResponse,
     MultiPathfindingRequest,
+    BatchRouteRequest,
+    RouteMatrixRequest,
+    IsochroneRequest,
+    NearestPOIRequest,
     PathMetadata,
     ValidatePointRequest,
-    ValidatePointResponse
+    ValidatePointResponse,
+    ValidatePointsRequest,
+    ValidatePointsResponse,
+    POIRegisterRequest,
+    POIResponse
 )
 from app.models.enums import PathDifficulty
+from app.core.pathfinding.encoding import (
+    ROUTE_FORMATS,
+    DEFAULT_POLYLINE_PRECISION,
+    FormatNotAcceptableError,
+    negotiate_format,
+    encode_route
+)
 from app.services.pathfinding_service import PathfindingService
+from app.services.search_executor import SearchExecutor, SearchQueueFullError
 from app.api.dependencies import get_db
 from app.config import settings
 import logging
@@ -24,13 +41,39 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/pathfinding", tags=["pathfinding"])
 
 # 서비스 인스턴스 생성
-pathfinding_service = PathfindingService(storage_path=settings.storage_path)
+# 탐색은 프로세스 풀에서 실행 (워커가 지도 배열 저장소를 메모리 맵으로 열기 때문에 storage_path가 서비스와 같아야 함)
+search_executor = SearchExecutor(
+    max_workers=settings.search_workers,
+    queue_depth=settings.search_queue_depth,
+    storage_path=settings.storage_path
+) if settings.search_process_pool else None
+
+pathfinding_service = PathfindingService(
+    storage_path=settings.storage_path,
+    max_workers=settings.search_workers,
+    search_executor=search_executor,
+    profiles=settings.routing_profiles
+)
+
+
+def _wire_options(options: Optional[dict], accept: Optional[str], allowed=tuple(ROUTE_FORMATS)):
+    """
+    응답 형식 옵션(format, polyline_precision)을 분리해 (형식, 정밀도, 나머지 탐색 옵션) 반환
+    형식 옵션은 탐색 결과에 영향이 없으므로 경로 캐시 키에서 제외한다.
+    """
+    options = dict(options or {})
+    fmt = negotiate_format(accept, options.pop('format', None), allowed)
+    precision = options.pop('polyline_precision', DEFAULT_POLYLINE_PRECISION)
+    if not isinstance(precision, int) or not 1 <= precision <= 7:
+        raise ValueError("polyline_precision은 1-7 사이의 정수여야 합니다")
+    return fmt, precision, options
 
 
 @router.post("/route", response_model=PathfindingResponse)
 async def find_route(
     request: PathfindingRequest,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    accept: Optional[str] = Header(None)
 ):
     """
     두 지점 사이의 최적 경로 찾기
@@ -42,15 +85,38 @@ async def find_route(
     - start: 시작 좌표 (0-1 정규화)
     - end: 종료 좌표 (0-1 정규화)
     - options: 추가 옵션
+        - algorithm: 탐색 엔진 (astar, jps, bidirectional, ara, lazy_theta, hpa, alt, flow_field)
+          지정하지 않으면 목적지가 등록된 POI일 때 flow_field,
+          그 외에는 지도에 준비된 전처리 데이터에 따라 alt / astar (최적 경로)
+          hpa는 더 빠르지만 준최적 경로라 지정한 경우에만 사용
+        - time_budget_ms: 탐색 시간 예산 (지정 시 기본 엔진은 ara)
+        - avoid_areas: 회피 영역 다각형 리스트 ([[x, y], ...] 또는 {"polygon": [...], "penalty": 1보다 큰 비용 배율})
+          penalty가 없으면 통행 금지, 있으면 그 배율만큼 비용을 높여 가능한 한 피함
+        - prefer_areas: 선호 영역 다각형 리스트 ([[x, y], ...] 또는 {"polygon": [...], "weight": 0.1-1, 기본 0.5})
+          비용 영역이 있으면 가중치 A*로 탐색 (search_stats.algorithm = weighted_astar)
+          이때 다른 algorithm을 지정하면 가중치 A*로 대체하고 search_stats.requested_algorithm에 기록,
+          ara/time_budget_ms는 시간 예산을 지킬 수 없어 오류
+        - profile: 접근성 프로필 (default, wheelchair, cart 등) - 프로필의 최소 통로 폭보다 좁은 곳은 지나지 않음
+        - prefer_clearance: true면 벽에 가까운 셀일수록 비용을 높여 복도 가운데를 따라가는 가중치 A*로 탐색
+        - format: 응답 형식 (json, polyline, msgpack, float32) - 없으면 Accept 헤더로 결정
+        - polyline_precision: polyline 형식의 좌표 소수점 자리수 (1-7, 기본 5)
 
     **출력:**
     - polyline: 경로 좌표 리스트
     - svg_path: SVG 경로 문자열
     - distance: 거리 정보
     - estimated_time: 예상 시간
+    - search_stats: 탐색 통계 (ARA*의 경우 달성한 준최적 한계 포함)
+
+    **압축 응답 형식 (options.format 또는 Accept):**
+    - polyline (application/vnd.polyline+json): polyline이 인코딩된 폴리라인 문자열, svg_path 제외
+    - msgpack (application/x-msgpack): polyline이 리틀 엔디언 float32 바이트, svg_path 제외
+    - float32 (application/octet-stream): 본문은 경로 좌표 float32 배열만, 거리/시간은 X-Path-* 헤더
     """
     try:
         print(request)
+        fmt, precision, options = _wire_options(request.options, accept)
+
         # 좌표 검증
         if not (0 <= request.start[0] <= 1 and 0 <= request.start[1] <= 1):
             raise ValueError("시작 좌표는 0-1 범위여야 합니다")
@@ -63,7 +129,7 @@ async def find_route(
             map_id=request.map_id,
             start=request.start,
             end=request.end,
-            options=request.options
+            options=options
         )
 
         if not result.get('success'):
@@ -82,19 +148,41 @@ async def find_route(
             turn_count=result['turn_count']
         )
 
-        return PathfindingResponse(
+        response = PathfindingResponse(
             path_id=result['path_id'],
             map_id=result['map_id'],
             polyline=result['polyline'],
             svg_path=result['svg_path'],
             metadata=metadata,
+            search_stats=result.get('search_stats'),
             cached=result.get('cached', False),
             processing_time=result['processing_time']
         )
+        if fmt == 'json':
+            return response
+
+        headers = {}
+        if fmt == 'float32':
+            headers = {
+                'X-Path-Id': result['path_id'],
+                'X-Path-Distance-Meters': f"{result['distance_meters']:.3f}",
+                'X-Path-Estimated-Time-Seconds': f"{result['estimated_time_seconds']:.3f}",
+                'X-Path-Point-Count': str(len(result['polyline']))
+            }
+        return Response(
+            content=encode_route(response.model_dump(mode='json'), fmt, precision),
+            media_type=ROUTE_FORMATS[fmt],
+            headers=headers
+        )
 
+    except FormatNotAcceptableError as e:
+        raise HTTPException(status_code=406, detail=str(e))
     except ValueError as e:
         logger.error(f"입력 검증 오류: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except SearchQueueFullError as e:
+        logger.warning(f"탐색 대기열 초과: {e}")
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"경로 찾기 오류: {e}", exc_info=True)
         raise HTTPException(
@@ -103,6 +191,66 @@ async def find_route(
         )
 
 
+@router.post("/route/batch")
+async def find_route_batch(
+    request: BatchRouteRequest,
+    db: AsyncSession = Depends(get_db),
+    accept: Optional[str] = Header(None)
+):
+    """
+    여러 출발지/목적지 쌍의 경로를 한 번에 찾기 (NDJSON 스트리밍)
+
+    지도 데이터는 한 번만 로드하고, 출발지가 같은 쌍들은 최단 경로 트리 하나로 함께 계산하며,
+    나머지 쌍은 병렬로 탐색합니다. 개별 경로는 길찾기 기록에 저장하지 않습니다.
+
+    **입력:**
+    - map_id: 지도 ID
+    - pairs: 출발지/목적지 쌍 리스트 (최대 1000개, 각 쌍에 선택적 id)
+    - options: 단일 경로 찾기와 같은 옵션
+
+    **출력 (application/x-ndjson, 한 줄에 JSON 하나):**
+    - 경로가 완료되는 순서대로 한 줄씩: index(요청 순서), id, 단일 경로 찾기와 같은 경로 정보
+      (실패한 쌍은 success=false와 error)
+    - 마지막 줄: summary=true, 성공/실패 수, 처리 시간
+    - options.format 또는 Accept가 polyline이면 각 줄의 polyline이 인코딩된 폴리라인 문자열,
+      msgpack이면 줄 대신 MessagePack 객체를 이어서 기록 (application/x-msgpack)
+    """
+    try:
+        fmt, precision, options = _wire_options(request.options, accept, allowed=('json', 'polyline', 'msgpack'))
+        for i, pair in enumerate(request.pairs):
+            for point in (pair.start, pair.end):
+                if not (0 <= point[0] <= 1 and 0 <= point[1] <= 1):
+                    raise ValueError(f"쌍 {i+1}의 좌표는 0-1 범위여야 합니다")
+
+        results = await pathfinding_service.find_route_batch(
+            db=db,
+            map_id=request.map_id,
+            pairs=[pair.model_dump() for pair in request.pairs],
+            options=options
+        )
+
+    except FormatNotAcceptableError as e:
+        raise HTTPException(status_code=406, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"배치 경로 찾기 오류: {e}")
+        raise HTTPException(status_code=500, detail="경로 찾기 중 오류가 발생했습니다")
+
+    if fmt == 'msgpack':
+        async def objects():
+            async for result in results:
+                yield encode_route(result, fmt, precision)
+
+        return StreamingResponse(objects(), media_type=ROUTE_FORMATS['msgpack'])
+
+    async def lines():
+        async for result in results:
+            yield encode_route(result, fmt, precision) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.post("/multi-route")
 async def find_multi_route(
     request: MultiPathfindingRequest,
@@ -116,14 +264,17 @@ async def find_multi_route(
     **입력:**
     - map_id: 지도 ID
     - points: 방문할 지점들 (최소 2개)
-    - optimize_order: 경유 순서 최적화 여부
+    - optimize_order: 경유 순서 최적화 여부 (보행 거리 기준 최근접 이웃 + 2-opt/Or-opt)
     - return_to_start: 시작점으로 복귀 여부
+    - fixed_end: 마지막 지점을 도착지로 고정
+    - options.order_time_budget_ms: 순서 최적화 시간 예산 (기본 200ms)
 
     **출력:**
     - segments: 각 구간별 경로 정보
     - combined_polyline: 전체 경로
     - total_distance: 총 거리
     - total_time: 총 예상 시간
+    - order_optimization: 순서 최적화 통계 (최근접 이웃 순서 대비 단축 거리/비율)
     """
     try:
         # 좌표 검증
@@ -139,6 +290,7 @@ async def find_multi_route(
             options={
                 'optimize_order': request.optimize_order,
                 'return_to_start': request.return_to_start,
+                'fixed_end': request.fixed_end,
                 **request.options
             }
         )
@@ -153,11 +305,147 @@ async def find_multi_route(
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except SearchQueueFullError as e:
+        logger.warning(f"탐색 대기열 초과: {e}")
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"다중 경로 찾기 오류: {e}")
         raise HTTPException(status_code=500, detail="경로 찾기 중 오류가 발생했습니다")
 
 
+@router.post("/matrix")
+async def compute_route_matrix(
+    request: RouteMatrixRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    다대다 보행 거리 행렬
+
+    지점마다 Dijkstra를 한 번 실행해 모든 지점 쌍의 보행 거리를 계산합니다.
+    (N개 지점 = 탐색 N번)
+
+    **입력:**
+    - map_id: 지도 ID
+    - points: 지점 리스트 (0-1 정규화, 2-100개)
+    - return_paths: 지점 쌍별 경로 포함 여부
+
+    **출력:**
+    - distance_matrix_pixels / distance_matrix_meters: N x N 보행 거리 (도달 불가 쌍은 null)
+    - duration_matrix_seconds: N x N 예상 보행 시간
+    - snapped_points: 장애물 위 지점을 보정한 좌표
+    - paths: paths[i][j] 경로 좌표 리스트 (return_paths=true인 경우)
+    """
+    try:
+        for i, point in enumerate(request.points):
+            if not (0 <= point[0] <= 1 and 0 <= point[1] <= 1):
+                raise ValueError(f"지점 {i+1}의 좌표는 0-1 범위여야 합니다")
+
+        return await pathfinding_service.compute_route_matrix(
+            db=db,
+            map_id=request.map_id,
+            points=request.points,
+            return_paths=request.return_paths
+        )
+
+    except ValueError as e:
+        logger.error(f"거리 행렬 입력 오류: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"거리 행렬 계산 오류: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="거리 행렬 계산 중 오류가 발생했습니다")
+
+
+@router.post("/isochrone")
+async def compute_isochrone(
+    request: IsochroneRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    도보 도달 가능 영역(isochrone) 계산
+
+    출발지에서 거리 상한이 있는 Dijkstra를 한 번 실행해 시간 구간별로 도달 가능한 영역의
+    윤곽선 다각형을 반환합니다. 같은 지도/출발 셀/시간 구간 요청은 캐시에서 반환합니다.
+
+    **입력:**
+    - map_id: 지도 ID
+    - start: 출발 좌표 (0-1 정규화)
+    - bands_minutes: 도보 시간 구간 (분, 최대 10개, 기본 1/3/5분)
+
+    **출력:**
+    - bands: 구간별 seconds, polygons(exterior/holes, 정규화된 좌표), cell_count, area_square_meters
+    - snapped_start: 보정된 출발 좌표
+    - search_stats: 도달한 셀 수와 계산 시간
+    """
+    try:
+        if not (0 <= request.start[0] <= 1 and 0 <= request.start[1] <= 1):
+            raise ValueError("출발 좌표는 0-1 범위여야 합니다")
+        if any(band <= 0 or band > 120 for band in request.bands_minutes):
+            raise ValueError("시간 구간은 0분 초과 120분 이하여야 합니다")
+
+        return await pathfinding_service.compute_isochrone(
+            db=db,
+            map_id=request.map_id,
+            start=request.start,
+            bands_seconds=[band * 60 for band in request.bands_minutes]
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SearchQueueFullError as e:
+        logger.warning(f"탐색 대기열 초과: {e}")
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"도달 가능 영역 계산 오류: {e}")
+        raise HTTPException(status_code=500, detail="도달 가능 영역 계산 중 오류가 발생했습니다")
+
+
+@router.post("/nearest")
+async def find_nearest_pois(
+    request: NearestPOIRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    가장 가까운 POI 찾기
+
+    출발지에서 다중 목적지 탐색을 한 번만 실행해 보행 거리가 가장 가까운 POI k개를
+    순위와 경로와 함께 반환합니다 (예: 가장 가까운 화장실/출구).
+
+    **입력:**
+    - map_id: 지도 ID
+    - start: 출발 좌표 (0-1 정규화)
+    - category: POI 분류 (없으면 모든 POI)
+    - k: 찾을 POI 수 (1-10, 기본 3)
+    - include_entrances: 전처리에서 감지한 출입구도 후보에 포함 (분류 'entrance')
+    - options: 경로 최적화 옵션
+
+    **출력:**
+    - results: 가까운 순서의 경로 정보 (rank, poi, polyline, distance_meters 등)
+    - search_stats: 확장한 셀 수와 확정된 후보 수
+    """
+    try:
+        if not (0 <= request.start[0] <= 1 and 0 <= request.start[1] <= 1):
+            raise ValueError("출발 좌표는 0-1 범위여야 합니다")
+
+        return await pathfinding_service.find_nearest_pois(
+            db=db,
+            map_id=request.map_id,
+            start=request.start,
+            k=request.k,
+            category=request.category,
+            include_entrances=request.include_entrances,
+            options=request.options
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SearchQueueFullError as e:
+        logger.warning(f"탐색 대기열 초과: {e}")
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"가까운 POI 찾기 오류: {e}")
+        raise HTTPException(status_code=500, detail="가까운 POI 찾기 중 오류가 발생했습니다")
+
+
 @router.get("/alternatives")
 async def find_alternative_routes(
     map_id: str,
@@ -166,22 +454,28 @@ async def find_alternative_routes(
     end_x: float = Query(..., ge=0, le=1, description="종료 X 좌표 (0-1)"),
     end_y: float = Query(..., ge=0, le=1, description="종료 Y 좌표 (0-1)"),
     max_alternatives: int = Query(3, ge=1, le=5, description="최대 대체 경로 수"),
+    max_stretch: float = Query(0.25, gt=0, le=1, description="최적 경로 대비 허용 추가 길이 비율"),
+    max_overlap: float = Query(0.7, ge=0, le=1, description="다른 경로와 겹쳐도 되는 길이 비율"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     대체 경로 찾기
 
     메인 경로와 함께 여러 대체 경로를 제공합니다.
+    출발지/목적지 최단 경로 트리 두 개에서 plateau(두 트리가 공유하는 구간)를 찾아
+    최적 경로와 뚜렷이 다른 경로를 만듭니다.
 
     **쿼리 파라미터:**
     - map_id: 지도 ID
     - start_x, start_y: 시작 좌표
     - end_x, end_y: 종료 좌표
-    - max_alternatives: 최대 대체 경로 수 (1-5)
+    - max_alternatives: 최대 대체 경로 수 (1-5, 최적 경로 제외)
+    - max_stretch: 최적 경로보다 최대 몇 배 더 길어도 되는지 (기본 0.25 = 25%)
+    - max_overlap: 이미 고른 경로들과 겹쳐도 되는 길이 비율 (기본 0.7)
 
     **출력:**
     - main_route: 최적 경로
-    - alternatives: 대체 경로 리스트
+    - alternatives: 대체 경로 리스트 (stretch, overlap 포함)
     """
     try:
         result = await pathfinding_service.find_alternative_routes(
@@ -189,17 +483,23 @@ async def find_alternative_routes(
             map_id=map_id,
             start=(start_x, start_y),
             end=(end_x, end_y),
-            max_alternatives=max_alternatives
+            max_alternatives=max_alternatives,
+            options={'max_stretch': max_stretch, 'max_overlap': max_overlap}
         )
 
         if not result.get('success'):
             raise HTTPException(
                 status_code=404,
-                detail="대체 경로를 찾을 수 없습니다"
+                detail=result.get('error', "대체 경로를 찾을 수 없습니다")
             )
 
         return result
 
+    except HTTPException:
+        raise
+    except SearchQueueFullError as e:
+        logger.warning(f"탐색 대기열 초과: {e}")
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"대체 경로 찾기 오류: {e}")
         raise HTTPException(status_code=500, detail="경로 찾기 중 오류가 발생했습니다")
@@ -340,4 +640,112 @@ async def validate_point(
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"좌표 검증 처리 오류: {e}")
-        raise HTTPException(status_code=500, detail="좌표 검증 중 오류가 발생했습니다")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="좌표 검증 중 오류가 발생했습니다")
+
+
+@router.post("/validate-points", response_model=ValidatePointsResponse)
+async def validate_points(
+    request: ValidatePointsRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    여러 좌표 일괄 검증 및 자동 보정
+
+    POI 목록 등 많은 좌표를 한 번의 요청으로 보정합니다.
+
+    **입력:**
+    - map_id: 지도 ID
+    - points: 검증할 좌표 리스트 (0-1 정규화)
+
+    **출력:**
+    - results: 좌표별 검증 결과 (validate-point와 같은 항목, 보정 실패 시 adjusted_point는 null)
+    """
+    try:
+        results = await pathfinding_service.validate_and_adjust_points(
+            db=db,
+            map_id=request.map_id,
+            points=request.points
+        )
+        return ValidatePointsResponse(results=results)
+
+    except ValueError as e:
+        logger.error(f"좌표 일괄 검증 오류: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"좌표 일괄 검증 처리 오류: {e}")
+        raise HTTPException(status_code=500, detail="좌표 검증 중 오류가 발생했습니다")
+
+
+@router.post("/pois", response_model=POIResponse)
+async def register_poi(
+    request: POIRegisterRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    POI(자주 찾는 목적지) 등록
+
+    POI까지의 흐름장(거리 + 다음 이동 방향)을 미리 만들어 두고,
+    이후 종료점이 이 POI인 /route 요청은 탐색 없이 흐름장을 따라 경로를 만듭니다.
+
+    **입력:**
+    - map_id: 지도 ID
+    - name: POI 이름
+    - position: POI 좌표 (0-1 정규화)
+    - category: 분류 (선택)
+    """
+    try:
+        if not (0 <= request.position[0] <= 1 and 0 <= request.position[1] <= 1):
+            raise ValueError("POI 좌표는 0-1 범위여야 합니다")
+
+        poi = await pathfinding_service.register_poi(
+            db=db,
+            map_id=request.map_id,
+            name=request.name,
+            position=request.position,
+            category=request.category
+        )
+        return POIResponse(**poi)
+
+    except ValueError as e:
+        logger.error(f"POI 등록 오류: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"POI 등록 처리 오류: {e}")
+        raise HTTPException(status_code=500, detail="POI 등록 중 오류가 발생했습니다")
+
+
+@router.get("/pois/{map_id}", response_model=List[POIResponse])
+async def list_pois(
+    map_id: str,
+    db: AsyncSession = Depends(get_db)
+):
+    """특정 지도에 등록된 POI 목록 조회"""
+    try:
+        pois = await pathfinding_service.list_pois(db=db, map_id=map_id)
+        return [POIResponse(**poi) for poi in pois]
+
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"POI 목록 조회 오류: {e}")
+        raise HTTPException(status_code=500, detail="POI 목록 조회 중 오류가 발생했습니다")
+
+
+@router.delete("/pois/{map_id}/{poi_id}")
+async def delete_poi(
+    map_id: str,
+    poi_id: str,
+    db: AsyncSession = Depends(get_db)
+):
+    """POI와 흐름장 삭제"""
+    try:
+        deleted = await pathfinding_service.delete_poi(db=db, map_id=map_id, poi_id=poi_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"POI 삭제 오류: {e}")
+        raise HTTPException(status_code=500, detail="POI 삭제 중 오류가 발생했습니다")
+
+    if not deleted:
+        raise HTTPException(status_code=404, detail="POI를 찾을 수 없습니다")
+    return {'success': True, 'map_id': map_id, 'poi_id': poi_id}
@@ -1,7 +1,7 @@
 """
 Application configuration settings
 """
-from typing import List, Optional
+from typing import List, Optional, Dict
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -59,6 +59,12 @@ class Settings(BaseSettings):
     default_walkway_width: int = Field(default=10)
     path_smoothing: bool = Field(default=True)
     cache_paths: bool = Field(default=True)
+    hpa_cluster_size: int = Field(default=16)  # HPA* 클러스터 한 변의 셀 수
+    alt_landmark_count: int = Field(default=8)  # ALT 휴리스틱 랜드마크 수
+    search_workers: int = Field(default=4)  # 경로 탐색 워커 수
+    search_process_pool: bool = Field(default=True)  # 탐색을 프로세스 풀에서 실행 (False면 스레드 풀)
+    search_queue_depth: int = Field(default=32)  # 동시에 실행/대기할 수 있는 탐색 요청 수
+    routing_profiles: Dict[str, int] = Field(default={'wheelchair': 3, 'cart': 5})  # 접근성 프로필 -> 최소 통로 폭 (그리드 셀)
 
     # API
     api_prefix: str = Field(default="/api/v1")
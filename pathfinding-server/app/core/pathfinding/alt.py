@@ -0,0 +1,259 @@
+"""
+ALT (A*, Landmarks, Triangle inequality) 탐색
+전처리 시 랜드마크 K개를 골라 각 랜드마크에서 모든 셀까지의 최단 거리를 저장해 두고,
+질의 시 삼각 부등식 |d(L, n) - d(L, goal)| 의 최댓값을 휴리스틱으로 사용
+벽과 복도가 긴 지도에서 옥타일 휴리스틱보다 훨씬 정확해 막다른 영역을 덜 확장한다.
+"""
+import heapq
+import logging
+import time
+from pathlib import Path
+from typing import List, Tuple, Optional, Dict, Any
+
+import numpy as np
+from scipy.sparse.csgraph import dijkstra
+
+from app.core.pathfinding.grid import (
+    SearchGrid, SearchStats, get_workspace, build_movement_matrix, OCTILE_DIAGONAL_DELTA
+)
+from app.core.pathfinding.components import ComponentIndex
+
+logger = logging.getLogger(__name__)
+
+# 전처리 결과 디렉토리(storage/processed/<map_id>/) 아래 landmarks/<전처리 데이터 ID>/ 에 .npy로 저장
+# (재전처리가 중간에 실패해도 이전 그리드로 만든 테이블을 새 그리드에 쓰지 않도록 전처리 데이터 ID로 구분,
+#  거리 테이블은 np.load(mmap_mode='r')로 열어 서버 워커와 탐색 프로세스가 페이지 캐시 한 벌을 공유)
+LANDMARKS_DIRNAME = 'landmarks'
+LANDMARK_CELLS_FILENAME = 'landmarks.npy'
+LANDMARK_DISTANCES_FILENAME = 'distances.npy'
+
+# float32 거리 테이블의 반올림 오차로 휴리스틱이 실제 비용을 넘지 않도록 빼는 여유값 (셀 단위)
+_FLOAT32_SLACK = 1e-3
+
+
+def landmarks_directory(map_directory: Path, preprocessed_id: str) -> Path:
+    """전처리 데이터의 랜드마크 테이블 디렉토리"""
+    return Path(map_directory) / LANDMARKS_DIRNAME / preprocessed_id
+
+
+class LandmarkTable:
+    """
+    랜드마크별 최단 거리 테이블
+
+    distances[k, y, x] = 랜드마크 k에서 (x, y)까지의 최단 경로 비용 (float32, 도달 불가 시 inf)
+    이동 그래프가 무방향이므로 d(L, n) = d(n, L)
+    """
+
+    def __init__(self, landmarks: np.ndarray, distances: np.ndarray):
+        self.landmarks = landmarks
+        self.distances = distances
+        self.height, self.width = distances.shape[1:]
+
+    @classmethod
+    def build(cls, grid: np.ndarray, count: int = 8,
+              entrance_points: Optional[List[Dict[str, Any]]] = None) -> 'LandmarkTable':
+        """
+        랜드마크 선택 및 거리 테이블 생성 (전처리 단계)
+
+        가장 큰 연결 영역 안에서 지도 모서리/입구 지점을 후보로 먼저 고르고(최대 count의 절반),
+        나머지는 이미 고른 랜드마크들로부터 가장 먼 셀을 차례로 고른다 (farthest-first).
+
+        Args:
+            grid: 2D 그리드 (0: 장애물, 1: 통행 가능)
+            count: 랜드마크 수
+            entrance_points: 전처리 결과의 입구 지점 ({'position': [x, y]} 정규화 좌표)
+        """
+        started = time.time()
+        walkable = np.asarray(grid) == 1
+        height, width = walkable.shape
+        matrix = build_movement_matrix(walkable)
+
+        labels = ComponentIndex.build(walkable).labels
+        sizes = np.bincount(labels.ravel())
+        sizes[0] = 0
+        main = labels == sizes.argmax()
+        main_ys, main_xs = np.nonzero(main)
+        if main_xs.size == 0:
+            return cls(np.zeros((0, 2), dtype=np.int32), np.zeros((0, height, width), dtype=np.float32))
+
+        candidates = cls._candidate_cells(main_xs, main_ys, width, height, entrance_points)
+
+        landmarks: List[Tuple[int, int]] = []
+        distances: List[np.ndarray] = []
+        nearest = np.full((height, width), np.inf)
+
+        while len(landmarks) < min(count, main_xs.size):
+            if candidates and len(landmarks) < max(1, count // 2):
+                # 후보 중 기존 랜드마크에서 가장 먼 지점 (이미 랜드마크인 후보는 건너뜀)
+                x, y = max(candidates, key=lambda c: nearest[c[1], c[0]])
+                candidates.remove((x, y))
+                if nearest[y, x] == 0:
+                    continue
+            else:
+                score = np.where(main, nearest, -1.0)
+                y, x = np.unravel_index(np.argmax(score), score.shape)
+                if nearest[y, x] == 0:
+                    break
+
+            table = dijkstra(matrix, indices=int(y) * width + int(x)).reshape(height, width)
+            landmarks.append((int(x), int(y)))
+            distances.append(table.astype(np.float32))
+            nearest = np.minimum(nearest, table)
+
+        logger.info(f"ALT 랜드마크 {len(landmarks)}개 생성: {time.time() - started:.2f}초")
+        return cls(np.array(landmarks, dtype=np.int32), np.stack(distances))
+
+    @staticmethod
+    def _candidate_cells(xs: np.ndarray, ys: np.ndarray, width: int, height: int,
+                         entrance_points: Optional[List[Dict[str, Any]]]) -> List[Tuple[int, int]]:
+        """지도 모서리와 입구 지점에서 가장 가까운 (가장 큰 연결 영역의) 셀"""
+        targets = [(0, 0), (width - 1, 0), (0, height - 1), (width - 1, height - 1)]
+        for entrance in entrance_points or []:
+            position = entrance.get('position') if isinstance(entrance, dict) else entrance
+            if position:
+                targets.append((position[0] * (width - 1), position[1] * (height - 1)))
+
+        candidates = []
+        for tx, ty in targets:
+            i = int(np.argmin((xs - tx) ** 2 + (ys - ty) ** 2))
+            cell = (int(xs[i]), int(ys[i]))
+            if cell not in candidates:
+                candidates.append(cell)
+        return candidates
+
+    @classmethod
+    def load(cls, directory: Path, grid: np.ndarray) -> Optional['LandmarkTable']:
+        """저장된 테이블을 메모리 맵으로 열기. 파일이 없거나 그리드 크기가 다르면 None"""
+        directory = Path(directory)
+        if not (directory / LANDMARK_DISTANCES_FILENAME).exists():
+            return None
+        table = cls(np.load(directory / LANDMARK_CELLS_FILENAME),
+                    np.load(directory / LANDMARK_DISTANCES_FILENAME, mmap_mode='r'))
+        if (table.height, table.width) != grid.shape:
+            logger.warning(f"ALT 랜드마크 테이블과 그리드 크기가 다릅니다: {directory}")
+            return None
+        return table
+
+    def save(self, directory: Path):
+        """랜드마크 좌표와 거리 테이블 저장 (load는 거리 테이블 파일이 있을 때만 열므로 마지막에 저장)"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / LANDMARK_CELLS_FILENAME, self.landmarks)
+        np.save(directory / LANDMARK_DISTANCES_FILENAME, self.distances)
+
+    def matches(self, search_grid: SearchGrid) -> bool:
+        """탐색 그리드와 같은 크기/이동 규칙으로 만들어진 테이블인지 확인"""
+        return (len(self.landmarks) > 0 and search_grid.diagonal_movement and
+                (search_grid.height, search_grid.width) == (self.height, self.width))
+
+    def heuristic_terms(self, search_grid: SearchGrid, start: int, goal: int,
+                        active: int = 4) -> List[Tuple[memoryview, float]]:
+        """
+        질의에 사용할 랜드마크 선택 (랜드마크 수에만 비례하는 작업)
+
+        시작 셀에서 하한이 가장 큰 랜드마크 active개만 사용한다.
+        각 셀의 하한은 탐색 중 이웃을 넣을 때 계산한다 (질의마다 지도 전체를 계산하지 않음).
+
+        Returns:
+            [(랜드마크 거리 테이블의 1차원 뷰, 목표까지의 거리), ...]
+        """
+        gx, gy = search_grid.coords(goal)
+        sx, sy = search_grid.coords(start)
+        goal_d = self.distances[:, gy, gx].astype(np.float64)
+        start_d = self.distances[:, sy, sx].astype(np.float64)
+
+        # 목표와 같은 연결 영역에 있는 랜드마크만 사용 가능
+        usable = np.flatnonzero(np.isfinite(goal_d) & np.isfinite(start_d))
+        chosen = usable[np.argsort(-np.abs(start_d[usable] - goal_d[usable]))[:active]]
+        return [(memoryview(np.ascontiguousarray(self.distances[k]).reshape(-1)), float(goal_d[k]))
+                for k in chosen]
+
+
+class LandmarkAStar:
+    """
+    ALT 탐색 엔진
+    휴리스틱만 랜드마크 테이블로 바뀐 A* - 휴리스틱이 허용적(admissible)이므로 최적 경로를 반환
+    """
+
+    def __init__(self, search_grid: SearchGrid, table: LandmarkTable):
+        self.grid = search_grid
+        self.table = table
+
+    def search(self, start: int, goal: int) -> Tuple[Optional[List[int]], SearchStats]:
+        started = time.perf_counter()
+        stats = SearchStats(algorithm='alt')
+
+        search_grid = self.grid
+        terms = self.table.heuristic_terms(search_grid, start, goal)
+        heuristic_elapsed = time.perf_counter() - started
+        stride = search_grid.stride
+        width = search_grid.width
+        goal_y, goal_x = divmod(goal, stride)
+        infinity = float('inf')
+
+        def heuristic(cell: int) -> float:
+            """옥타일 거리와 랜드마크 하한 |d(L, n) - d(L, goal)| 의 최댓값"""
+            y, x = divmod(cell, stride)
+            dx = abs(x - goal_x)
+            dy = abs(y - goal_y)
+            h = dx + dy + OCTILE_DIAGONAL_DELTA * (dx if dx < dy else dy)
+            index = (y - 1) * width + (x - 1)
+            for distances, goal_distance in terms:
+                bound = abs(distances[index] - goal_distance) - _FLOAT32_SLACK
+                if h < bound < infinity:
+                    h = bound
+            return h
+
+        workspace = get_workspace(search_grid.size)
+        g_costs = workspace.g_view
+        parents = workspace.parent_view
+        closed = workspace.closed_view
+        walkable = search_grid.walkable_view
+        neighbors = search_grid.neighbors
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        g_costs[start] = 0.0
+        start_h = heuristic(start)
+        open_set = [(start_h, start_h, 0, start)]
+        counter = 1
+        expansions = 0
+        path = None
+
+        while open_set:
+            _, _, _, current = heappop(open_set)
+
+            if closed[current]:
+                continue
+
+            if current == goal:
+                path = workspace.reconstruct(goal)
+                break
+
+            closed[current] = 1
+            expansions += 1
+            current_g = g_costs[current]
+
+            for offset, move_cost, side_a, side_b in neighbors:
+                neighbor = current + offset
+                if not walkable[neighbor] or closed[neighbor]:
+                    continue
+
+                # 대각선 이동 시 벽 모서리 통과 방지
+                if side_a and not (walkable[current + side_a] and walkable[current + side_b]):
+                    continue
+
+                tentative_g = current_g + move_cost
+                if tentative_g < g_costs[neighbor]:
+                    g_costs[neighbor] = tentative_g
+                    parents[neighbor] = current
+                    h = heuristic(neighbor)
+                    heappush(open_set, (tentative_g + h, h, counter, neighbor))
+                    counter += 1
+
+        stats.expansions = expansions
+        stats.extra = {'landmarks': len(terms), 'heuristic_elapsed': heuristic_elapsed}
+        stats.elapsed = time.perf_counter() - started
+        if path is not None:
+            stats.path_cost = g_costs[goal]
+        return path, stats
@@ -0,0 +1,182 @@
+"""
+대체 경로 (plateau 방식)
+출발지에서의 최단 경로 트리와 목적지까지의 최단 경로 트리를 한 번씩만 만들고,
+두 트리에 함께 속한 간선이 이어진 구간(plateau)마다 하나의 경로를 얻는다.
+  출발지 -(순방향 트리)-> plateau 시작 -> plateau -> plateau 끝 -(역방향 트리)-> 목적지
+plateau가 길수록 최단 경로와 다른 '자연스러운' 경로이므로 길이 순으로 고르고,
+최적 경로 대비 길이 비율(stretch)과 이미 고른 경로와의 겹침 비율로 걸러낸다.
+"""
+import logging
+import math
+import time
+from typing import List, Tuple, Optional, Dict, Any
+
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix
+from scipy.sparse.csgraph import dijkstra, connected_components
+
+from app.core.pathfinding.grid import build_movement_matrix
+
+logger = logging.getLogger(__name__)
+
+# 최적 경로보다 최대 25% 긴 경로까지 허용
+DEFAULT_MAX_STRETCH = 0.25
+
+# 이미 고른 경로들과 겹치는 길이가 70%를 넘으면 제외
+DEFAULT_MAX_OVERLAP = 0.7
+
+# plateau가 최적 경로 길이의 5%보다 짧으면 제외 (동률 경로의 미세한 차이 등)
+DEFAULT_MIN_PLATEAU = 0.05
+
+# 경로를 복원해 검사할 후보 수 (찾는 경로 수의 배수)
+_CANDIDATES_PER_ROUTE = 20
+
+
+class AlternativeRouteFinder:
+    """
+    plateau 방식 대체 경로 엔진
+
+    이동 그래프는 무방향이라 목적지에서 시작한 Dijkstra의 선행 노드가 곧 목적지 쪽 다음 셀이다.
+    순방향 간선 u -> v가 두 트리에 모두 속하려면 v의 순방향 선행 노드가 u이고
+    u의 역방향 선행 노드가 v이면 된다. 이런 간선들의 연결 영역 하나가 plateau 하나이며,
+    plateau 위 모든 셀의 ds + dt(경유 경로 길이)는 같다.
+    """
+
+    def __init__(self, grid: np.ndarray, graph: Optional[csr_matrix] = None):
+        walkable = np.asarray(grid) == 1
+        self.height, self.width = walkable.shape
+        self.graph = graph if graph is not None else build_movement_matrix(walkable)
+
+    def find(self, start: Tuple[int, int], goal: Tuple[int, int], max_alternatives: int = 3,
+             max_stretch: float = DEFAULT_MAX_STRETCH, max_overlap: float = DEFAULT_MAX_OVERLAP,
+             min_plateau: float = DEFAULT_MIN_PLATEAU
+             ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        최적 경로와 대체 경로 탐색
+
+        Args:
+            start, goal: 그리드 좌표 (x, y) (보행 가능한 셀이어야 함)
+            max_alternatives: 최대 대체 경로 수 (최적 경로 제외)
+            max_stretch: 최적 경로 대비 허용하는 추가 길이 비율
+            max_overlap: 이미 고른 경로들과 겹쳐도 되는 길이 비율
+            min_plateau: 최적 경로 길이 대비 최소 plateau 길이 비율
+
+        Returns:
+            (경로 리스트 - 첫 번째가 최적 경로이며 각 항목은 cells/cost/stretch/overlap/plateau_length,
+             탐색 통계) - 도달 불가면 빈 리스트
+        """
+        started = time.perf_counter()
+        width = self.width
+        source = start[1] * width + start[0]
+        target = goal[1] * width + goal[0]
+
+        ds, ps = dijkstra(self.graph, indices=source, return_predecessors=True)
+        dt, pt = dijkstra(self.graph, indices=target, return_predecessors=True)
+        stats: Dict[str, Any] = {'searches': 2, 'candidates': 0}
+
+        optimal = ds[target]
+        if not np.isfinite(optimal):
+            stats['elapsed'] = time.perf_counter() - started
+            return [], stats
+
+        optimal_cells = self._route(ps, pt, source, target, source)
+        routes = [{
+            'cells': optimal_cells,
+            'cost': float(optimal),
+            'stretch': 0.0,
+            'overlap': 0.0,
+            'plateau_length': float(optimal)
+        }]
+        selected = np.zeros(ds.shape[0], dtype=bool)
+        selected[optimal_cells] = True
+
+        plateaus = self._plateaus(
+            ds, dt, ps, pt, optimal, selected.copy(), max_stretch, min_plateau, max_alternatives
+        )
+        for head, length in plateaus:
+            if len(routes) > max_alternatives:
+                break
+            stats['candidates'] += 1
+            cells = self._route(ps, pt, source, target, head)
+            # 순방향/역방향 부분이 같은 셀을 되짚는 경로(되돌아오는 우회)는 제외
+            if len(np.unique(cells)) != len(cells):
+                continue
+
+            steps = self._step_costs(cells)
+            cost = float(steps.sum())
+            shared = float(steps[selected[cells[:-1]] & selected[cells[1:]]].sum())
+            if shared / cost > max_overlap:
+                continue
+
+            routes.append({
+                'cells': cells,
+                'cost': cost,
+                'stretch': max(cost / float(optimal) - 1, 0.0),
+                'overlap': shared / cost,
+                'plateau_length': length
+            })
+            selected[cells] = True
+
+        for route in routes:
+            cells = route['cells']
+            route['cells'] = list(zip((cells % width).tolist(), (cells // width).tolist()))
+
+        stats['elapsed'] = time.perf_counter() - started
+        return routes, stats
+
+    def _plateaus(self, ds: np.ndarray, dt: np.ndarray, ps: np.ndarray, pt: np.ndarray,
+                  optimal: float, on_optimal: np.ndarray, max_stretch: float, min_plateau: float,
+                  max_alternatives: int) -> List[Tuple[int, float]]:
+        """
+        최적 경로가 아닌 plateau들의 (시작 셀, 길이) - 길이가 긴 순서
+        경유 경로 길이가 stretch 한도를 넘거나 plateau가 너무 짧으면 제외
+        """
+        tails = np.flatnonzero(ps >= 0)
+        heads = ps[tails]
+        on_both = pt[heads] == tails
+        heads, tails = heads[on_both], tails[on_both]
+
+        # 최적 경로 위의 간선(최적 경로 자신의 plateau)은 제외
+        via_cost = ds[tails] + dt[tails]
+        keep = (via_cost <= optimal * (1 + max_stretch)) & ~(on_optimal[heads] & on_optimal[tails])
+        heads, tails = heads[keep], tails[keep]
+        if heads.size == 0:
+            return []
+
+        size = ds.shape[0]
+        edges = coo_matrix((np.ones(heads.size, dtype=np.int8), (heads, tails)), shape=(size, size))
+        _, labels = connected_components(edges, directed=False)
+        edge_labels = labels[heads]
+
+        # plateau 길이 = 간선 비용 합, plateau 시작 = 출발지에서 가장 가까운 셀
+        lengths = np.bincount(edge_labels, weights=ds[tails] - ds[heads])
+        order = np.lexsort((ds[heads], edge_labels))
+        first = order[np.r_[True, edge_labels[order][1:] != edge_labels[order][:-1]]]
+
+        plateau_lengths = lengths[edge_labels[first]]
+        long_enough = plateau_lengths >= optimal * min_plateau
+        first, plateau_lengths = first[long_enough], plateau_lengths[long_enough]
+
+        ranked = np.argsort(-plateau_lengths, kind='stable')[:max_alternatives * _CANDIDATES_PER_ROUTE]
+        return list(zip(heads[first[ranked]].tolist(), plateau_lengths[ranked].tolist()))
+
+    def _route(self, ps: np.ndarray, pt: np.ndarray, source: int, target: int, via: int) -> np.ndarray:
+        """출발지 -> via는 순방향 트리, via -> 목적지는 역방향 트리를 따라간 셀 인덱스 배열"""
+        forward = []
+        node = via
+        while node != source:
+            forward.append(node)
+            node = ps[node]
+        forward.append(source)
+        forward.reverse()
+
+        node = via
+        while node != target:
+            node = pt[node]
+            forward.append(node)
+        return np.array(forward, dtype=np.int64)
+
+    def _step_costs(self, cells: np.ndarray) -> np.ndarray:
+        """연속한 두 셀 사이 이동 비용 (직선 1, 대각선 √2)"""
+        diagonal = (np.diff(cells % self.width) != 0) & (np.diff(cells // self.width) != 0)
+        return np.where(diagonal, math.sqrt(2), 1.0)
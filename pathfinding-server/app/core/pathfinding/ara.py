@@ -0,0 +1,210 @@
+"""
+ARA* (Anytime Repairing A*) 길찾기 엔진
+부풀린 휴리스틱으로 준최적 경로를 빠르게 찾은 뒤, 시간 예산 안에서 경로와 준최적 한계를 점차 개선
+"""
+import heapq
+import math
+import time
+from typing import List, Tuple, Optional
+
+from app.core.pathfinding.grid import SearchGrid, SearchStats, get_workspace, OCTILE_DIAGONAL_DELTA
+
+# 셀 상태 (workspace.closed 배열을 상태 배열로 사용)
+_UNSEEN = 0
+_OPEN = 1
+_CLOSED = 2
+_INCONS = 3  # 이번 반복에서 이미 확장되었지만 이후 g 비용이 감소한 셀
+
+# 시간 예산 확인 주기 (확장 노드 수)
+_BUDGET_CHECK_INTERVAL = 256
+
+
+class AnytimeRepairingAStar:
+    """
+    ARA* 엔진
+
+    휴리스틱 가중치 epsilon으로 f = g + epsilon * h 를 사용해 탐색하고,
+    반복마다 epsilon을 줄이면서 이전 반복의 탐색 결과(g 비용)를 재사용한다.
+    각 반복 후 달성한 준최적 한계 = min(epsilon, g(goal) / min(OPEN ∪ INCONS의 g + h)).
+    시간 예산이 소진되면 마지막으로 찾은 경로와 그 한계를 반환한다.
+    """
+
+    def __init__(self, search_grid: SearchGrid, initial_epsilon: float = 3.0,
+                 epsilon_step: float = 0.5):
+        """
+        Args:
+            search_grid: 탐색 그리드
+            initial_epsilon: 첫 반복의 휴리스틱 가중치
+            epsilon_step: 반복마다 줄이는 가중치
+        """
+        self.grid = search_grid
+        self.initial_epsilon = max(1.0, initial_epsilon)
+        self.epsilon_step = epsilon_step
+
+    def search(self, start: int, goal: int, time_budget_ms: Optional[float] = None,
+               search_until_first_solution: bool = False) -> Tuple[Optional[List[int]], SearchStats]:
+        """
+        ARA* 탐색
+
+        Args:
+            start: 시작 셀 인덱스
+            goal: 목표 셀 인덱스
+            time_budget_ms: 시간 예산 (밀리초, None이면 최적 경로까지 탐색)
+            search_until_first_solution: True이면 첫 경로를 찾을 때까지는 예산을 적용하지 않음
+                False이면 첫 경로를 찾기 전에 예산이 소진될 때 경로 없이 종료 (stats.extra['timed_out'])
+
+        Returns:
+            (셀 인덱스 경로 또는 None, 탐색 통계)
+        """
+        started = time.perf_counter()
+        deadline = started + time_budget_ms / 1000 if time_budget_ms is not None else math.inf
+        stats = SearchStats(algorithm='ara')
+
+        search_grid = self.grid
+        workspace = get_workspace(search_grid.size)
+        g_costs = workspace.g_view
+        parents = workspace.parent_view
+        state = workspace.closed_view
+        walkable = search_grid.walkable_view
+        neighbors = search_grid.neighbors
+        stride = search_grid.stride
+        octile = search_grid.diagonal_movement
+        diagonal_delta = OCTILE_DIAGONAL_DELTA
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        goal_y, goal_x = divmod(goal, stride)
+
+        def heuristic(idx: int) -> float:
+            y, x = divmod(idx, stride)
+            dx = abs(x - goal_x)
+            dy = abs(y - goal_y)
+            if octile:
+                return dx + dy + diagonal_delta * min(dx, dy)
+            return dx + dy
+
+        epsilon = self.initial_epsilon
+        g_costs[start] = 0.0
+        state[start] = _OPEN
+        start_h = heuristic(start)
+        open_set = [(epsilon * start_h, start_h, 0, start)]
+        incons: List[int] = []
+        counter = 1
+
+        best_path = None
+        best_cost = math.inf
+        bound = math.inf
+        expansions = 0
+        iterations = 0
+        timed_out = False
+
+        while True:
+            # ===== ImprovePath: f(goal) 이하의 OPEN 셀을 모두 확장 =====
+            expanded: List[int] = []
+            while open_set:
+                f, h, _, current = open_set[0]
+                if state[current] != _OPEN:
+                    heappop(open_set)
+                    continue
+                if g_costs[goal] <= f:
+                    break
+
+                # 확장 전에 예산 확인 (중단 시 OPEN이 하한 계산에 그대로 쓰이도록)
+                if (expansions % _BUDGET_CHECK_INTERVAL == 0 and time.perf_counter() > deadline and
+                        (best_path is not None or not search_until_first_solution)):
+                    timed_out = True
+                    break
+
+                heappop(open_set)
+                state[current] = _CLOSED
+                expanded.append(current)
+                expansions += 1
+
+                current_g = g_costs[current]
+                for offset, move_cost, side_a, side_b in neighbors:
+                    neighbor = current + offset
+                    if not walkable[neighbor]:
+                        continue
+
+                    # 대각선 이동 시 벽 모서리 통과 방지
+                    if side_a and not (walkable[current + side_a] and walkable[current + side_b]):
+                        continue
+
+                    tentative_g = current_g + move_cost
+                    if tentative_g < g_costs[neighbor]:
+                        g_costs[neighbor] = tentative_g
+                        parents[neighbor] = current
+
+                        neighbor_state = state[neighbor]
+                        if neighbor_state == _CLOSED:
+                            state[neighbor] = _INCONS
+                            incons.append(neighbor)
+                        elif neighbor_state != _INCONS:
+                            state[neighbor] = _OPEN
+                            nh = heuristic(neighbor)
+                            heappush(open_set, (tentative_g + epsilon * nh, nh, counter, neighbor))
+                            counter += 1
+
+            iterations += 1
+
+            # 현재 반복에서 찾은 경로와 준최적 한계 계산
+            if g_costs[goal] < math.inf:
+                path = workspace.reconstruct(goal)
+                cost = search_grid.path_cost(path)
+                if cost < best_cost:
+                    best_path, best_cost = path, cost
+
+                lower_bound = self._lower_bound(open_set, incons, state, g_costs, heuristic)
+                iteration_bound = cost / lower_bound if lower_bound > 0 else 1.0
+                if not timed_out:
+                    iteration_bound = min(epsilon, iteration_bound)
+                bound = min(bound, max(1.0, iteration_bound))
+
+            if timed_out or bound <= 1.0 or epsilon <= 1.0:
+                break
+            if time.perf_counter() > deadline:
+                timed_out = True
+                break
+            if g_costs[goal] == math.inf and not open_set:
+                # 도달 불가능
+                break
+
+            # ===== 다음 반복 준비: epsilon 감소, INCONS를 OPEN으로 옮기고 CLOSED 초기화 =====
+            epsilon = max(1.0, epsilon - self.epsilon_step)
+            members = {idx for _, _, _, idx in open_set if state[idx] == _OPEN}
+            members.update(incons)
+            for idx in expanded:
+                if state[idx] == _CLOSED:
+                    state[idx] = _UNSEEN
+            incons = []
+
+            open_set = []
+            for idx in members:
+                state[idx] = _OPEN
+                h = heuristic(idx)
+                open_set.append((g_costs[idx] + epsilon * h, h, counter, idx))
+                counter += 1
+            heapq.heapify(open_set)
+
+        stats.expansions = expansions
+        stats.elapsed = time.perf_counter() - started
+        stats.extra = {
+            'epsilon': epsilon,
+            'suboptimality_bound': bound if best_path is not None else None,
+            'iterations': iterations,
+            'timed_out': timed_out,
+            'time_budget_ms': time_budget_ms,
+        }
+        if best_path is not None:
+            stats.path_cost = best_cost
+        return best_path, stats
+
+    @staticmethod
+    def _lower_bound(open_set, incons, state, g_costs, heuristic) -> float:
+        """최적 경로 비용의 하한: OPEN ∪ INCONS 셀의 min(g + h)"""
+        lower_bound = math.inf
+        for _, h, _, idx in open_set:
+            if state[idx] == _OPEN:
+                lower_bound = min(lower_bound, g_costs[idx] + h)
+        for idx in incons:
+            lower_bound = min(lower_bound, g_costs[idx] + heuristic(idx))
+        return lower_bound
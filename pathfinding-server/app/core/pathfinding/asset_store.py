@@ -0,0 +1,228 @@
+"""
+지도 배열 저장소 (메모리 맵 .npy)
+전처리 결과 그리드와 보조 인덱스(연결 영역 라벨, 최근접 보행 가능 셀 테이블, 벽 간격 비용)를
+storage/processed/<map_id>/assets/<버전>/ 아래 .npy 파일로 저장하고 np.load(mmap_mode='r')로 연다.
+여러 서버 워커가 같은 파일을 매핑하므로 OS 페이지 캐시의 한 벌만 공유하고,
+새로 뜬 워커도 DB의 그리드 JSON을 디코딩하지 않고 바로 길찾기를 처리할 수 있다.
+접근성 프로필별 침식 그리드와 그 연결 영역/최근접 셀 테이블은 profiles/<프로필>/ 아래에 함께 저장하고
+해당 프로필을 처음 요청할 때 연다.
+"""
+import json
+import logging
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict
+
+import numpy as np
+
+from app.core.pathfinding.components import ComponentIndex, COMPONENTS_FILENAME
+from app.core.pathfinding.clearance import ClearanceField, CLEARANCE_FILENAME
+from app.core.pathfinding.snapping import SnapIndex
+from app.core.pathfinding.profiles import ROUTING_PROFILES, erode_grid
+
+logger = logging.getLogger(__name__)
+
+# 전처리 결과 디렉토리(storage/processed/<map_id>/) 아래 버전별 디렉토리
+ASSETS_DIRNAME = 'assets'
+
+# 파일 구성/자료형이 바뀌면 올려서 이전 형식의 디렉토리를 무시하게 함
+ASSET_FORMAT_VERSION = 3
+
+MANIFEST_FILENAME = 'manifest.json'
+GRID_FILENAME = 'grid.npy'
+SNAP_X_FILENAME = 'snap_x.npy'
+SNAP_Y_FILENAME = 'snap_y.npy'
+PROFILES_DIRNAME = 'profiles'
+
+
+def remove_stale_versions(root: Path, current: str):
+    """
+    root 아래에서 현재 버전(current) 외의 파일/디렉토리 삭제
+    쓰는 중인 다른 워커의 임시 디렉토리(.tmp-)는 남긴다. root가 없으면 아무것도 하지 않음
+    """
+    root = Path(root)
+    if not root.is_dir():
+        return
+    for path in root.iterdir():
+        if path.name == current or path.name.startswith('.tmp-'):
+            continue
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+
+
+@dataclass
+class StoredMapAssets:
+    """저장소에서 연 지도 배열 (모두 읽기 전용 메모리 맵)"""
+    version: str
+    grid: np.ndarray  # uint8 (1: 보행 가능, 0: 장애물)
+    components: ComponentIndex
+    snap_index: SnapIndex
+    clearance: ClearanceField
+
+
+class MapAssetStore:
+    """
+    지도별 배열 저장소
+
+    버전 디렉토리 이름은 '형식 버전 + 전처리 데이터 ID'라서 재전처리하면 새 디렉토리가 생기고,
+    파일은 임시 디렉토리에 모두 쓴 뒤 이름 변경 한 번으로 공개하므로 다른 워커가 쓰다 만 파일을 읽지 않는다.
+    write()는 새 버전을 공개만 하고, 이전 버전 디렉토리는 새 전처리 데이터를 커밋한 뒤 prune()으로 삭제한다
+    (커밋 전에는 다른 워커가 아직 이전 버전으로 길찾기/지연 저장을 하므로. 이미 매핑한 워커는 매핑을 닫을 때까지 그대로 사용).
+    """
+
+    def __init__(self, storage_path: str = "./storage", profiles: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            profiles: 새로 저장할 때 만들 접근성 프로필 -> 최소 통로 폭 (그리드 셀)
+        """
+        self.storage_path = Path(storage_path)
+        self.profiles = dict(ROUTING_PROFILES if profiles is None else profiles)
+
+    @staticmethod
+    def version_key(preprocessed_id: str) -> str:
+        return f"v{ASSET_FORMAT_VERSION}-{preprocessed_id}"
+
+    def directory(self, map_id: str, preprocessed_id: str) -> Path:
+        return self.storage_path / "processed" / map_id / ASSETS_DIRNAME / self.version_key(preprocessed_id)
+
+    def load(self, map_id: str, preprocessed_id: str) -> Optional[StoredMapAssets]:
+        """저장된 배열을 메모리 맵으로 열기. 해당 버전이 없으면 None"""
+        directory = self.directory(map_id, preprocessed_id)
+        manifest_path = directory / MANIFEST_FILENAME
+        if not manifest_path.exists():
+            return None
+
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            grid = np.load(directory / GRID_FILENAME, mmap_mode='r')
+            labels = np.load(directory / COMPONENTS_FILENAME, mmap_mode='r')
+            nearest_x = np.load(directory / SNAP_X_FILENAME, mmap_mode='r')
+            nearest_y = np.load(directory / SNAP_Y_FILENAME, mmap_mode='r')
+            clearance = np.load(directory / CLEARANCE_FILENAME, mmap_mode='r')
+        except Exception as e:
+            logger.error(f"지도 배열 저장소 로드 실패: {directory}: {e}")
+            return None
+
+        if not (grid.shape == labels.shape == nearest_x.shape == nearest_y.shape == clearance.shape):
+            logger.warning(f"지도 배열 크기가 서로 다릅니다: {directory}")
+            return None
+
+        return StoredMapAssets(
+            version=directory.name,
+            grid=grid,
+            components=ComponentIndex(labels),
+            snap_index=SnapIndex(nearest_x, nearest_y, manifest['has_walkable']),
+            clearance=ClearanceField(clearance)
+        )
+
+    def load_profile(self, map_id: str, preprocessed_id: str, profile: str) -> Optional[StoredMapAssets]:
+        """
+        접근성 프로필의 침식 그리드와 보조 인덱스를 메모리 맵으로 열기
+        벽 간격 비용은 원본 그리드의 것을 공유한다. 저장소나 프로필이 없으면 None
+        """
+        directory = self.directory(map_id, preprocessed_id)
+        try:
+            with open(directory / MANIFEST_FILENAME, 'r') as f:
+                info = json.load(f).get('profiles', {}).get(profile)
+            if info is None:
+                return None
+            profile_directory = directory / PROFILES_DIRNAME / profile
+            grid = np.load(profile_directory / GRID_FILENAME, mmap_mode='r')
+            labels = np.load(profile_directory / COMPONENTS_FILENAME, mmap_mode='r')
+            nearest_x = np.load(profile_directory / SNAP_X_FILENAME, mmap_mode='r')
+            nearest_y = np.load(profile_directory / SNAP_Y_FILENAME, mmap_mode='r')
+            clearance = np.load(directory / CLEARANCE_FILENAME, mmap_mode='r')
+        except Exception as e:
+            logger.error(f"프로필 지도 배열 로드 실패: {directory} ({profile}): {e}")
+            return None
+
+        return StoredMapAssets(
+            version=directory.name,
+            grid=grid,
+            components=ComponentIndex(labels),
+            snap_index=SnapIndex(nearest_x, nearest_y, info['has_walkable']),
+            clearance=ClearanceField(clearance)
+        )
+
+    def available_profiles(self, map_id: str, preprocessed_id: str) -> Dict[str, int]:
+        """저장된 접근성 프로필 -> 최소 통로 폭"""
+        try:
+            with open(self.directory(map_id, preprocessed_id) / MANIFEST_FILENAME, 'r') as f:
+                profiles = json.load(f).get('profiles', {})
+        except (OSError, ValueError):
+            return {}
+        return {name: info['min_width'] for name, info in profiles.items()}
+
+    def write(self, map_id: str, preprocessed_id: str, grid: np.ndarray) -> StoredMapAssets:
+        """
+        그리드에서 보조 인덱스를 만들어 저장하고 메모리 맵으로 다시 열어 반환
+        같은 버전을 다른 워커가 먼저 저장했으면 그 파일을 사용
+        """
+        directory = self.directory(map_id, preprocessed_id)
+        root = directory.parent
+        root.mkdir(parents=True, exist_ok=True)
+
+        if not (directory / MANIFEST_FILENAME).exists():
+            grid = (np.asarray(grid) == 1).astype(np.uint8)
+            components = ComponentIndex.build(grid)
+            snap_index = SnapIndex.build(grid)
+            clearance = ClearanceField.build(grid)
+
+            staging = root / f".tmp-{uuid.uuid4().hex}"
+            staging.mkdir()
+            try:
+                np.save(staging / GRID_FILENAME, grid)
+                components.save(staging / COMPONENTS_FILENAME)
+                np.save(staging / SNAP_X_FILENAME, snap_index.nearest_x)
+                np.save(staging / SNAP_Y_FILENAME, snap_index.nearest_y)
+                np.save(staging / CLEARANCE_FILENAME, clearance.levels)
+                profiles = {
+                    name: {'min_width': min_width, 'has_walkable': self._write_profile(
+                        staging / PROFILES_DIRNAME / name, erode_grid(grid, min_width)
+                    )}
+                    for name, min_width in self.profiles.items()
+                }
+                with open(staging / MANIFEST_FILENAME, 'w') as f:
+                    json.dump({
+                        'format_version': ASSET_FORMAT_VERSION,
+                        'preprocessed_id': preprocessed_id,
+                        'shape': list(grid.shape),
+                        'has_walkable': snap_index.has_walkable,
+                        'profiles': profiles
+                    }, f)
+                os.rename(staging, directory)
+                logger.info(f"지도 배열 저장: {directory}")
+            except OSError:
+                # 다른 워커가 같은 버전을 먼저 공개함
+                if not (directory / MANIFEST_FILENAME).exists():
+                    raise
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+
+        stored = self.load(map_id, preprocessed_id)
+        if stored is None:
+            raise ValueError(f"지도 배열 저장소를 열 수 없습니다: {directory}")
+        return stored
+
+    def prune(self, map_id: str, preprocessed_id: str):
+        """현재 전처리 데이터 외의 버전 디렉토리 삭제 (새 전처리 데이터를 커밋한 뒤 호출)"""
+        directory = self.directory(map_id, preprocessed_id)
+        remove_stale_versions(directory.parent, directory.name)
+
+    @staticmethod
+    def _write_profile(directory: Path, grid: np.ndarray) -> bool:
+        """침식 그리드와 그 보조 인덱스 저장. 보행 가능한 셀이 남았는지 반환"""
+        directory.mkdir(parents=True)
+        components = ComponentIndex.build(grid)
+        snap_index = SnapIndex.build(grid)
+        np.save(directory / GRID_FILENAME, grid)
+        components.save(directory / COMPONENTS_FILENAME)
+        np.save(directory / SNAP_X_FILENAME, snap_index.nearest_x)
+        np.save(directory / SNAP_Y_FILENAME, snap_index.nearest_y)
+        return snap_index.has_walkable
@@ -4,13 +4,31 @@ A* (A-Star) 길찾기 알고리즘 구현
 """
 import heapq
 import math
-from typing import List, Tuple, Dict, Optional, Set
+import time
+from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
 import numpy as np
+from scipy.sparse import csr_matrix
 import logging
 
+from app.core.pathfinding.grid import SearchGrid, SearchStats, get_workspace, OCTILE_DIAGONAL_DELTA
+from app.core.pathfinding.jps import JumpPointSearch
+from app.core.pathfinding.ara import AnytimeRepairingAStar
+from app.core.pathfinding.theta import LazyThetaStar
+from app.core.pathfinding.hpa import HierarchicalPathfinder
+from app.core.pathfinding.alt import LandmarkAStar
+from app.core.pathfinding.alternatives import AlternativeRouteFinder
+from app.core.pathfinding.components import ComponentIndex
+from app.core.pathfinding.snapping import SnapIndex
+from app.core.pathfinding.weighted import WeightedAStar, CostField
+
 logger = logging.getLogger(__name__)
 
+# options.algorithm 으로 선택 가능한 탐색 엔진
+SEARCH_ALGORITHMS = ('astar', 'jps', 'bidirectional', 'ara', 'lazy_theta', 'hpa', 'alt', 'flow_field')
+# 꺾임 지점만으로 이루어진 any-angle 경로를 반환하는 엔진 (스무딩/웨이포인트 감소 생략)
+ANY_ANGLE_ALGORITHMS = ('lazy_theta',)
+
 
 @dataclass
 class Point:
@@ -35,23 +53,6 @@ class Point:
         return cls(t[0], t[1])
 
 
-@dataclass
-class Node:
-    """A* 알고리즘용 노드"""
-    point: Point
-    g_cost: float  # 시작점에서 현재 노드까지의 실제 비용
-    h_cost: float  # 현재 노드에서 목표점까지의 휴리스틱 비용
-    parent: Optional['Node'] = None
-
-    @property
-    def f_cost(self) -> float:
-        """F = G + H (전체 비용)"""
-        return self.g_cost + self.h_cost
-
-    def __lt__(self, other):
-        return self.f_cost < other.f_cost
-
-
 class AStarPathfinder:
     """
     A* 알고리즘을 사용한 길찾기 클래스
@@ -65,35 +66,12 @@ class AStarPathfinder:
         """
         self.diagonal_movement = diagonal_movement
         self.smooth_path = smooth_path
-        self.directions = self._get_directions()
-
-    def _get_directions(self) -> List[Tuple[int, int, float]]:
-        """
-        이동 가능한 방향 정의
-        Returns: (dx, dy, cost) 튜플 리스트
-        """
-        # 상하좌우 (비용: 1.0)
-        directions = [
-            (0, -1, 1.0),   # 위
-            (0, 1, 1.0),    # 아래
-            (-1, 0, 1.0),   # 왼쪽
-            (1, 0, 1.0),    # 오른쪽
-        ]
-
-        # 대각선 이동 (비용: 약 1.414)
-        if self.diagonal_movement:
-            diagonal_cost = math.sqrt(2)
-            directions.extend([
-                (-1, -1, diagonal_cost),  # 왼쪽 위
-                (1, -1, diagonal_cost),   # 오른쪽 위
-                (-1, 1, diagonal_cost),   # 왼쪽 아래
-                (1, 1, diagonal_cost),    # 오른쪽 아래
-            ])
-
-        return directions
 
     def find_path(self, grid: np.ndarray, start: Tuple[float, float],
-                  end: Tuple[float, float]) -> Optional[List[Tuple[float, float]]]:
+                  end: Tuple[float, float], algorithm: str = 'astar',
+                  components: Optional[ComponentIndex] = None,
+                  snap_index: Optional[SnapIndex] = None,
+                  **engine_options) -> Optional[List[Tuple[float, float]]]:
         """
         A* 알고리즘으로 최단 경로 찾기
 
@@ -101,10 +79,120 @@ class AStarPathfinder:
             grid: 2D 그리드 (0: 장애물, 1: 통행 가능)
             start: 시작 좌표 (정규화된 0-1 범위)
             end: 종료 좌표 (정규화된 0-1 범위)
+            algorithm: 탐색 엔진 ('astar', 'jps', 'bidirectional', 'ara', 'lazy_theta', 'hpa', 'alt')
+            components: 연결 영역 인덱스 (있으면 다른 영역 사이 요청을 탐색 없이 거부)
+            snap_index: 최근접 보행 가능 지점 인덱스 (있으면 장애물 위 좌표 보정을 배열 조회로 처리)
+            **engine_options: 엔진별 옵션
+                ARA*: time_budget_ms, search_until_first_solution
+                HPA*: hierarchy (전처리 시 생성한 HierarchicalGraph)
+                ALT: landmarks (전처리 시 생성한 LandmarkTable)
+                공통: overlay (회피/선호 영역 CostOverlay - 통행 금지 영역을 지운 그리드로 탐색),
+                      cost_field (셀별 비용 배율 CostField - 있으면 가중치 A*로 탐색)
 
         Returns:
             경로 좌표 리스트 (정규화된 좌표) 또는 None
         """
+        path, _ = self.search(grid, start, end, algorithm, components, snap_index, **engine_options)
+        return path
+
+    def search(self, grid: np.ndarray, start: Tuple[float, float],
+               end: Tuple[float, float],
+               algorithm: str = 'astar',
+               components: Optional[ComponentIndex] = None,
+               snap_index: Optional[SnapIndex] = None,
+               **engine_options) -> Tuple[Optional[List[Tuple[float, float]]], Optional[SearchStats]]:
+        """
+        경로 탐색 후 경로와 탐색 통계를 함께 반환
+
+        연결 영역 인덱스가 주어지면 장애물 위 좌표를 보정할 때 상대 지점과 같은 영역을 우선하고,
+        보정 후에도 두 지점이 다른 영역에 있으면 탐색하지 않고
+        stats.extra['unreachable'] = True 와 함께 None을 반환한다.
+
+        Returns:
+            (정규화된 경로 또는 None, 탐색 통계 또는 None)
+        """
+        if algorithm not in SEARCH_ALGORITHMS:
+            raise ValueError(f"지원하지 않는 알고리즘입니다: {algorithm} (지원: {', '.join(SEARCH_ALGORITHMS)})")
+
+        # 통행 금지 영역이 있으면 그 셀을 지운 그리드로 탐색
+        # (원본 그리드 기준 연결 영역/최근접 지점 인덱스는 금지 영역 안을 가리킬 수 있어 사용하지 않음)
+        overlay = engine_options.get('overlay')
+        if overlay is not None and overlay.has_blocked:
+            grid = overlay.grid
+            components = snap_index = None
+
+        endpoints, stats = self._resolve_endpoints(grid, start, end, algorithm, components, snap_index)
+        if endpoints is None:
+            return None, stats
+        start_point, end_point = endpoints
+
+        # 탐색 엔진 실행 (평탄화된 셀 인덱스 공간에서 탐색)
+        search_grid = SearchGrid(grid, diagonal_movement=self.diagonal_movement)
+        cell_path, stats = self._run_engine(
+            algorithm,
+            search_grid,
+            search_grid.index(start_point.x, start_point.y),
+            search_grid.index(end_point.x, end_point.y),
+            **engine_options
+        )
+
+        if cell_path is None:
+            logger.warning(f"경로를 찾을 수 없습니다: {start_point} -> {end_point}")
+            return None, stats
+
+        path = [Point(*search_grid.coords(idx)) for idx in cell_path]
+        return self._normalize_path(grid, path, algorithm, engine_options.get('cost_field')), stats
+
+    def search_alternatives(self, grid: np.ndarray, start: Tuple[float, float],
+                            end: Tuple[float, float],
+                            max_alternatives: int = 3,
+                            components: Optional[ComponentIndex] = None,
+                            snap_index: Optional[SnapIndex] = None,
+                            graph: Optional[csr_matrix] = None,
+                            **finder_options) -> Tuple[List[Dict[str, Any]], Optional[SearchStats]]:
+        """
+        최적 경로와 서로 다른 대체 경로들 탐색 (plateau 방식, 전체 탐색 2회)
+        항상 8방향 이동 그래프를 사용하며 인스턴스 상태를 바꾸지 않는다.
+
+        Args:
+            graph: 지도별로 캐시한 이동 그래프 (없으면 생성)
+            finder_options: max_stretch, max_overlap, min_plateau (AlternativeRouteFinder.find)
+
+        Returns:
+            (경로 리스트 - 첫 번째가 최적 경로이며 각 항목은 정규화된 path와 cost/stretch/overlap/plateau_length,
+             탐색 통계) - 경로가 없으면 빈 리스트
+        """
+        endpoints, stats = self._resolve_endpoints(grid, start, end, 'plateau', components, snap_index)
+        if endpoints is None:
+            return [], stats
+        start_point, end_point = endpoints
+
+        routes, finder_stats = AlternativeRouteFinder(grid, graph).find(
+            start_point.to_tuple(), end_point.to_tuple(), max_alternatives, **finder_options
+        )
+        stats = SearchStats(
+            algorithm='plateau',
+            elapsed=finder_stats['elapsed'],
+            path_cost=routes[0]['cost'] if routes else None,
+            extra={'searches': finder_stats['searches'], 'candidates': finder_stats['candidates']}
+        )
+        if not routes:
+            logger.warning(f"경로를 찾을 수 없습니다: {start_point} -> {end_point}")
+
+        for route in routes:
+            route['path'] = self._normalize_path(grid, [Point(x, y) for x, y in route.pop('cells')], 'plateau')
+        return routes, stats
+
+    def _resolve_endpoints(self, grid: np.ndarray, start: Tuple[float, float], end: Tuple[float, float],
+                           algorithm: str, components: Optional[ComponentIndex],
+                           snap_index: Optional[SnapIndex]
+                           ) -> Tuple[Optional[Tuple[Point, Point]], Optional[SearchStats]]:
+        """
+        정규화된 출발/도착 좌표를 보행 가능한 그리드 좌표로 변환
+
+        Returns:
+            ((출발점, 도착점) 또는 None, 실패 시 탐색 통계 (연결 영역이 다르면 unreachable))
+        """
         # 정규화된 좌표를 그리드 좌표로 변환
         height, width = grid.shape
         start_point = Point(
@@ -116,128 +204,294 @@ class AStarPathfinder:
             int(end[1] * height)
         )
 
-        # 시작점과 끝점이 유효한지 확인 및 자동 보정
+        # 시작점과 끝점이 유효한지 확인 및 자동 보정 (상대 지점과 같은 연결 영역 우선)
         if not self._is_valid_point(grid, start_point):
             logger.warning(f"시작점이 장애물 위에 있습니다: {start_point}, 가장 가까운 보행 가능 지점을 찾습니다")
-            start_point = self._find_nearest_walkable_point(grid, start_point)
+            start_point = self._snap_point(grid, start_point, end_point, components, snap_index)
             if start_point is None:
                 logger.error(f"시작점 근처에 보행 가능한 영역을 찾을 수 없습니다")
-                return None
+                return None, None
             logger.info(f"시작점 보정: {start_point}")
 
         if not self._is_valid_point(grid, end_point):
             logger.warning(f"종료점이 장애물 위에 있습니다: {end_point}, 가장 가까운 보행 가능 지점을 찾습니다")
-            end_point = self._find_nearest_walkable_point(grid, end_point)
+            end_point = self._snap_point(grid, end_point, start_point, components, snap_index)
             if end_point is None:
                 logger.error(f"종료점 근처에 보행 가능한 영역을 찾을 수 없습니다")
-                return None
+                return None, None
             logger.info(f"종료점 보정: {end_point}")
 
-        # A* 알고리즘 실행
-        path = self._astar_search(grid, start_point, end_point)
+        # 서로 다른 연결 영역이면 탐색해도 경로가 없음 - 즉시 반환
+        if components is not None and not components.connected(start_point.to_tuple(), end_point.to_tuple()):
+            logger.warning(f"출발지와 목적지가 서로 다른 연결 영역에 있습니다: {start_point} -> {end_point}")
+            return None, SearchStats(algorithm=algorithm, extra={'unreachable': True})
 
-        if path is None:
-            logger.warning(f"경로를 찾을 수 없습니다: {start_point} -> {end_point}")
-            return None
+        return (start_point, end_point), None
+
+    def _normalize_path(self, grid: np.ndarray, path: List[Point], algorithm: str,
+                        cost_field: Optional[CostField] = None) -> List[Tuple[float, float]]:
+        """셀 경로를 (필요하면 스무딩한 뒤) 정규화된 좌표로 변환"""
+        height, width = grid.shape
 
-        # 경로 스무딩 적용
-        if self.smooth_path and len(path) > 2:
-            path = self._smooth_path(grid, path)
+        # 경로 스무딩 적용 (any-angle 경로는 이미 가시선이 확보된 꺾임 지점만 포함)
+        if self.smooth_path and algorithm not in ANY_ANGLE_ALGORITHMS and len(path) > 2:
+            path = self._smooth_path(grid, path, cost_field)
 
         # 그리드 좌표를 정규화된 좌표로 변환
-        normalized_path = [
+        return [
             (p.x / width, p.y / height) for p in path
         ]
 
-        return normalized_path
-
-    def _astar_search(self, grid: np.ndarray, start: Point, end: Point) -> Optional[List[Point]]:
+    def _run_engine(self, algorithm: str, search_grid: SearchGrid, start: int, goal: int,
+                    **engine_options) -> Tuple[Optional[List[int]], SearchStats]:
+        """선택된 탐색 엔진으로 셀 인덱스 경로 탐색"""
+        cost_field = engine_options.get('cost_field')
+        if cost_field is not None and cost_field.matches(search_grid):
+            path, stats = WeightedAStar(search_grid, cost_field).search(start, goal)
+            if algorithm != 'astar':
+                # 실제로 사용한 엔진은 stats.algorithm(weighted_astar), 요청한 엔진은 따로 기록
+                logger.info(f"셀 비용 배율이 있어 {algorithm} 대신 가중치 A*를 사용합니다")
+                stats.extra['requested_algorithm'] = algorithm
+            return path, stats
+
+        overlay = engine_options.get('overlay')
+        if overlay is not None and overlay.has_blocked and algorithm in ('hpa', 'flow_field'):
+            # 추상 그래프/흐름장은 통행 금지 영역을 모르는 원본 그리드로 만든 것
+            logger.info(f"통행 금지 영역이 있어 {algorithm} 대신 A*를 사용합니다")
+            algorithm = 'astar'
+
+        if algorithm == 'jps':
+            if search_grid.diagonal_movement:
+                return JumpPointSearch(search_grid).search(start, goal)
+            # JPS는 8방향 그리드 전용 - 상하좌우 이동만 허용되면 A*로 대체
+            logger.info("대각선 이동이 비활성화되어 JPS 대신 A*를 사용합니다")
+
+        if algorithm == 'bidirectional':
+            return self._bidirectional_search(search_grid, start, goal)
+
+        if algorithm == 'ara':
+            return AnytimeRepairingAStar(search_grid).search(
+                start, goal,
+                time_budget_ms=engine_options.get('time_budget_ms'),
+                search_until_first_solution=engine_options.get('search_until_first_solution', False)
+            )
+
+        if algorithm == 'lazy_theta':
+            return LazyThetaStar(search_grid).search(start, goal)
+
+        if algorithm == 'hpa':
+            hierarchy = engine_options.get('hierarchy')
+            if hierarchy is not None and hierarchy.matches(search_grid):
+                return HierarchicalPathfinder(hierarchy, search_grid).search(start, goal)
+            # 추상 그래프가 없는 지도 (전처리 이전 데이터 등)
+            logger.info("HPA* 추상 그래프가 없어 A*를 사용합니다")
+
+        if algorithm == 'alt':
+            landmarks = engine_options.get('landmarks')
+            if landmarks is not None and landmarks.matches(search_grid):
+                return LandmarkAStar(search_grid, landmarks).search(start, goal)
+            logger.info("ALT 랜드마크 테이블이 없어 A*를 사용합니다")
+
+        if algorithm == 'flow_field':
+            flow_field = engine_options.get('flow_field')
+            if flow_field is not None and flow_field.matches(search_grid, goal):
+                return flow_field.search(search_grid, start)
+            # 보정된 목적지가 POI 셀과 다른 경우 등
+            logger.info("목적지의 흐름장이 없어 A*를 사용합니다")
+
+        return self._astar_search(search_grid, start, goal)
+
+    def _astar_search(self, search_grid: SearchGrid, start: int,
+                      goal: int) -> Tuple[Optional[List[int]], SearchStats]:
         """
         A* 탐색 알고리즘 핵심 구현
+
+        셀 인덱스와 재사용 버퍼(g 비용, 부모, 닫힌 집합 배열) 위에서 동작하며,
+        열린 집합에는 (f, h, counter, idx) 튜플을 넣는다.
+        동일한 f에서는 h가 작은(목표에 가까운) 노드, 그다음 먼저 삽입된 노드를 우선하여
+        같은 입력에 대해 항상 같은 경로를 반환한다.
         """
+        started = time.perf_counter()
+        stats = SearchStats(algorithm='astar')
+
+        workspace = get_workspace(search_grid.size)
+        g_costs = workspace.g_view
+        parents = workspace.parent_view
+        closed = workspace.closed_view
+        walkable = search_grid.walkable_view
+        neighbors = search_grid.neighbors
+        stride = search_grid.stride
+        octile = search_grid.diagonal_movement
+        diagonal_delta = OCTILE_DIAGONAL_DELTA
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        goal_y, goal_x = divmod(goal, stride)
+        start_h = search_grid.heuristic(start, goal)
+        g_costs[start] = 0.0
+
         # 열린 집합 (탐색할 노드들) - 최소 힙 사용
-        open_set = []
-        # 닫힌 집합 (이미 탐색한 노드들)
-        closed_set: Set[Point] = set()
-        # 각 점에 대한 최소 비용 저장
-        g_costs: Dict[Point, float] = {}
-        # 부모 노드 저장 (경로 재구성용)
-        came_from: Dict[Point, Point] = {}
-
-        # 시작 노드 생성
-        start_node = Node(
-            point=start,
-            g_cost=0,
-            h_cost=self._calculate_heuristic(start, end)
-        )
-        heapq.heappush(open_set, start_node)
-        g_costs[start] = 0
+        open_set = [(start_h, start_h, 0, start)]
+        counter = 1
+        expansions = 0
+        path = None
 
         while open_set:
             # F 비용이 가장 낮은 노드 선택
-            current_node = heapq.heappop(open_set)
-            current = current_node.point
-
-            # 목표 도달 확인
-            if current == end:
-                return self._reconstruct_path(came_from, current)
+            _, _, _, current = heappop(open_set)
 
             # 이미 처리한 노드는 건너뛰기
-            if current in closed_set:
+            if closed[current]:
                 continue
 
-            closed_set.add(current)
+            # 목표 도달 확인
+            if current == goal:
+                path = workspace.reconstruct(goal)
+                break
+
+            closed[current] = 1
+            expansions += 1
+            current_g = g_costs[current]
 
             # 이웃 노드 탐색
-            for neighbor, move_cost in self._get_neighbors(grid, current):
-                if neighbor in closed_set:
+            for offset, move_cost, side_a, side_b in neighbors:
+                neighbor = current + offset
+                if not walkable[neighbor] or closed[neighbor]:
                     continue
 
-                # G 비용 계산
-                tentative_g_cost = g_costs[current] + move_cost
+                # 대각선 이동 시 벽 모서리 통과 방지
+                if side_a and not (walkable[current + side_a] and walkable[current + side_b]):
+                    continue
 
                 # 더 나은 경로를 찾았거나 처음 방문하는 경우
-                if neighbor not in g_costs or tentative_g_cost < g_costs[neighbor]:
-                    g_costs[neighbor] = tentative_g_cost
-                    came_from[neighbor] = current
-
-                    # 이웃 노드를 열린 집합에 추가
-                    neighbor_node = Node(
-                        point=neighbor,
-                        g_cost=tentative_g_cost,
-                        h_cost=self._calculate_heuristic(neighbor, end)
-                    )
-                    heapq.heappush(open_set, neighbor_node)
-
-        # 경로를 찾지 못함
-        return None
-
-    def _get_neighbors(self, grid: np.ndarray, point: Point) -> List[Tuple[Point, float]]:
+                tentative_g = current_g + move_cost
+                if tentative_g < g_costs[neighbor]:
+                    g_costs[neighbor] = tentative_g
+                    parents[neighbor] = current
+
+                    ny, nx = divmod(neighbor, stride)
+                    dx = nx - goal_x if nx > goal_x else goal_x - nx
+                    dy = ny - goal_y if ny > goal_y else goal_y - ny
+                    if octile:
+                        h = dx + dy + diagonal_delta * (dx if dx < dy else dy)
+                    else:
+                        h = dx + dy
+
+                    heappush(open_set, (tentative_g + h, h, counter, neighbor))
+                    counter += 1
+
+        stats.expansions = expansions
+        stats.elapsed = time.perf_counter() - started
+        if path is not None:
+            stats.path_cost = g_costs[goal]
+        return path, stats
+
+    def _bidirectional_search(self, search_grid: SearchGrid, start: int,
+                              goal: int) -> Tuple[Optional[List[int]], SearchStats]:
         """
-        현재 점에서 이동 가능한 이웃 노드들을 반환
+        양방향 A* 탐색
+
+        시작점과 (보정된) 종료점에서 동시에 탐색하며, 열린 집합이 더 작은 쪽을 먼저 확장한다.
+        한쪽에서 이웃을 갱신할 때 반대쪽에서 이미 도달한 셀이면 두 비용의 합으로 최적 경로 후보(best)를 갱신하고,
+        어느 한쪽 열린 집합의 최소 f 값이 best 이상이 되면 더 짧은 경로가 없으므로 종료한다.
         """
-        neighbors = []
-        height, width = grid.shape
+        started = time.perf_counter()
+        stats = SearchStats(algorithm='bidirectional')
+
+        if start == goal:
+            stats.path_cost = 0.0
+            stats.extra = {'forward_expansions': 0, 'backward_expansions': 0}
+            stats.elapsed = time.perf_counter() - started
+            return [start], stats
+
+        forward = get_workspace(search_grid.size, slot=0)
+        backward = get_workspace(search_grid.size, slot=1)
+        walkable = search_grid.walkable_view
+        neighbors = search_grid.neighbors
+        stride = search_grid.stride
+        octile = search_grid.diagonal_movement
+        diagonal_delta = OCTILE_DIAGONAL_DELTA
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        forward.g_view[start] = 0.0
+        backward.g_view[goal] = 0.0
+        start_h = search_grid.heuristic(start, goal)
+        open_forward = [(start_h, start_h, 0, start)]
+        open_backward = [(start_h, start_h, 0, goal)]
+
+        # 방향별 상태: (열린 집합, 자기 버퍼, 반대쪽 버퍼, 휴리스틱 목표 좌표)
+        directions = (
+            (open_forward, forward, backward, divmod(goal, stride)),
+            (open_backward, backward, forward, divmod(start, stride)),
+        )
+        expansions = [0, 0]
+        best = math.inf
+        meeting = -1
+        counter = 1
+
+        while open_forward and open_backward:
+            # 종료 조건: 남은 후보 중 best보다 짧은 경로가 없음
+            if open_forward[0][0] >= best or open_backward[0][0] >= best:
+                break
 
-        for dx, dy, cost in self.directions:
-            new_x = point.x + dx
-            new_y = point.y + dy
-            new_point = Point(new_x, new_y)
+            side = 0 if len(open_forward) <= len(open_backward) else 1
+            open_set, own, other, (target_y, target_x) = directions[side]
+            _, _, _, current = heappop(open_set)
 
-            # 유효성 검사
-            if not self._is_valid_point(grid, new_point):
+            closed = own.closed_view
+            if closed[current]:
                 continue
+            closed[current] = 1
+            expansions[side] += 1
 
-            # 대각선 이동 시 벽 모서리 통과 방지
-            if self.diagonal_movement and dx != 0 and dy != 0:
-                # 대각선 이동을 위해서는 인접한 두 칸도 통행 가능해야 함
-                if not (self._is_walkable(grid, Point(point.x + dx, point.y)) and
-                        self._is_walkable(grid, Point(point.x, point.y + dy))):
+            g_costs = own.g_view
+            parents = own.parent_view
+            other_g = other.g_view
+            current_g = g_costs[current]
+
+            for offset, move_cost, side_a, side_b in neighbors:
+                neighbor = current + offset
+                if not walkable[neighbor] or closed[neighbor]:
                     continue
 
-            neighbors.append((new_point, cost))
+                # 대각선 이동 시 벽 모서리 통과 방지
+                if side_a and not (walkable[current + side_a] and walkable[current + side_b]):
+                    continue
 
-        return neighbors
+                tentative_g = current_g + move_cost
+                if tentative_g < g_costs[neighbor]:
+                    g_costs[neighbor] = tentative_g
+                    parents[neighbor] = current
+
+                    # 반대쪽 탐색이 이미 도달한 셀이면 두 탐색이 만남
+                    total = tentative_g + other_g[neighbor]
+                    if total < best:
+                        best = total
+                        meeting = neighbor
+
+                    ny, nx = divmod(neighbor, stride)
+                    dx = nx - target_x if nx > target_x else target_x - nx
+                    dy = ny - target_y if ny > target_y else target_y - ny
+                    if octile:
+                        h = dx + dy + diagonal_delta * (dx if dx < dy else dy)
+                    else:
+                        h = dx + dy
+
+                    heappush(open_set, (tentative_g + h, h, counter, neighbor))
+                    counter += 1
+
+        path = None
+        if meeting >= 0:
+            # 시작점 -> 만난 셀 (정방향) + 만난 셀 -> 종료점 (역방향 부모를 따라감)
+            path = forward.reconstruct(meeting)
+            path.extend(reversed(backward.reconstruct(meeting)[:-1]))
+            stats.path_cost = best
+
+        stats.expansions = expansions[0] + expansions[1]
+        stats.extra = {'forward_expansions': expansions[0], 'backward_expansions': expansions[1]}
+        stats.elapsed = time.perf_counter() - started
+        return path, stats
 
     def _is_valid_point(self, grid: np.ndarray, point: Point) -> bool:
         """점이 그리드 내에 있고 통행 가능한지 확인"""
@@ -253,7 +507,33 @@ class AStarPathfinder:
             return grid[point.y, point.x] == 1
         return False
 
-    def _find_nearest_walkable_point(self, grid: np.ndarray, point: Point, max_search_radius: int = 50) -> Optional[Point]:
+    def _snap_point(self, grid: np.ndarray, point: Point, other: Point,
+                    components: Optional[ComponentIndex] = None,
+                    snap_index: Optional[SnapIndex] = None) -> Optional[Point]:
+        """
+        장애물 위 좌표를 가장 가까운 보행 가능 지점으로 보정
+
+        최근접 지점 인덱스가 있으면 배열 조회로 처리하고,
+        그 지점이 상대 지점(other)과 다른 연결 영역일 때만 영역을 고려하는 BFS로 다시 찾는다.
+        """
+        preferred_label = components.label_at(other.x, other.y) if components is not None else 0
+
+        if snap_index is not None:
+            snapped = snap_index.snap(point.x, point.y)
+            if snapped is None:
+                return None
+            if not preferred_label or components.label_at(*snapped) == preferred_label:
+                return Point(*snapped)
+
+        return self._find_nearest_walkable_point(
+            grid, point,
+            labels=components.labels if components is not None else None,
+            preferred_label=preferred_label
+        )
+
+    def _find_nearest_walkable_point(self, grid: np.ndarray, point: Point, max_search_radius: int = 50,
+                                     labels: Optional[np.ndarray] = None,
+                                     preferred_label: int = 0) -> Optional[Point]:
         """
         가장 가까운 보행 가능한 지점 찾기 (BFS 사용)
 
@@ -261,6 +541,9 @@ class AStarPathfinder:
             grid: 2D 그리드
             point: 시작 지점 (장애물 위에 있을 수 있음)
             max_search_radius: 최대 탐색 반경
+            labels: 연결 영역 라벨 배열 (ComponentIndex.labels)
+            preferred_label: 우선할 연결 영역 번호 (0이면 영역 무관)
+                반경 내에 해당 영역 셀이 없으면 가장 가까운 보행 가능 지점 반환
 
         Returns:
             가장 가까운 보행 가능 지점 또는 None
@@ -277,6 +560,7 @@ class AStarPathfinder:
         visited = set()
         queue = deque([(point, 0)])  # (point, distance)
         visited.add((point.x, point.y))
+        fallback = None
 
         # 8방향 탐색
         directions = [
@@ -310,42 +594,25 @@ class AStarPathfinder:
 
                 # 보행 가능한 지점 발견
                 if grid[new_y, new_x] == 1:
-                    logger.info(f"가장 가까운 보행 가능 지점 발견: {new_point} (거리: {distance + 1})")
-                    return new_point
+                    if labels is None or not preferred_label or labels[new_y, new_x] == preferred_label:
+                        logger.info(f"가장 가까운 보행 가능 지점 발견: {new_point} (거리: {distance + 1})")
+                        return new_point
+                    # 다른 연결 영역 - 우선 영역을 찾지 못할 때를 대비해 기억
+                    if fallback is None:
+                        fallback = new_point
 
                 # 큐에 추가
                 queue.append((new_point, distance + 1))
 
-        # 탐색 범위 내에서 보행 가능한 지점을 찾지 못함
-        return None
+        # 탐색 범위 내에서 (우선 영역의) 보행 가능한 지점을 찾지 못함
+        return fallback
 
-    def _calculate_heuristic(self, point1: Point, point2: Point) -> float:
-        """
-        휴리스틱 함수 (예상 비용)
-        여러 휴리스틱 중 선택 가능
-        """
-        # 유클리드 거리 (대각선 이동 허용 시)
-        if self.diagonal_movement:
-            return math.sqrt((point1.x - point2.x) ** 2 + (point1.y - point2.y) ** 2)
-
-        # 맨해튼 거리 (상하좌우만 이동 시)
-        return abs(point1.x - point2.x) + abs(point1.y - point2.y)
-
-    def _reconstruct_path(self, came_from: Dict[Point, Point], current: Point) -> List[Point]:
-        """
-        부모 노드 정보를 사용하여 경로 재구성
-        """
-        path = [current]
-        while current in came_from:
-            current = came_from[current]
-            path.append(current)
-        path.reverse()
-        return path
-
-    def _smooth_path(self, grid: np.ndarray, path: List[Point]) -> List[Point]:
+    def _smooth_path(self, grid: np.ndarray, path: List[Point],
+                     cost_field: Optional[CostField] = None) -> List[Point]:
         """
         경로 스무딩 - 불필요한 웨이포인트 제거
         직선으로 연결 가능한 점들을 직접 연결
+        셀 비용 배율이 있으면 양 끝점보다 비싼 셀(벽 근처, 회피 영역 등)을 지나는 직선은 쓰지 않음
         """
         if len(path) <= 2:
             return path
@@ -358,7 +625,7 @@ class AStarPathfinder:
             farthest_visible = current_idx + 1
 
             for i in range(current_idx + 2, len(path)):
-                if self._has_line_of_sight(grid, path[current_idx], path[i]):
+                if self._has_line_of_sight(grid, path[current_idx], path[i], cost_field):
                     farthest_visible = i
                 else:
                     break
@@ -368,12 +635,17 @@ class AStarPathfinder:
 
         return smoothed
 
-    def _has_line_of_sight(self, grid: np.ndarray, point1: Point, point2: Point) -> bool:
+    def _has_line_of_sight(self, grid: np.ndarray, point1: Point, point2: Point,
+                           cost_field: Optional[CostField] = None) -> bool:
         """
         두 점 사이에 장애물이 없는지 확인 (Bresenham's line algorithm)
+        cost_field가 있으면 두 끝점의 비용 배율보다 비싼 셀도 장애물로 취급
         """
         x1, y1 = point1.x, point1.y
         x2, y2 = point2.x, point2.y
+        cost_limit = None
+        if cost_field is not None:
+            cost_limit = max(cost_field.at(x1, y1), cost_field.at(x2, y2))
 
         dx = abs(x2 - x1)
         dy = abs(y2 - y1)
@@ -385,6 +657,8 @@ class AStarPathfinder:
             # 현재 위치가 통행 불가능하면 시야가 차단됨
             if not self._is_walkable(grid, Point(x1, y1)):
                 return False
+            if cost_limit is not None and cost_field.at(x1, y1) > cost_limit:
+                return False
 
             if x1 == x2 and y1 == y2:
                 break
@@ -0,0 +1,62 @@
+"""
+벽 간격(clearance) 비용 필드
+보행 가능 영역의 거리 변환(가장 가까운 장애물까지의 거리)으로 벽에 가까운 셀일수록 높은 비용을 매겨
+가중치 A*가 벽을 스치지 않고 복도 가운데로 지나가게 한다.
+전처리 시 한 번 만들어 uint8 배열로 지도 배열 저장소에 저장하고, 모든 요청이 메모리 맵으로 공유한다.
+"""
+import logging
+
+import numpy as np
+from scipy import ndimage
+
+from app.core.pathfinding.weighted import CostField
+
+logger = logging.getLogger(__name__)
+
+# 지도 배열 저장소(asset_store)의 버전 디렉토리에 grid.npy와 함께 저장
+CLEARANCE_FILENAME = 'clearance.npy'
+
+# 장애물에서 이 거리(셀) 이상 떨어진 셀은 추가 비용 없음
+DEFAULT_CLEARANCE_CELLS = 8
+
+# 벽에 붙은 셀의 비용 배율 = 1 + CLEARANCE_WEIGHT (거리에 따라 선형으로 줄어듦)
+CLEARANCE_WEIGHT = 1.0
+
+_MAX_LEVEL = np.iinfo(np.uint8).max
+
+
+class ClearanceField:
+    """
+    셀별 벽 근접 비용 (uint8, 0: 벽에서 충분히 떨어짐 ~ 255: 벽에 붙음, 장애물 셀도 255)
+    """
+
+    def __init__(self, levels: np.ndarray):
+        self.levels = levels
+        self.height, self.width = levels.shape
+
+    @classmethod
+    def build(cls, grid: np.ndarray, max_distance: int = DEFAULT_CLEARANCE_CELLS) -> 'ClearanceField':
+        """
+        그리드에서 벽 간격 비용 생성 (scipy.ndimage.distance_transform_edt)
+
+        지도 바깥도 벽으로 보고, 장애물에 바로 붙은 셀(거리 1)은 255,
+        max_distance 이상 떨어진 셀은 0이 되도록 거리에 반비례해 양자화한다.
+        """
+        walkable = np.asarray(grid) == 1
+        padded = np.pad(walkable, 1, constant_values=False)
+        distances = ndimage.distance_transform_edt(padded)[1:-1, 1:-1]
+
+        span = max(max_distance - 1, 1)
+        closeness = np.clip((max_distance - distances) / span, 0.0, 1.0)
+        levels = np.round(closeness * _MAX_LEVEL).astype(np.uint8)
+        levels[~walkable] = _MAX_LEVEL
+        logger.info(f"벽 간격 비용 필드 생성: {walkable.shape[1]}x{walkable.shape[0]}, 기준 거리 {max_distance}셀")
+        return cls(levels)
+
+    def multipliers(self, weight: float = CLEARANCE_WEIGHT) -> np.ndarray:
+        """셀별 이동 비용 배율 (1 ~ 1 + weight)"""
+        return 1.0 + self.levels.astype(np.float32) * np.float32(weight / _MAX_LEVEL)
+
+    def cost_field(self, weight: float = CLEARANCE_WEIGHT) -> CostField:
+        """가중치 A*용 비용 필드 (지도별로 한 번 만들어 재사용)"""
+        return CostField(self.multipliers(weight))
@@ -0,0 +1,65 @@
+"""
+연결 영역(connected component) 인덱스
+통행 가능한 셀을 서로 도달 가능한 영역별로 라벨링해 두고,
+출발지와 목적지가 다른 영역에 있으면 탐색 없이 즉시 도달 불가로 판정
+"""
+import logging
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy import ndimage
+
+logger = logging.getLogger(__name__)
+
+# 지도 배열 저장소(asset_store)의 버전 디렉토리에 grid.npy와 함께 저장
+COMPONENTS_FILENAME = 'components.npy'
+
+
+class ComponentIndex:
+    """
+    연결 영역 라벨 배열 (0: 장애물, 1~N: 영역 번호)
+
+    탐색 엔진은 대각선 이동 시 인접한 두 직선 칸이 모두 통행 가능해야 하므로
+    대각선으로 이어진 두 셀은 항상 상하좌우로도 이어져 있다.
+    따라서 4방향 연결성 라벨링이 실제 도달 가능성과 정확히 일치한다.
+    """
+
+    def __init__(self, labels: np.ndarray):
+        self.labels = labels
+        self.height, self.width = labels.shape
+        self.count = int(labels.max()) if labels.size else 0
+
+    @classmethod
+    def build(cls, grid: np.ndarray) -> 'ComponentIndex':
+        """그리드에서 연결 영역 라벨 생성 (ndimage.label, 4방향 연결)"""
+        labels, count = ndimage.label(np.asarray(grid) == 1)
+        dtype = np.uint16 if count < np.iinfo(np.uint16).max else np.int32
+        logger.info(f"연결 영역 인덱스 생성: {count}개 영역")
+        return cls(labels.astype(dtype))
+
+    @classmethod
+    def load(cls, path: Path, grid: np.ndarray) -> Optional['ComponentIndex']:
+        """저장된 라벨 배열 로드. 파일이 없거나 그리드 크기가 다르면 None"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        labels = np.load(path)
+        if labels.shape != grid.shape:
+            logger.warning(f"연결 영역 인덱스와 그리드 크기가 다릅니다: {path}")
+            return None
+        return cls(labels)
+
+    def save(self, path: Path):
+        np.save(Path(path), self.labels)
+
+    def label_at(self, x: int, y: int) -> int:
+        """그리드 좌표의 영역 번호 (범위 밖이거나 장애물이면 0)"""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return int(self.labels[y, x])
+        return 0
+
+    def connected(self, a: Tuple[int, int], b: Tuple[int, int]) -> bool:
+        """두 그리드 좌표 (x, y)가 같은 영역에 있는지 확인"""
+        label = self.label_at(*a)
+        return label != 0 and label == self.label_at(*b)
@@ -0,0 +1,166 @@
+"""
+경로 응답 압축 형식
+- polyline: 좌표를 정수로 양자화해 이전 점과의 차이만 5비트 단위 가변 길이 문자로 기록한 JSON
+  (Google encoded polyline 알고리즘, 좌표 순서는 (x, y))
+- msgpack: MessagePack 바이너리 (경로 좌표는 float32 바이트)
+- float32: 경로 좌표만 리틀 엔디언 float32 배열 바이트로 기록 (x0, y0, x1, y1, ...)
+좌표 변환은 점 단위 반복 없이 NumPy 배열 연산으로 처리한다.
+"""
+import json
+from typing import List, Sequence, Tuple, Optional, Dict, Any
+
+import numpy as np
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성 - 없으면 MessagePack 형식만 사용할 수 없음
+    msgpack = None
+
+# 정규화 좌표(0-1) 기준 소수점 5자리 - 10000px 지도에서 0.1px
+DEFAULT_POLYLINE_PRECISION = 5
+
+FLOAT32_DTYPE = np.dtype('<f4')
+
+# 응답 형식 -> 미디어 타입 (options.format 또는 Accept 헤더로 선택)
+ROUTE_FORMATS = {
+    'json': 'application/json',
+    'polyline': 'application/vnd.polyline+json',
+    'msgpack': 'application/x-msgpack',
+    'float32': 'application/octet-stream'
+}
+
+_MEDIA_TYPE_FORMATS = {
+    **{media_type: fmt for fmt, media_type in ROUTE_FORMATS.items()},
+    'application/msgpack': 'msgpack'
+}
+
+# 기본 형식(JSON)을 뜻하는 Accept 미디어 타입
+_DEFAULT_MEDIA_TYPES = ('*/*', 'application/*', 'application/json', 'application/x-ndjson')
+
+
+class FormatNotAcceptableError(ValueError):
+    """요청한 응답 형식을 만들 수 없음 (HTTP 406)"""
+    pass
+
+
+def negotiate_format(accept: Optional[str], requested: Optional[str] = None,
+                     allowed: Sequence[str] = tuple(ROUTE_FORMATS)) -> str:
+    """
+    응답 형식 결정
+
+    options.format(requested)이 있으면 그 형식을, 없으면 Accept 헤더에서 품질(q) 순으로
+    처음 나오는 지원 형식을 사용한다. 해당하는 형식이 없으면 JSON.
+    """
+    if requested:
+        if requested not in allowed:
+            raise FormatNotAcceptableError(
+                f"지원하지 않는 응답 형식입니다: {requested} (지원: {', '.join(allowed)})"
+            )
+        fmt = requested
+    else:
+        fmt = 'json'
+        ranges = []
+        for order, part in enumerate((accept or '').split(',')):
+            media_type, *params = [token.strip() for token in part.split(';')]
+            quality = 1.0
+            for param in params:
+                if param.startswith('q='):
+                    try:
+                        quality = float(param[2:])
+                    except ValueError:
+                        pass
+            if quality > 0:
+                ranges.append((-quality, order, media_type.lower()))
+
+        for _, _, media_type in sorted(ranges):
+            if _MEDIA_TYPE_FORMATS.get(media_type) in allowed:
+                fmt = _MEDIA_TYPE_FORMATS[media_type]
+                break
+            if media_type in _DEFAULT_MEDIA_TYPES:
+                break
+
+    if fmt == 'msgpack' and msgpack is None:
+        raise FormatNotAcceptableError("MessagePack 형식을 사용하려면 msgpack 패키지가 필요합니다")
+    return fmt
+
+
+def encode_route(route: Dict[str, Any], fmt: str,
+                 precision: int = DEFAULT_POLYLINE_PRECISION) -> bytes:
+    """
+    경로 정보 딕셔너리를 응답 형식의 바이트로 변환
+
+    압축 형식(polyline, msgpack)은 polyline에서 다시 만들 수 있는 svg_path를 빼고,
+    float32는 경로 좌표만 담는다. polyline이 없는 항목(실패, 요약 등)은 그대로 기록한다.
+    """
+    if fmt == 'float32':
+        return polyline_to_float32(route.get('polyline') or [])
+
+    if fmt != 'json' and 'polyline' in route:
+        route = {key: value for key, value in route.items() if key != 'svg_path'}
+        if fmt == 'polyline':
+            route.update(polyline=encode_polyline(route['polyline'], precision), polyline_precision=precision)
+        else:
+            route.update(polyline=polyline_to_float32(route['polyline']), polyline_dtype=FLOAT32_DTYPE.str)
+
+    if fmt == 'msgpack':
+        return msgpack.packb(route, use_bin_type=True, default=float)
+    return json.dumps(route, ensure_ascii=False, default=float).encode('utf-8')
+
+
+def encode_polyline(points: Sequence[Tuple[float, float]],
+                    precision: int = DEFAULT_POLYLINE_PRECISION) -> str:
+    """
+    좌표 리스트를 인코딩된 폴리라인 문자열로 변환
+
+    각 값은 10^precision 배 후 반올림한 정수의 이전 점 대비 차이를 zigzag 부호화하고,
+    하위 비트부터 5비트 조각마다 (다음 조각이 있으면 0x20을 더해) 63을 더한 ASCII 문자로 기록한다.
+    """
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if coords.size == 0:
+        return ''
+
+    # JavaScript Math.round와 같은 반올림 (0.5는 올림)
+    quantized = np.floor(coords.ravel() * 10 ** precision + 0.5).astype(np.int64)
+    deltas = quantized.copy()
+    deltas[2:] -= quantized[:-2]
+    values = (deltas << 1) ^ (deltas >> 63)
+
+    # 가장 큰 값의 조각 수만큼만 열을 만들어 값 x 조각 행렬로 한 번에 분해
+    width = max(1, -(-int(values.max()).bit_length() // 5))
+    shifted = values[:, None] >> (5 * np.arange(width, dtype=np.int64))[None, :]
+    chunks = shifted & 0x1F
+    present = shifted > 0
+    present[:, 0] = True
+    counts = present.sum(axis=1)
+
+    # 마지막 조각이 아니면 연속 비트(0x20) 설정
+    continued = np.arange(width)[None, :] < (counts - 1)[:, None]
+    chars = (chunks | (continued * 0x20)) + 63
+    return chars[present].astype(np.uint8).tobytes().decode('ascii')
+
+
+def decode_polyline(encoded: str, precision: int = DEFAULT_POLYLINE_PRECISION) -> np.ndarray:
+    """인코딩된 폴리라인 문자열을 (N x 2) 좌표 배열로 변환 (encode_polyline의 역변환)"""
+    data = np.frombuffer(encoded.encode('ascii'), dtype=np.uint8).astype(np.int64) - 63
+    if data.size == 0:
+        return np.zeros((0, 2), dtype=np.float64)
+
+    # 연속 비트가 없는 문자가 값의 마지막 조각
+    ends = np.flatnonzero((data & 0x20) == 0)
+    starts = np.r_[0, ends[:-1] + 1]
+    positions = np.arange(data.size) - np.repeat(starts, ends - starts + 1)
+    values = np.add.reduceat((data & 0x1F) << (5 * positions), starts)
+
+    deltas = (values >> 1) ^ -(values & 1)
+    return np.cumsum(deltas.reshape(-1, 2), axis=0) / 10 ** precision
+
+
+def polyline_to_float32(points: Sequence[Tuple[float, float]]) -> bytes:
+    """좌표 리스트를 리틀 엔디언 float32 배열 바이트로 변환"""
+    return np.asarray(points, dtype=FLOAT32_DTYPE).reshape(-1, 2).tobytes()
+
+
+def float32_to_polyline(data: bytes) -> List[Tuple[float, float]]:
+    """리틀 엔디언 float32 배열 바이트를 좌표 리스트로 변환"""
+    coords = np.frombuffer(data, dtype=FLOAT32_DTYPE).reshape(-1, 2)
+    return [tuple(point) for point in coords.tolist()]
@@ -0,0 +1,174 @@
+"""
+목적지 흐름장(flow field)
+자주 찾는 목적지(POI)마다 목적지에서 역방향 Dijkstra를 한 번 실행해
+모든 셀의 목적지까지 거리와 다음 이동 방향을 저장해 두고,
+경로는 출발 셀에서 방향을 따라가기만 해서 만든다 (지도 크기가 아니라 경로 길이에 비례).
+"""
+import logging
+import time
+from pathlib import Path
+from typing import List, Tuple, Optional, Dict, Any
+
+import numpy as np
+from scipy.sparse.csgraph import dijkstra
+
+from app.core.pathfinding.grid import SearchGrid, SearchStats, build_movement_matrix
+from app.core.pathfinding.snapping import SnapIndex
+
+logger = logging.getLogger(__name__)
+
+# 전처리 결과 디렉토리(storage/processed/<map_id>/) 아래 flow_fields/<전처리 데이터 ID>/<poi_id>.npz로 저장
+# (재전처리가 중간에 실패해도 이전 그리드로 만든 흐름장을 새 그리드에 쓰지 않도록 전처리 데이터 ID로 구분)
+FLOW_FIELDS_DIRNAME = 'flow_fields'
+
+# 방향 코드 -> (dx, dy). 목적지 셀과 도달 불가 셀은 NO_DIRECTION
+DIRECTIONS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+NO_DIRECTION = -1
+
+# (dy + 1) * 3 + (dx + 1) -> 방향 코드
+_DIRECTION_CODES = np.full(9, NO_DIRECTION, dtype=np.int8)
+for _code, (_dx, _dy) in enumerate(DIRECTIONS):
+    _DIRECTION_CODES[(_dy + 1) * 3 + (_dx + 1)] = _code
+
+
+def flow_fields_directory(map_directory: Path, preprocessed_id: str) -> Path:
+    """전처리 데이터의 POI 흐름장 디렉토리"""
+    return Path(map_directory) / FLOW_FIELDS_DIRNAME / preprocessed_id
+
+
+def goal_cell(grid: np.ndarray, position: Tuple[float, float],
+              snap_index: Optional[SnapIndex] = None) -> Optional[Tuple[int, int]]:
+    """
+    정규화 좌표를 목적지 셀 (x, y)로 변환 (길찾기와 같은 방식)
+    장애물 위면 가장 가까운 보행 가능 셀로 보정하고, 보정할 셀이 없으면 None
+    """
+    height, width = grid.shape
+    x = int(position[0] * width)
+    y = int(position[1] * height)
+    if 0 <= x < width and 0 <= y < height and grid[y, x] == 1:
+        return x, y
+    snap_index = snap_index or SnapIndex.build(grid)
+    return snap_index.snap(x, y)
+
+
+class FlowField:
+    """
+    한 목적지에 대한 흐름장
+
+    distances[y, x] = (x, y)에서 목적지까지의 최단 경로 비용 (float32, 도달 불가 시 inf)
+    directions[y, x] = 최단 경로의 다음 셀 방향 코드 (int8, DIRECTIONS 인덱스)
+    이동 그래프가 무방향이므로 목적지에서 시작한 Dijkstra의 선행 노드가 곧 목적지 쪽 다음 셀이다.
+    """
+
+    def __init__(self, goal: Tuple[int, int], distances: np.ndarray, directions: np.ndarray,
+                 poi_id: Optional[str] = None):
+        self.goal = (int(goal[0]), int(goal[1]))
+        self.distances = distances
+        self.directions = directions
+        self.height, self.width = distances.shape
+        self.poi_id = poi_id
+
+    @classmethod
+    def build(cls, grid: np.ndarray, goal: Tuple[int, int], poi_id: Optional[str] = None) -> 'FlowField':
+        """목적지 셀 (x, y)에서 역방향 Dijkstra로 흐름장 생성"""
+        walkable = np.asarray(grid) == 1
+        height, width = walkable.shape
+        gx, gy = goal
+
+        distances, predecessors = dijkstra(
+            build_movement_matrix(walkable), indices=gy * width + gx, return_predecessors=True
+        )
+
+        cells = np.flatnonzero(predecessors >= 0)
+        following = predecessors[cells]
+        dx = following % width - cells % width
+        dy = following // width - cells // width
+
+        directions = np.full(height * width, NO_DIRECTION, dtype=np.int8)
+        directions[cells] = _DIRECTION_CODES[(dy + 1) * 3 + (dx + 1)]
+
+        return cls(
+            goal,
+            distances.reshape(height, width).astype(np.float32),
+            directions.reshape(height, width),
+            poi_id
+        )
+
+    @classmethod
+    def load(cls, path: Path, grid: np.ndarray) -> Optional['FlowField']:
+        """저장된 흐름장 로드. 파일이 없거나 그리드 크기가 다르면 None"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            field = cls(tuple(data['goal']), data['distances'], data['directions'], path.stem)
+        if (field.height, field.width) != grid.shape:
+            logger.warning(f"흐름장과 그리드 크기가 다릅니다: {path}")
+            return None
+        return field
+
+    def save(self, path: Path):
+        np.savez(Path(path), goal=np.array(self.goal, dtype=np.int32),
+                 distances=self.distances, directions=self.directions)
+
+    def matches(self, search_grid: SearchGrid, goal: int) -> bool:
+        """탐색 그리드와 같은 크기/이동 규칙이고 목적지가 같은 흐름장인지 확인"""
+        return (search_grid.diagonal_movement and
+                (search_grid.height, search_grid.width) == (self.height, self.width) and
+                search_grid.index(*self.goal) == goal)
+
+    def search(self, search_grid: SearchGrid, start: int) -> Tuple[Optional[List[int]], SearchStats]:
+        """
+        출발 셀에서 방향을 따라 목적지까지 이동한 셀 인덱스 경로 (A* 엔진과 같은 반환 형식)
+        """
+        started = time.perf_counter()
+        stats = SearchStats(algorithm='flow_field', extra={'poi_id': self.poi_id})
+
+        x, y = search_grid.coords(start)
+        cost = float(self.distances[y, x])
+        if not np.isfinite(cost):
+            stats.elapsed = time.perf_counter() - started
+            return None, stats
+
+        width = self.width
+        stride = search_grid.stride
+        directions = self.directions.ravel()
+        steps = [dy * width + dx for dx, dy in DIRECTIONS]
+        padded_steps = [dy * stride + dx for dx, dy in DIRECTIONS]
+
+        cell = y * width + x
+        current = start
+        path = [current]
+        goal_cell_index = self.goal[1] * width + self.goal[0]
+        while cell != goal_cell_index:
+            code = directions[cell]
+            cell += steps[code]
+            current += padded_steps[code]
+            path.append(current)
+
+        stats.path_cost = cost
+        stats.elapsed = time.perf_counter() - started
+        return path, stats
+
+
+def build_poi_flow_fields(grid: np.ndarray, poi_points: List[Dict[str, Any]],
+                          directory: Path) -> int:
+    """
+    POI 목록의 흐름장을 모두 생성해 directory/<poi_id>.npz로 저장 (전처리 단계)
+
+    Returns:
+        생성한 흐름장 수
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    snap_index = SnapIndex.build(grid)
+
+    built = 0
+    for poi in poi_points or []:
+        goal = goal_cell(grid, poi['position'], snap_index)
+        if goal is None:
+            logger.warning(f"POI 주변에 보행 가능한 영역이 없어 흐름장을 만들지 않습니다: {poi['id']}")
+            continue
+        FlowField.build(grid, goal, poi['id']).save(directory / f"{poi['id']}.npz")
+        built += 1
+    return built
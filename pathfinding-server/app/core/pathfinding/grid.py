@@ -0,0 +1,261 @@
+"""
+탐색용 그리드 인프라
+2D 네비게이션 그리드를 평탄화된 정수 셀 인덱스 공간으로 변환하고,
+탐색 엔진들이 공유하는 이웃 오프셋, 휴리스틱, 재사용 버퍼를 제공
+"""
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional, Dict, Any
+import numpy as np
+from scipy.sparse import csr_matrix
+
+SQRT2 = math.sqrt(2)
+# 옥타일 거리 계산용 상수: (dx + dy) + (sqrt(2) - 2) * min(dx, dy)
+OCTILE_DIAGONAL_DELTA = SQRT2 - 2
+
+# 이동 그래프 생성용 이동 방향 (dx, dy, cost) - 역방향은 대칭으로 추가
+_MOVES = [(1, 0, 1.0), (0, 1, 1.0), (1, 1, SQRT2), (-1, 1, SQRT2)]
+
+
+@dataclass
+class SearchStats:
+    """탐색 통계 (엔진 비교 및 벤치마크용)"""
+    algorithm: str
+    expansions: int = 0
+    elapsed: float = 0.0  # 탐색 시간(초)
+    path_cost: Optional[float] = None  # 그리드 셀 단위 경로 비용
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def expansions_per_second(self) -> float:
+        return self.expansions / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'algorithm': self.algorithm,
+            'expansions': self.expansions,
+            'elapsed': self.elapsed,
+            'path_cost': self.path_cost,
+            **self.extra
+        }
+
+
+class SearchGrid:
+    """
+    평탄화된 탐색 그리드
+
+    그리드 주변을 1칸의 장애물로 둘러싸(padding) 이웃 탐색 시 범위 검사가 필요 없도록 하고,
+    셀을 (y + 1) * stride + (x + 1) 형태의 정수 인덱스로 표현한다.
+    """
+
+    def __init__(self, grid: np.ndarray, diagonal_movement: bool = True):
+        """
+        Args:
+            grid: 2D 그리드 (0: 장애물, 1: 통행 가능)
+            diagonal_movement: 대각선 이동 허용 여부
+        """
+        self.height, self.width = grid.shape
+        self.stride = self.width + 2
+        self.diagonal_movement = diagonal_movement
+
+        padded = np.zeros((self.height + 2, self.width + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = (grid == 1)
+        self.walkable = padded.ravel()
+        self.size = self.walkable.size
+        # memoryview 인덱싱은 NumPy 스칼라 인덱싱보다 훨씬 빠름 (탐색 루프용)
+        self.walkable_view = memoryview(self.walkable)
+
+        self.neighbors = self._build_neighbor_offsets()
+
+    def _build_neighbor_offsets(self) -> List[Tuple[int, float, int, int]]:
+        """
+        이웃 오프셋 사전 계산
+        Returns: (offset, cost, side_a, side_b) 튜플 리스트
+            대각선 이동 시 side_a, side_b 두 칸이 모두 통행 가능해야 함 (벽 모서리 통과 방지)
+            직선 이동은 side_a = side_b = 0
+        """
+        stride = self.stride
+        neighbors = [
+            (-stride, 1.0, 0, 0),  # 위
+            (stride, 1.0, 0, 0),   # 아래
+            (-1, 1.0, 0, 0),       # 왼쪽
+            (1, 1.0, 0, 0),        # 오른쪽
+        ]
+
+        if self.diagonal_movement:
+            for dx, dy in ((-1, -1), (1, -1), (-1, 1), (1, 1)):
+                neighbors.append((dy * stride + dx, SQRT2, dx, dy * stride))
+
+        return neighbors
+
+    def index(self, x: int, y: int) -> int:
+        """그리드 좌표 -> 셀 인덱스"""
+        return int((y + 1) * self.stride + (x + 1))
+
+    def coords(self, idx: int) -> Tuple[int, int]:
+        """셀 인덱스 -> 그리드 좌표 (x, y)"""
+        y, x = divmod(idx, self.stride)
+        return x - 1, y - 1
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """그리드 좌표가 범위 내이고 통행 가능한지 확인"""
+        return self.in_bounds(x, y) and self.walkable_view[self.index(x, y)] == 1
+
+    def heuristic(self, a: int, b: int) -> float:
+        """
+        두 셀 사이의 휴리스틱 비용
+        대각선 이동 시 옥타일 거리, 상하좌우만 이동 시 맨해튼 거리
+        """
+        ay, ax = divmod(a, self.stride)
+        by, bx = divmod(b, self.stride)
+        dx = abs(ax - bx)
+        dy = abs(ay - by)
+        if self.diagonal_movement:
+            return dx + dy + OCTILE_DIAGONAL_DELTA * min(dx, dy)
+        return dx + dy
+
+    def path_cost(self, path: List[int]) -> float:
+        """셀 인덱스 경로의 비용 (연속된 셀 사이의 유클리드 거리 합)"""
+        cost = 0.0
+        stride = self.stride
+        for a, b in zip(path, path[1:]):
+            ay, ax = divmod(a, stride)
+            by, bx = divmod(b, stride)
+            cost += math.hypot(ax - bx, ay - by)
+        return cost
+
+    def has_line_of_sight(self, a: int, b: int) -> bool:
+        """
+        두 셀 중심을 잇는 선분이 장애물을 지나지 않는지 확인 (supercover 선분 순회)
+
+        선분이 걸치는 모든 셀을 검사하고, 선분이 셀 모서리를 정확히 지나면
+        인접한 두 셀이 모두 통행 가능해야 한다 (그리드 이동과 같은 모서리 통과 방지 규칙).
+        """
+        stride = self.stride
+        walkable = self.walkable_view
+        y1, x1 = divmod(a, stride)
+        y2, x2 = divmod(b, stride)
+
+        dx = abs(x2 - x1)
+        dy = abs(y2 - y1)
+        step_x = 1 if x2 > x1 else -1
+        step_y = stride if y2 > y1 else -stride
+        error = dx - dy
+        dx *= 2
+        dy *= 2
+
+        current = a
+        while current != b:
+            if not walkable[current]:
+                return False
+
+            if error > 0:
+                current += step_x
+                error -= dy
+            elif error < 0:
+                current += step_y
+                error += dx
+            else:
+                # 셀 모서리를 정확히 통과
+                if not (walkable[current + step_x] and walkable[current + step_y]):
+                    return False
+                current += step_x + step_y
+                error += dx - dy
+
+        return walkable[current] == 1
+
+
+def build_movement_matrix(walkable: np.ndarray, diagonal_movement: bool = True) -> csr_matrix:
+    """
+    그리드의 이동 그래프 (scipy.sparse 희소 행렬, 셀 번호 = y * w + x)
+    scipy.sparse.csgraph의 다익스트라 등 전체 그리드/부분 그리드 일괄 계산용
+
+    대각선 이동은 인접한 두 직선 칸이 모두 통행 가능할 때만 허용 (벽 모서리 통과 방지)
+    """
+    walkable = np.asarray(walkable, dtype=bool)
+    h, w = walkable.shape
+    ids = np.arange(h * w).reshape(h, w)
+    rows, cols, costs = [], [], []
+
+    for dx, dy, cost in _MOVES:
+        if dx and dy and not diagonal_movement:
+            continue
+
+        # 원본 영역 [y0:y1, x0:x1] -> 대상 영역 (dx, dy) 만큼 이동
+        x0, x1 = max(0, -dx), w - max(0, dx)
+        y0, y1 = 0, h - dy
+        if x1 <= x0 or y1 <= y0:
+            continue
+
+        src = walkable[y0:y1, x0:x1]
+        dst = walkable[y0 + dy:y1 + dy, x0 + dx:x1 + dx]
+        mask = src & dst
+        if dx and dy:
+            mask = mask & walkable[y0:y1, x0 + dx:x1 + dx] & walkable[y0 + dy:y1 + dy, x0:x1]
+
+        a = ids[y0:y1, x0:x1][mask]
+        b = ids[y0 + dy:y1 + dy, x0 + dx:x1 + dx][mask]
+        rows.extend((a, b))
+        cols.extend((b, a))
+        costs.extend((np.full(a.size, cost), np.full(a.size, cost)))
+
+    if not rows:
+        return csr_matrix((h * w, h * w))
+    return csr_matrix((np.concatenate(costs), (np.concatenate(rows), np.concatenate(cols))),
+                      shape=(h * w, h * w))
+
+
+class SearchWorkspace:
+    """
+    탐색 버퍼 (g 비용, 부모, 닫힌 집합)
+    호출마다 새로 할당하지 않고 같은 크기의 그리드에서 재사용
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.g = np.empty(size, dtype=np.float64)
+        self.parent = np.empty(size, dtype=np.int64)
+        self.closed = np.empty(size, dtype=np.uint8)
+        self.g_view = memoryview(self.g)
+        self.parent_view = memoryview(self.parent)
+        self.closed_view = memoryview(self.closed)
+
+    def reset(self):
+        self.g.fill(np.inf)
+        self.parent.fill(-1)
+        self.closed.fill(0)
+
+    def reconstruct(self, goal: int) -> List[int]:
+        """부모 배열을 따라 경로 재구성"""
+        parent = self.parent_view
+        path = [goal]
+        current = parent[goal]
+        while current != -1:
+            path.append(current)
+            current = parent[current]
+        path.reverse()
+        return path
+
+
+_local = threading.local()
+
+
+def get_workspace(size: int, slot: int = 0) -> SearchWorkspace:
+    """
+    현재 스레드의 탐색 버퍼 반환 (초기화된 상태)
+    양방향 탐색처럼 버퍼가 여러 개 필요한 경우 slot으로 구분
+    """
+    workspaces = getattr(_local, 'workspaces', None)
+    if workspaces is None:
+        workspaces = _local.workspaces = {}
+
+    workspace = workspaces.get(slot)
+    if workspace is None or workspace.size != size:
+        workspace = workspaces[slot] = SearchWorkspace(size)
+
+    workspace.reset()
+    return workspace
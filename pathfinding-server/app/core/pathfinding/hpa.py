@@ -0,0 +1,358 @@
+"""
+HPA* (Hierarchical Pathfinding A*) 계층 탐색
+전처리 시 그리드를 클러스터로 나누고 클러스터 경계의 출입구(entrance) 노드와
+클러스터 내부 최단 거리로 추상 그래프를 만들어 두고,
+질의 시에는 추상 그래프를 탐색한 뒤 경로가 지나는 클러스터만 실제 그리드에서 세분화한다.
+"""
+import heapq
+import math
+import time
+import logging
+from typing import List, Tuple, Optional, Dict, Any
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from app.core.pathfinding.grid import SearchGrid, SearchStats, OCTILE_DIAGONAL_DELTA, build_movement_matrix
+
+logger = logging.getLogger(__name__)
+
+GRAPH_TYPE = 'hpa'
+GRAPH_VERSION = 1
+
+# 이 길이 이상인 출입구 구간은 양 끝에 노드 2개를 두고, 짧으면 가운데 1개
+_WIDE_ENTRANCE_LENGTH = 6
+
+
+class HierarchicalGraph:
+    """
+    HPA* 추상 그래프
+
+    노드는 클러스터 경계의 출입구 셀, 엣지는
+    - 인접 클러스터 사이 출입구 셀 쌍 (비용 1, 경계를 직선으로 건넘)
+    - 같은 클러스터 안 출입구 노드 사이의 클러스터 내부 최단 거리
+    로 구성된다. to_dict()/from_dict()로 PreprocessedMapData.graph_data(JSON)에 저장한다.
+    """
+
+    def __init__(self, grid: np.ndarray, cluster_size: int,
+                 nodes: List[Tuple[int, int]], edges: List[Tuple[int, int, float]]):
+        """
+        Args:
+            grid: 2D 그리드 (0: 장애물, 1: 통행 가능)
+            cluster_size: 클러스터 한 변의 셀 수
+            nodes: 추상 노드 그리드 좌표 (x, y) 리스트
+            edges: (노드 a, 노드 b, 비용) 무방향 엣지 리스트
+        """
+        self.walkable = np.asarray(grid) == 1
+        self.height, self.width = self.walkable.shape
+        self.cluster_size = cluster_size
+        self.clusters_x = math.ceil(self.width / cluster_size)
+        self.nodes = [tuple(node) for node in nodes]
+        self.edges = edges
+
+        self.adjacency: List[List[Tuple[int, float]]] = [[] for _ in self.nodes]
+        for a, b, cost in edges:
+            self.adjacency[a].append((b, cost))
+            self.adjacency[b].append((a, cost))
+
+        self.cluster_nodes: Dict[int, List[int]] = {}
+        for node_id, (x, y) in enumerate(self.nodes):
+            self.cluster_nodes.setdefault(self.cluster_of(x, y), []).append(node_id)
+
+        # 클러스터별 이동 그래프 (질의 시 필요한 클러스터만 생성해 재사용)
+        self._matrices: Dict[int, csr_matrix] = {}
+
+    @classmethod
+    def build(cls, grid: np.ndarray, cluster_size: int = 16) -> 'HierarchicalGraph':
+        """그리드에서 추상 그래프 생성 (전처리 단계)"""
+        started = time.time()
+        walkable = np.asarray(grid) == 1
+        height, width = walkable.shape
+        nodes: List[Tuple[int, int]] = []
+        node_ids: Dict[Tuple[int, int], int] = {}
+        edges: List[Tuple[int, int, float]] = []
+
+        def add_node(x: int, y: int) -> int:
+            x, y = int(x), int(y)
+            node_id = node_ids.get((x, y))
+            if node_id is None:
+                node_id = node_ids[(x, y)] = len(nodes)
+                nodes.append((x, y))
+            return node_id
+
+        def add_entrances(open_cells: np.ndarray, cells_a, cells_b):
+            """경계 양쪽이 모두 열린 연속 구간마다 출입구 노드 쌍 추가"""
+            runs = np.flatnonzero(np.diff(np.concatenate(([0], open_cells.astype(np.int8), [0]))))
+            for begin, end in zip(runs[::2], runs[1::2]):
+                if end - begin >= _WIDE_ENTRANCE_LENGTH:
+                    positions = (begin, end - 1)
+                else:
+                    positions = ((begin + end - 1) // 2,)
+                for i in positions:
+                    edges.append((add_node(*cells_a(i)), add_node(*cells_b(i)), 1.0))
+
+        # ===== 1. 클러스터 경계의 출입구 =====
+        for border in range(cluster_size, width, cluster_size):
+            # 세로 경계: x = border - 1 | border
+            for top in range(0, height, cluster_size):
+                bottom = min(top + cluster_size, height)
+                open_cells = walkable[top:bottom, border - 1] & walkable[top:bottom, border]
+                add_entrances(open_cells,
+                              lambda i, x=border - 1, t=top: (x, t + i),
+                              lambda i, x=border, t=top: (x, t + i))
+
+        for border in range(cluster_size, height, cluster_size):
+            # 가로 경계: y = border - 1 | border
+            for left in range(0, width, cluster_size):
+                right = min(left + cluster_size, width)
+                open_cells = walkable[border - 1, left:right] & walkable[border, left:right]
+                add_entrances(open_cells,
+                              lambda i, y=border - 1, l=left: (l + i, y),
+                              lambda i, y=border, l=left: (l + i, y))
+
+        graph = cls(walkable.astype(np.uint8), cluster_size, nodes, [])
+
+        # ===== 2. 클러스터 내부 출입구 사이 최단 거리 =====
+        for cluster, members in graph.cluster_nodes.items():
+            if len(members) < 2:
+                continue
+            local = [graph.local_index(cluster, *nodes[m]) for m in members]
+            distances = dijkstra(graph.cluster_matrix(cluster), indices=local)
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    cost = distances[i, local[j]]
+                    if np.isfinite(cost):
+                        edges.append((members[i], members[j], float(cost)))
+
+        graph = cls(walkable.astype(np.uint8), cluster_size, nodes, edges)
+        logger.info(f"HPA* 추상 그래프 생성: 노드 {len(nodes)}개, 엣지 {len(edges)}개, "
+                    f"클러스터 크기 {cluster_size}, {time.time() - started:.2f}초")
+        return graph
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 저장용 딕셔너리"""
+        return {
+            'type': GRAPH_TYPE,
+            'version': GRAPH_VERSION,
+            'width': self.width,
+            'height': self.height,
+            'cluster_size': self.cluster_size,
+            'nodes': [list(node) for node in self.nodes],
+            'edges': [[a, b, round(cost, 6)] for a, b, cost in self.edges]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], grid: np.ndarray) -> Optional['HierarchicalGraph']:
+        """저장된 그래프 복원. 형식이나 그리드 크기가 맞지 않으면 None"""
+        if not data or data.get('type') != GRAPH_TYPE or data.get('version') != GRAPH_VERSION:
+            return None
+        if (data['height'], data['width']) != tuple(grid.shape):
+            logger.warning("HPA* 그래프와 그리드 크기가 다릅니다 - 계층 탐색을 사용하지 않습니다")
+            return None
+        edges = [(int(a), int(b), float(cost)) for a, b, cost in data['edges']]
+        return cls(grid, int(data['cluster_size']), data['nodes'], edges)
+
+    # ===== 클러스터 좌표 계산 =====
+    def cluster_of(self, x: int, y: int) -> int:
+        return (y // self.cluster_size) * self.clusters_x + (x // self.cluster_size)
+
+    def cluster_origin(self, cluster: int) -> Tuple[int, int]:
+        cy, cx = divmod(cluster, self.clusters_x)
+        return cx * self.cluster_size, cy * self.cluster_size
+
+    def cluster_shape(self, cluster: int) -> Tuple[int, int]:
+        """클러스터 (높이, 너비) - 그리드 가장자리 클러스터는 더 작을 수 있음"""
+        x0, y0 = self.cluster_origin(cluster)
+        return min(self.cluster_size, self.height - y0), min(self.cluster_size, self.width - x0)
+
+    def local_index(self, cluster: int, x: int, y: int) -> int:
+        x0, y0 = self.cluster_origin(cluster)
+        return (y - y0) * self.cluster_shape(cluster)[1] + (x - x0)
+
+    def local_coords(self, cluster: int, local: int) -> Tuple[int, int]:
+        x0, y0 = self.cluster_origin(cluster)
+        ly, lx = divmod(local, self.cluster_shape(cluster)[1])
+        return x0 + lx, y0 + ly
+
+    def cluster_matrix(self, cluster: int) -> csr_matrix:
+        matrix = self._matrices.get(cluster)
+        if matrix is None:
+            x0, y0 = self.cluster_origin(cluster)
+            h, w = self.cluster_shape(cluster)
+            matrix = self._matrices[cluster] = build_movement_matrix(self.walkable[y0:y0 + h, x0:x0 + w])
+        return matrix
+
+    def matches(self, search_grid: SearchGrid) -> bool:
+        """탐색 그리드와 같은 크기/이동 규칙으로 만들어진 그래프인지 확인"""
+        return (search_grid.diagonal_movement and
+                (search_grid.height, search_grid.width) == (self.height, self.width))
+
+
+class HierarchicalPathfinder:
+    """
+    HPA* 질의
+
+    1. 시작/종료 셀을 각자 클러스터의 출입구 노드에 (클러스터 내부 거리로) 임시 연결
+    2. 추상 그래프에서 A* (옥타일 휴리스틱)
+    3. 추상 경로의 클러스터 내부 구간만 실제 셀 경로로 세분화
+    클러스터 경계에서만 방향을 바꿀 수 있으므로 최적 경로보다 약간 길 수 있다.
+    """
+
+    def __init__(self, graph: HierarchicalGraph, search_grid: SearchGrid):
+        self.graph = graph
+        self.grid = search_grid
+
+    def search(self, start: int, goal: int) -> Tuple[Optional[List[int]], SearchStats]:
+        """
+        Args:
+            start: 시작 셀 인덱스 (SearchGrid 기준)
+            goal: 목표 셀 인덱스
+
+        Returns:
+            (셀 인덱스 경로 또는 None, 탐색 통계)
+        """
+        started = time.perf_counter()
+        stats = SearchStats(algorithm='hpa')
+        graph = self.graph
+        search_grid = self.grid
+
+        start_xy = search_grid.coords(start)
+        goal_xy = search_grid.coords(goal)
+        start_id = len(graph.nodes)
+        goal_id = start_id + 1
+        coords = {start_id: start_xy, goal_id: goal_xy}
+
+        # 시작/종료 노드를 해당 클러스터의 출입구 노드에 연결
+        extra_edges: Dict[int, List[Tuple[int, float]]] = {start_id: [], goal_id: []}
+        goal_links: Dict[int, float] = {}
+        start_cluster = graph.cluster_of(*start_xy)
+        goal_cluster = graph.cluster_of(*goal_xy)
+
+        start_costs = self._cluster_costs(start_cluster, start_xy)
+        for node_id in graph.cluster_nodes.get(start_cluster, []):
+            cost = start_costs[graph.local_index(start_cluster, *graph.nodes[node_id])]
+            if np.isfinite(cost):
+                extra_edges[start_id].append((node_id, float(cost)))
+
+        goal_costs = self._cluster_costs(goal_cluster, goal_xy)
+        for node_id in graph.cluster_nodes.get(goal_cluster, []):
+            cost = goal_costs[graph.local_index(goal_cluster, *graph.nodes[node_id])]
+            if np.isfinite(cost):
+                goal_links[node_id] = float(cost)
+
+        if start_cluster == goal_cluster:
+            direct = start_costs[graph.local_index(start_cluster, *goal_xy)]
+            if np.isfinite(direct):
+                extra_edges[start_id].append((goal_id, float(direct)))
+
+        abstract_path, expansions = self._abstract_search(start_id, goal_id, coords, extra_edges, goal_links)
+        stats.expansions = expansions
+
+        path = None
+        refined = set()
+        if abstract_path is not None:
+            path = self._refine(abstract_path, coords, refined)
+            stats.path_cost = search_grid.path_cost(path)
+
+        stats.extra = {
+            'abstract_nodes': len(graph.nodes),
+            'abstract_path_length': len(abstract_path) if abstract_path else 0,
+            'refined_clusters': len(refined),
+        }
+        stats.elapsed = time.perf_counter() - started
+        return path, stats
+
+    def _cluster_costs(self, cluster: int, xy: Tuple[int, int]) -> np.ndarray:
+        """클러스터 안에서 xy로부터 각 셀까지의 최단 거리"""
+        graph = self.graph
+        return dijkstra(graph.cluster_matrix(cluster), indices=graph.local_index(cluster, *xy))
+
+    def _abstract_search(self, start_id: int, goal_id: int, coords: Dict[int, Tuple[int, int]],
+                         extra_edges: Dict[int, List[Tuple[int, float]]],
+                         goal_links: Dict[int, float]) -> Tuple[Optional[List[int]], int]:
+        """추상 그래프 A*. Returns: (추상 노드 경로 또는 None, 확장 노드 수)"""
+        graph = self.graph
+        nodes = graph.nodes
+        adjacency = graph.adjacency
+        goal_x, goal_y = coords[goal_id]
+
+        def position(node_id: int) -> Tuple[int, int]:
+            return coords[node_id] if node_id in coords else nodes[node_id]
+
+        def heuristic(node_id: int) -> float:
+            x, y = position(node_id)
+            dx = abs(x - goal_x)
+            dy = abs(y - goal_y)
+            return dx + dy + OCTILE_DIAGONAL_DELTA * min(dx, dy)
+
+        g_costs = {start_id: 0.0}
+        parents = {start_id: -1}
+        closed = set()
+        start_h = heuristic(start_id)
+        open_set = [(start_h, start_h, 0, start_id)]
+        counter = 1
+        expansions = 0
+
+        while open_set:
+            _, _, _, current = heapq.heappop(open_set)
+            if current in closed:
+                continue
+            if current == goal_id:
+                path = [current]
+                while parents[current] != -1:
+                    current = parents[current]
+                    path.append(current)
+                path.reverse()
+                return path, expansions
+
+            closed.add(current)
+            expansions += 1
+
+            edges = extra_edges[current] if current in extra_edges else adjacency[current]
+            if current in goal_links:
+                edges = edges + [(goal_id, goal_links[current])]
+
+            current_g = g_costs[current]
+            for neighbor, cost in edges:
+                if neighbor in closed:
+                    continue
+                tentative_g = current_g + cost
+                if tentative_g < g_costs.get(neighbor, math.inf):
+                    g_costs[neighbor] = tentative_g
+                    parents[neighbor] = current
+                    h = heuristic(neighbor)
+                    heapq.heappush(open_set, (tentative_g + h, h, counter, neighbor))
+                    counter += 1
+
+        return None, expansions
+
+    def _refine(self, abstract_path: List[int], coords: Dict[int, Tuple[int, int]],
+                refined: set) -> List[int]:
+        """추상 경로를 셀 인덱스 경로로 세분화 (같은 클러스터 구간만 클러스터 내부 탐색)"""
+        graph = self.graph
+        search_grid = self.grid
+        points = [coords[n] if n in coords else graph.nodes[n] for n in abstract_path]
+
+        path = [search_grid.index(*points[0])]
+        for (ax, ay), (bx, by) in zip(points, points[1:]):
+            if (ax, ay) == (bx, by):
+                continue
+            cluster = graph.cluster_of(ax, ay)
+            if cluster != graph.cluster_of(bx, by):
+                # 인접 클러스터 사이 출입구: 경계를 한 칸 건넘
+                path.append(search_grid.index(bx, by))
+                continue
+
+            refined.add(cluster)
+            source = graph.local_index(cluster, ax, ay)
+            _, predecessors = dijkstra(graph.cluster_matrix(cluster), indices=source,
+                                       return_predecessors=True)
+            segment = []
+            local = graph.local_index(cluster, bx, by)
+            while local != source:
+                segment.append(search_grid.index(*graph.local_coords(cluster, local)))
+                local = predecessors[local]
+            path.extend(reversed(segment))
+
+        return path
@@ -0,0 +1,97 @@
+"""
+도달 가능 영역(isochrone)
+출발 셀에서 거리 상한이 있는 Dijkstra를 한 번 실행해 모든 셀의 도보 시간을 구하고,
+시간 구간별로 도달 가능한 셀 마스크의 윤곽선(cv2.findContours)을 다각형으로 만든다.
+"""
+import logging
+import time
+from typing import List, Tuple, Optional, Dict, Any
+
+import cv2
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from app.core.pathfinding.grid import build_movement_matrix
+
+logger = logging.getLogger(__name__)
+
+# 보행 속도 (5km/h, 경로 예상 시간 계산과 동일)
+WALKING_SPEED_MPS = 5000 / 3600
+
+
+class IsochroneEngine:
+    """
+    도달 가능 영역 엔진
+
+    가장 긴 시간 구간을 거리 상한으로 Dijkstra(scipy.sparse.csgraph, limit)를 실행하므로
+    상한 밖의 셀은 탐색하지 않는다. 이동 그래프는 지도별로 한 번 만들어 재사용할 수 있다.
+    """
+
+    def __init__(self, grid: np.ndarray, graph: Optional[csr_matrix] = None):
+        walkable = np.asarray(grid) == 1
+        self.height, self.width = walkable.shape
+        self.graph = graph if graph is not None else build_movement_matrix(walkable)
+
+    def compute(self, start: Tuple[int, int], bands_seconds: List[float],
+                meters_per_cell: float) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        시간 구간별 도달 가능 영역
+
+        Args:
+            start: 출발 셀 (x, y) (보행 가능한 셀이어야 함)
+            bands_seconds: 시간 구간 (초, 오름차순)
+            meters_per_cell: 셀 한 칸의 실제 거리 (미터)
+
+        Returns:
+            (구간별 {'seconds', 'polygons', 'cell_count', 'area_square_meters'} 리스트, 탐색 통계)
+            polygons는 정규화된 좌표의 외곽선(exterior)과 내부 구멍(holes) 리스트
+        """
+        started = time.perf_counter()
+        seconds_per_cell = meters_per_cell / WALKING_SPEED_MPS
+        limit = max(bands_seconds) / seconds_per_cell
+
+        distances = dijkstra(self.graph, indices=start[1] * self.width + start[0], limit=limit)
+        seconds = (distances * seconds_per_cell).reshape(self.height, self.width)
+        search_elapsed = time.perf_counter() - started
+
+        bands = []
+        for band in bands_seconds:
+            mask = (seconds <= band).astype(np.uint8)
+            cell_count = int(mask.sum())
+            bands.append({
+                'seconds': band,
+                'polygons': self._polygons(mask),
+                'cell_count': cell_count,
+                'area_square_meters': cell_count * meters_per_cell ** 2
+            })
+
+        stats = {
+            'reached_cells': int(np.isfinite(distances).sum()),
+            'search_elapsed': search_elapsed,
+            'elapsed': time.perf_counter() - started
+        }
+        return bands, stats
+
+    def _polygons(self, mask: np.ndarray) -> List[Dict[str, List[List[float]]]]:
+        """마스크의 외곽선/구멍 윤곽선을 정규화된 좌표 다각형으로 변환 (RETR_CCOMP 2단계 계층)"""
+        contours, hierarchy = cv2.findContours(mask, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
+        if hierarchy is None:
+            return []
+
+        scale = np.array([self.width, self.height], dtype=np.float64)
+
+        def ring(contour: np.ndarray) -> List[List[float]]:
+            return (contour.reshape(-1, 2) / scale).tolist()
+
+        polygons = []
+        # hierarchy[i] = [다음, 이전, 첫 자식, 부모] - 부모가 없으면 외곽선, 자식은 구멍
+        for i, (_, _, child, parent) in enumerate(hierarchy[0]):
+            if parent >= 0:
+                continue
+            holes = []
+            while child >= 0:
+                holes.append(ring(contours[child]))
+                child = hierarchy[0][child][0]
+            polygons.append({'exterior': ring(contours[i]), 'holes': holes})
+        return polygons
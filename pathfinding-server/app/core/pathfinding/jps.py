@@ -0,0 +1,181 @@
+"""
+Jump Point Search (JPS) 길찾기 엔진
+균일 비용 8방향 그리드 전용 - 대칭 경로를 건너뛰어 A*보다 훨씬 적은 노드만 확장
+벽 모서리 통과(corner cutting)를 허용하지 않는 변형으로, A*와 동일한 비용의 경로를 반환
+"""
+import heapq
+import time
+from typing import List, Tuple, Optional
+
+from app.core.pathfinding.grid import SearchGrid, SearchStats, get_workspace, OCTILE_DIAGONAL_DELTA
+
+# 시작 노드에서는 8방향 모두 탐색
+_ALL_DIRECTIONS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+
+
+class JumpPointSearch:
+    """
+    Jump Point Search 엔진
+
+    이동 규칙은 AStarPathfinder와 같다: 대각선 이동은 인접한 두 직선 칸이 모두 통행 가능할 때만 허용.
+    이 규칙에서는 대각선 이동에 강제 이웃(forced neighbor)이 생기지 않으므로,
+    직선 점프에서만 강제 이웃을 검사하고 대각선 점프는 매 칸마다 직선 점프로 점프 포인트를 찾는다.
+
+    인스턴스는 탐색 상태(목표 셀)를 가지므로 요청마다 새로 생성해 사용한다.
+    """
+
+    def __init__(self, search_grid: SearchGrid):
+        if not search_grid.diagonal_movement:
+            raise ValueError("JPS는 대각선 이동이 허용된 그리드에서만 사용할 수 있습니다")
+
+        self.grid = search_grid
+        self.walkable = search_grid.walkable_view
+        self.stride = search_grid.stride
+        self.goal = -1
+
+    def search(self, start: int, goal: int) -> Tuple[Optional[List[int]], SearchStats]:
+        """
+        JPS 탐색
+
+        Returns:
+            (셀 인덱스 경로 또는 None, 탐색 통계)
+            경로는 점프 포인트 사이를 채운 연속된 셀 경로
+        """
+        started = time.perf_counter()
+        stats = SearchStats(algorithm='jps')
+        search_grid = self.grid
+        self.goal = goal
+
+        workspace = get_workspace(search_grid.size)
+        g_costs = workspace.g_view
+        parents = workspace.parent_view
+        closed = workspace.closed_view
+        stride = self.stride
+        goal_y, goal_x = divmod(goal, stride)
+
+        g_costs[start] = 0.0
+        start_h = search_grid.heuristic(start, goal)
+        open_set = [(start_h, start_h, 0, start)]
+        counter = 1
+        expansions = 0
+        path = None
+
+        while open_set:
+            _, _, _, current = heapq.heappop(open_set)
+
+            if closed[current]:
+                continue
+
+            if current == goal:
+                path = self._expand(workspace.reconstruct(goal))
+                break
+
+            closed[current] = 1
+            expansions += 1
+            current_g = g_costs[current]
+            cy, cx = divmod(current, stride)
+
+            for dx, dy in self._pruned_directions(current, parents[current]):
+                jump_point = self._jump(current, dx, dy)
+                if jump_point < 0 or closed[jump_point]:
+                    continue
+
+                jy, jx = divmod(jump_point, stride)
+                ddx = abs(jx - cx)
+                ddy = abs(jy - cy)
+                tentative_g = current_g + ddx + ddy + OCTILE_DIAGONAL_DELTA * min(ddx, ddy)
+
+                if tentative_g < g_costs[jump_point]:
+                    g_costs[jump_point] = tentative_g
+                    parents[jump_point] = current
+
+                    hx = abs(jx - goal_x)
+                    hy = abs(jy - goal_y)
+                    h = hx + hy + OCTILE_DIAGONAL_DELTA * min(hx, hy)
+                    heapq.heappush(open_set, (tentative_g + h, h, counter, jump_point))
+                    counter += 1
+
+        stats.expansions = expansions
+        stats.elapsed = time.perf_counter() - started
+        if path is not None:
+            stats.path_cost = g_costs[goal]
+        return path, stats
+
+    def _pruned_directions(self, current: int, parent: int) -> List[Tuple[int, int]]:
+        """
+        부모에서 들어온 방향에 따라 탐색할 방향 결정
+        통행 가능 여부와 모서리 규칙은 점프 함수에서 검사
+        """
+        if parent < 0:
+            return _ALL_DIRECTIONS
+
+        cy, cx = divmod(current, self.stride)
+        py, px = divmod(parent, self.stride)
+        dx = (cx > px) - (cx < px)
+        dy = (cy > py) - (cy < py)
+
+        if dx and dy:
+            return [(dx, 0), (0, dy), (dx, dy)]
+        if dx:
+            return [(dx, 0), (dx, 1), (dx, -1), (0, 1), (0, -1)]
+        return [(0, dy), (1, dy), (-1, dy), (1, 0), (-1, 0)]
+
+    def _jump(self, current: int, dx: int, dy: int) -> int:
+        """current에서 (dx, dy) 방향으로 점프. 점프 포인트가 없으면 -1"""
+        if dx and dy:
+            return self._jump_diagonal(current, dx, dy * self.stride)
+        if dx:
+            return self._jump_straight(current, dx, self.stride)
+        return self._jump_straight(current, dy * self.stride, 1)
+
+    def _jump_straight(self, current: int, step: int, side: int) -> int:
+        """
+        직선 점프
+        진행 방향 옆 칸이 열려 있는데 그 뒤쪽 칸이 막혀 있으면 강제 이웃 -> 점프 포인트
+        """
+        walkable = self.walkable
+        goal = self.goal
+        while True:
+            current += step
+            if not walkable[current]:
+                return -1
+            if current == goal:
+                return current
+            if ((walkable[current - side] and not walkable[current - step - side]) or
+                    (walkable[current + side] and not walkable[current - step + side])):
+                return current
+
+    def _jump_diagonal(self, current: int, step_x: int, step_y: int) -> int:
+        """
+        대각선 점프
+        각 칸에서 가로/세로 방향 직선 점프가 점프 포인트를 찾으면 현재 칸이 점프 포인트
+        """
+        walkable = self.walkable
+        goal = self.goal
+        stride = self.stride
+        while True:
+            # 대각선 이동 시 벽 모서리 통과 방지
+            if not (walkable[current + step_x] and walkable[current + step_y]):
+                return -1
+            current += step_x + step_y
+            if not walkable[current]:
+                return -1
+            if current == goal:
+                return current
+            if (self._jump_straight(current, step_x, stride) >= 0 or
+                    self._jump_straight(current, step_y, 1) >= 0):
+                return current
+
+    def _expand(self, jump_points: List[int]) -> List[int]:
+        """점프 포인트 사이를 연속된 셀로 채워 전체 경로 생성"""
+        stride = self.stride
+        path = [jump_points[0]]
+        for a, b in zip(jump_points, jump_points[1:]):
+            ay, ax = divmod(a, stride)
+            by, bx = divmod(b, stride)
+            step = ((by > ay) - (by < ay)) * stride + ((bx > ax) - (bx < ax))
+            current = a
+            while current != b:
+                current += step
+                path.append(current)
+        return path
@@ -0,0 +1,106 @@
+"""
+다대다 보행 거리 행렬
+출발지마다 Dijkstra를 한 번만 실행해 모든 목적지까지의 거리(와 경로)를 함께 구한다.
+N개 지점의 행렬이 N(N-1)번의 A* 대신 N번의 탐색으로 끝난다.
+"""
+import logging
+import time
+from typing import List, Tuple, Optional, Dict
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from app.core.pathfinding.grid import build_movement_matrix
+
+logger = logging.getLogger(__name__)
+
+
+class RouteMatrix:
+    """
+    보행 거리 행렬 엔진
+
+    이동 그래프(build_movement_matrix)는 지도별로 한 번 만들어 재사용하고,
+    출발지별 Dijkstra는 scipy.sparse.csgraph로 실행한다 (같은 셀의 출발지는 한 번만 탐색).
+    """
+
+    def __init__(self, grid: np.ndarray, graph: Optional[csr_matrix] = None):
+        walkable = np.asarray(grid) == 1
+        self.height, self.width = walkable.shape
+        self.graph = graph if graph is not None else build_movement_matrix(walkable)
+
+    def compute(self, cells: List[Tuple[int, int]], return_paths: bool = False
+                ) -> Tuple[np.ndarray, Optional[List[List[Optional[List[Tuple[int, int]]]]]], Dict[str, float]]:
+        """
+        지점 간 최단 경로 비용 행렬 계산
+
+        Args:
+            cells: 그리드 좌표 (x, y) 리스트 (보행 가능한 셀이어야 함)
+            return_paths: True면 각 지점 쌍의 셀 경로도 반환
+
+        Returns:
+            (N x N 비용 행렬 (도달 불가 시 inf), paths[i][j] 셀 경로 리스트 또는 None, 통계)
+        """
+        started = time.perf_counter()
+        width = self.width
+        nodes = np.array([y * width + x for x, y in cells], dtype=np.int64)
+        count = len(nodes)
+
+        distances = np.full((count, count), np.inf)
+        paths = [[None] * count for _ in range(count)] if return_paths else None
+
+        solved: Dict[int, int] = {}  # 출발 셀 -> 이미 계산한 행 번호
+        searches = 0
+        for i, source in enumerate(nodes.tolist()):
+            if source in solved:
+                row = solved[source]
+                distances[i] = distances[row]
+                if return_paths:
+                    paths[i] = list(paths[row])
+                continue
+
+            if return_paths:
+                costs, predecessors = dijkstra(self.graph, indices=source, return_predecessors=True)
+            else:
+                costs = dijkstra(self.graph, indices=source)
+            searches += 1
+            distances[i] = costs[nodes]
+            solved[source] = i
+
+            if return_paths:
+                for j, target in enumerate(nodes.tolist()):
+                    if np.isfinite(distances[i, j]):
+                        paths[i][j] = self._reconstruct(predecessors, source, target)
+
+        stats = {'searches': searches, 'elapsed': time.perf_counter() - started}
+        return distances, paths, stats
+
+    def paths_from(self, source: Tuple[int, int], targets: List[Tuple[int, int]]
+                   ) -> Tuple[np.ndarray, List[Optional[List[Tuple[int, int]]]]]:
+        """
+        한 출발 셀에서 여러 목적 셀까지의 비용과 셀 경로 (Dijkstra 한 번)
+
+        Returns:
+            (목적지별 비용 배열 (도달 불가 시 inf), 목적지별 셀 경로 또는 None)
+        """
+        width = self.width
+        start = source[1] * width + source[0]
+        costs, predecessors = dijkstra(self.graph, indices=start, return_predecessors=True)
+        nodes = [y * width + x for x, y in targets]
+        paths = [
+            self._reconstruct(predecessors, start, node) if np.isfinite(costs[node]) else None
+            for node in nodes
+        ]
+        return costs[nodes], paths
+
+    def _reconstruct(self, predecessors: np.ndarray, source: int, target: int) -> List[Tuple[int, int]]:
+        """Dijkstra 선행 노드 배열에서 source -> target 셀 경로 복원"""
+        width = self.width
+        path = []
+        node = target
+        while node != source:
+            path.append((node % width, node // width))
+            node = predecessors[node]
+        path.append((source % width, source // width))
+        path.reverse()
+        return path
@@ -0,0 +1,111 @@
+"""
+가장 가까운 목적지 k개 탐색 (다중 목적지 Dijkstra)
+출발지에서 Dijkstra를 한 번만 실행하고, 후보 목적지 셀이 닫힐(확정될) 때마다 결과에 추가해
+k개가 모이면 바로 종료한다. 후보마다 A*를 따로 실행하는 것보다 확장하는 셀이 훨씬 적다.
+"""
+import heapq
+import time
+from typing import List, Tuple, Dict
+
+from app.core.pathfinding.grid import SearchGrid, SearchStats, get_workspace
+
+
+class NearestGoalSearch:
+    """
+    다중 목적지 탐색 엔진
+
+    이동 규칙은 AStarPathfinder와 같다 (대각선 이동은 인접한 두 직선 칸이 모두 통행 가능할 때만 허용).
+    셀이 닫히는 순서가 곧 출발지에서의 보행 거리 순서이므로, 닫힌 목적지는 그대로 순위가 되고
+    그 시점의 부모 배열로 최단 경로를 복원할 수 있다.
+    """
+
+    def __init__(self, search_grid: SearchGrid):
+        self.grid = search_grid
+
+    def search(self, start: Tuple[int, int], goals: List[Tuple[int, int]],
+               k: int) -> Tuple[List[Tuple[int, float, List[Tuple[int, int]]]], SearchStats]:
+        """
+        출발지에서 가장 가까운 목적지 k개 탐색
+
+        Args:
+            start: 출발 셀 (x, y) (보행 가능한 셀이어야 함)
+            goals: 후보 목적지 셀 (x, y) 리스트 (같은 셀에 여러 후보가 있어도 됨)
+            k: 찾을 목적지 수
+
+        Returns:
+            ((후보 인덱스, 경로 비용, 셀 경로) 리스트 - 가까운 순, 탐색 통계)
+            도달할 수 없는 후보는 제외되므로 k개보다 적을 수 있다
+        """
+        started = time.perf_counter()
+        stats = SearchStats(algorithm='multi_goal')
+        search_grid = self.grid
+
+        # 목적지 셀 -> 후보 인덱스들
+        pending: Dict[int, List[int]] = {}
+        for i, (x, y) in enumerate(goals):
+            if search_grid.is_walkable(x, y):
+                pending.setdefault(search_grid.index(x, y), []).append(i)
+
+        workspace = get_workspace(search_grid.size)
+        g_costs = workspace.g_view
+        parents = workspace.parent_view
+        closed = workspace.closed_view
+        walkable = search_grid.walkable_view
+        neighbors = search_grid.neighbors
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        source = search_grid.index(*start)
+        g_costs[source] = 0.0
+        open_set = [(0.0, 0, source)]
+        counter = 1
+        expansions = 0
+        settled: List[Tuple[int, float, List[int]]] = []  # (목적지 셀, 비용, 후보 인덱스들)
+        found = 0
+
+        while open_set and found < k and pending:
+            current_g, _, current = heappop(open_set)
+            if closed[current]:
+                continue
+
+            closed[current] = 1
+            expansions += 1
+
+            # 후보 목적지 셀이 닫히면 최단 거리가 확정됨
+            if current in pending:
+                indexes = pending.pop(current)
+                found += len(indexes)
+                settled.append((current, current_g, indexes))
+                if found >= k:
+                    break
+
+            for offset, move_cost, side_a, side_b in neighbors:
+                neighbor = current + offset
+                if not walkable[neighbor] or closed[neighbor]:
+                    continue
+
+                # 대각선 이동 시 벽 모서리 통과 방지
+                if side_a and not (walkable[current + side_a] and walkable[current + side_b]):
+                    continue
+
+                tentative_g = current_g + move_cost
+                if tentative_g < g_costs[neighbor]:
+                    g_costs[neighbor] = tentative_g
+                    parents[neighbor] = current
+                    heappush(open_set, (tentative_g, counter, neighbor))
+                    counter += 1
+
+        # 닫힌 셀의 부모는 더 이상 바뀌지 않으므로 탐색을 마친 뒤 한꺼번에 복원
+        results = []
+        for cell, cost, indexes in settled:
+            path = [search_grid.coords(idx) for idx in workspace.reconstruct(cell)]
+            for i in indexes:
+                results.append((i, cost, path))
+        results = results[:k]
+
+        stats.expansions = expansions
+        stats.elapsed = time.perf_counter() - started
+        stats.extra['settled_goals'] = len(results)
+        if results:
+            stats.path_cost = results[0][1]
+        return results, stats
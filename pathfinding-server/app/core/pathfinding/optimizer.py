@@ -10,6 +10,17 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 스무딩 수준별 곡선 근사 허용 오차 (정규화 좌표) - 샘플 사이 직선이 곡선에서 벗어나는 최대 거리
+SMOOTHING_TOLERANCES = {
+    'low': 0.002,
+    'medium': 0.001,
+    'high': 0.0005
+}
+
+# 웨이포인트 구간 하나에서 곡률을 추정할 때 평가하는 점 수, 구간당 최대 샘플 수
+_CURVATURE_PROBES = 8
+_MAX_SAMPLES_PER_SPAN = 32
+
 
 class PathOptimizer:
     """
@@ -23,13 +34,18 @@ class PathOptimizer:
         self.angle_threshold = 30  # 각도 임계값 (도)
 
     def optimize_path(self, path: List[Tuple[float, float]],
-                      options: Dict[str, Any] = None) -> Dict[str, Any]:
+                      options: Dict[str, Any] = None,
+                      reduce_waypoints: bool = True,
+                      grid: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         경로를 최적화하여 여러 형식으로 반환
 
         Args:
             path: 원본 경로 (정규화된 좌표)
             options: 최적화 옵션
+            reduce_waypoints: 웨이포인트 감소(RDP) 적용 여부
+                any-angle 엔진 경로처럼 이미 꺾임 지점만 남은 경로는 False
+            grid: 2D 그리드 (있으면 스무딩한 곡선이 장애물을 지나는 구간은 직선으로 대체)
 
         Returns:
             최적화된 경로 정보 딕셔너리
@@ -50,10 +66,10 @@ class PathOptimizer:
         unique_path = self._remove_duplicates(path)
 
         # 2. 웨이포인트 감소
-        reduced_path = self.reduce_waypoints(unique_path)
+        reduced_path = self.reduce_waypoints(unique_path) if reduce_waypoints else unique_path
 
         # 3. 경로 스무딩
-        smooth_path = self.smooth_path(reduced_path, options.get('smoothing_level', 'medium'))
+        smooth_path = self.smooth_path(reduced_path, options.get('smoothing_level', 'medium'), grid, unique_path)
 
         # 4. SVG 경로 생성
         svg_path = self.create_svg_path(smooth_path)
@@ -77,67 +93,158 @@ class PathOptimizer:
         }
 
     def smooth_path(self, path: List[Tuple[float, float]],
-                    smoothing_level: str = 'medium') -> List[Tuple[float, float]]:
+                    smoothing_level: str = 'medium',
+                    grid: Optional[np.ndarray] = None,
+                    source_path: Optional[List[Tuple[float, float]]] = None) -> List[Tuple[float, float]]:
         """
-        경로를 부드럽게 만들기 (베지어 곡선 또는 스플라인 보간)
+        경로를 부드럽게 만들기 (웨이포인트를 지나는 3차 스플라인을 곡률에 따라 샘플링)
+
+        웨이포인트 구간마다 곡률과 호 길이로 샘플 수를 정하므로 직선에 가까운 구간은 점 1개,
+        급하게 꺾이는 구간만 여러 점이 된다 (샘플 사이 직선과 곡선의 차이가 허용 오차 이하).
+        그리드가 주어지면 샘플 사이 선분을 그리드에서 한 번에 검사해
+        장애물을 지나는 구간은 원래 웨이포인트 사이 직선으로 되돌리고,
+        그 직선도 장애물을 지나면 (웨이포인트 감소로 모서리를 자른 경우) 감소 전 경로의 점들로 채운다.
 
         Args:
             path: 원본 경로
             smoothing_level: 스무딩 수준 ('none', 'low', 'medium', 'high')
+            grid: 2D 그리드 (0: 장애물, 1: 통행 가능)
+            source_path: 웨이포인트 감소 전 경로 (path는 이 경로의 부분 수열)
 
         Returns:
             스무싱된 경로
         """
-        if len(path) < 3:
+        # 스플라인은 4점 이상에서만 사용 (3점 이하는 이미 직선 구간만 있음)
+        tolerance = SMOOTHING_TOLERANCES.get(smoothing_level, SMOOTHING_TOLERANCES['medium'])
+        if smoothing_level == 'none' or len(path) < 4:
             return path
 
-        # 스무딩 수준에 따른 파라미터 설정
-        smoothing_params = {
-            'none': 0,
-            'low': 10,
-            'medium': 20,
-            'high': 30
-        }
-        num_points = smoothing_params.get(smoothing_level, 20)
+        try:
+            points = np.asarray(path, dtype=np.float64)
+            tck, u = interpolate.splprep([points[:, 0], points[:, 1]], s=0, k=3)
+            samples, spans = self._adaptive_samples(tck, u, tolerance)
+
+            # 구간 시작점은 스플라인 평가 오차 없이 웨이포인트 그대로 사용
+            starts = np.r_[True, spans[1:] != spans[:-1]]
+            samples[starts] = points[spans[starts]]
+
+            if grid is not None:
+                blocked = self._blocked_segments(samples, grid)
+                # 장애물을 지나는 구간은 시작 웨이포인트만 남겨 다음 웨이포인트까지 직선으로 연결
+                colliding = np.zeros(len(points), dtype=bool)
+                colliding[spans[:-1][blocked]] = True
+                keep = starts | ~colliding[spans]
+                keep[-1] = True
+                detours = self._chord_detours(points, np.flatnonzero(colliding), grid, source_path)
+                samples, spans = samples[keep], spans[keep]
+
+                if detours:
+                    smoothed = []
+                    for point, span in zip(samples.tolist(), spans.tolist()):
+                        smoothed.append(tuple(point))
+                        smoothed.extend(detours.pop(span, ()))
+                    return self._remove_duplicates(smoothed)
+
+            return self._remove_duplicates([tuple(p) for p in samples.tolist()])
 
-        if num_points == 0:
+        except Exception as e:
+            logger.warning(f"경로 스무딩 실패: {e}")
             return path
 
-        try:
-            # 경로를 x, y 좌표로 분리
-            x_coords = [p[0] for p in path]
-            y_coords = [p[1] for p in path]
+    def _adaptive_samples(self, tck, u: np.ndarray, tolerance: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        스플라인을 구간별 곡률에 맞춰 샘플링
 
-            # 스플라인 보간 생성
-            if len(path) >= 4:
-                # Cubic spline for smooth curves
-                tck, u = interpolate.splprep([x_coords, y_coords], s=0, k=min(3, len(path)-1))
-                u_new = np.linspace(0, 1, num_points * len(path))
-                smooth_coords = interpolate.splev(u_new, tck)
+        반지름 R인 곡선을 길이 L의 현으로 근사하면 최대 오차는 약 L² / (8R) 이므로
+        구간을 sqrt(8 * tolerance / 최대 곡률) 길이 이하의 현으로 나눈다.
 
-                smooth_path = list(zip(smooth_coords[0], smooth_coords[1]))
-            else:
-                # Linear interpolation for few points
-                t = np.linspace(0, 1, len(path))
-                t_new = np.linspace(0, 1, num_points * len(path))
+        Returns:
+            (샘플 좌표 (N x 2) - 마지막 점은 경로 끝점, 샘플별 웨이포인트 구간 번호)
+        """
+        span_count = len(u) - 1
+        du = np.diff(u)
+        probes = u[:-1, None] + du[:, None] * np.linspace(0, 1, _CURVATURE_PROBES + 1)[None, :]
 
-                f_x = interpolate.interp1d(t, x_coords, kind='linear')
-                f_y = interpolate.interp1d(t, y_coords, kind='linear')
+        dx, dy = interpolate.splev(probes.ravel(), tck, der=1)
+        ddx, ddy = interpolate.splev(probes.ravel(), tck, der=2)
+        speed = np.hypot(dx, dy)
+        curvature = np.abs(dx * ddy - dy * ddx) / np.maximum(speed, 1e-12) ** 3
 
-                smooth_path = list(zip(f_x(t_new), f_y(t_new)))
+        arc_length = speed.reshape(span_count, -1).mean(axis=1) * du
+        max_curvature = curvature.reshape(span_count, -1).max(axis=1)
+        counts = np.ceil(arc_length * np.sqrt(max_curvature / (8 * tolerance)))
+        counts = np.clip(np.nan_to_num(counts, nan=1.0), 1, _MAX_SAMPLES_PER_SPAN).astype(np.int64)
 
-            # 중복 제거
-            return self._remove_duplicates(smooth_path)
+        spans = np.repeat(np.arange(span_count), counts)
+        offsets = np.arange(spans.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        params = u[spans] + du[spans] * offsets / counts[spans]
 
-        except Exception as e:
-            logger.warning(f"경로 스무딩 실패: {e}")
-            return path
+        xs, ys = interpolate.splev(np.r_[params, u[-1]], tck)
+        return np.column_stack([xs, ys]), np.r_[spans, span_count]
+
+    def _chord_detours(self, points: np.ndarray, chords: np.ndarray, grid: np.ndarray,
+                       source_path: Optional[List[Tuple[float, float]]]) -> Dict[int, List[Tuple[float, float]]]:
+        """
+        되돌린 웨이포인트 사이 직선 중 장애물을 지나는 구간 -> 그 사이의 감소 전 경로 점들
+        감소 전 경로가 없거나 웨이포인트가 그 부분 수열이 아니면 빈 딕셔너리
+        """
+        if source_path is None or chords.size == 0:
+            return {}
+
+        # 직선 구간 (웨이포인트 i, i + 1) 쌍을 이어 붙여 한 번에 검사 (짝수 번째 선분이 직선 구간)
+        pairs = np.empty((chords.size * 2, 2))
+        pairs[0::2] = points[chords]
+        pairs[1::2] = points[chords + 1]
+        blocked = chords[self._blocked_segments(pairs, grid)[0::2]]
+        if blocked.size == 0:
+            return {}
+
+        # 웨이포인트별 감소 전 경로의 위치
+        positions = []
+        cursor = 0
+        for waypoint in points.tolist():
+            while cursor < len(source_path) and tuple(source_path[cursor]) != tuple(waypoint):
+                cursor += 1
+            if cursor == len(source_path):
+                return {}
+            positions.append(cursor)
+
+        return {int(i): [tuple(p) for p in source_path[positions[i] + 1:positions[i + 1]]]
+                for i in blocked.tolist()}
+
+    def _blocked_segments(self, samples: np.ndarray, grid: np.ndarray) -> np.ndarray:
+        """
+        연속한 샘플 사이 선분마다 장애물(또는 그리드 밖)을 지나는지 여부 (선분 N-1개를 한 번에 검사)
+        선분을 긴 축 방향으로 한 셀씩 나눈 점(DDA)이 모두 보행 가능한 셀에 있어야 통과 (길찾기 가시선 검사와 같은 기준)
+        """
+        height, width = grid.shape
+        cells = samples * np.array([width, height])
+        deltas = np.diff(cells, axis=0)
+        steps = np.ceil(np.abs(deltas).max(axis=1) - 1e-9).astype(np.int64) + 1
+
+        segments = np.repeat(np.arange(len(deltas)), steps)
+        t = (np.arange(segments.size) - np.repeat(np.cumsum(steps) - steps, steps)) / np.maximum(steps - 1, 1)[segments]
+
+        # 셀 중앙을 정확히 지나는 경우는 시작점 쪽 셀로 반올림 (Bresenham과 같은 선택)
+        origins = np.rint(cells[:-1])
+        offsets = cells[:-1][segments] - origins[segments] + deltas[segments] * t[:, None]
+        probe = origins[segments] + np.sign(offsets) * np.ceil(np.abs(offsets) - 0.5 - 1e-9)
+        xs = probe[:, 0].astype(np.int64)
+        ys = probe[:, 1].astype(np.int64)
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        walkable = np.zeros(segments.size, dtype=bool)
+        walkable[inside] = np.asarray(grid)[ys[inside], xs[inside]] == 1
+
+        return np.bincount(segments, weights=~walkable, minlength=len(deltas)) > 0
 
     def reduce_waypoints(self, path: List[Tuple[float, float]],
                         tolerance: float = 0.001) -> List[Tuple[float, float]]:
         """
         Ramer-Douglas-Peucker 알고리즘을 사용한 웨이포인트 감소
 
+        재귀와 리스트 분할 대신 구간 스택으로 반복하며, 경로는 하나의 NumPy 배열로 두고
+        구간마다 내부 점들의 선분까지 거리를 한 번에 계산한다 (긴 경로에서도 재귀 깊이 제한 없음).
+
         Args:
             path: 원본 경로
             tolerance: 허용 오차
@@ -148,30 +255,31 @@ class PathOptimizer:
         if len(path) <= 2:
             return path
 
-        # 첫 점과 끝 점 사이의 직선에서 가장 먼 점 찾기
-        first = path[0]
-        last = path[-1]
+        points = np.asarray(path, dtype=np.float64)
+        xs, ys = points[:, 0], points[:, 1]
+        keep = np.zeros(len(points), dtype=bool)
+        keep[0] = keep[-1] = True
 
-        max_dist = 0
-        max_idx = 0
+        stack = [(0, len(points) - 1)]
+        while stack:
+            first, last = stack.pop()
+            if last - first < 2:
+                continue
 
-        for i in range(1, len(path) - 1):
-            dist = self._point_to_line_distance(path[i], first, last)
-            if dist > max_dist:
-                max_dist = dist
-                max_idx = i
-
-        # 임계값보다 거리가 크면 재귀적으로 분할
-        if max_dist > tolerance:
-            # 왼쪽 부분 처리
-            left_path = self.reduce_waypoints(path[:max_idx + 1], tolerance)
-            # 오른쪽 부분 처리
-            right_path = self.reduce_waypoints(path[max_idx:], tolerance)
-            # 결합 (중복 점 제거)
-            return left_path[:-1] + right_path
-        else:
-            # 시작점과 끝점만 유지
-            return [first, last]
+            # 첫 점과 끝 점 사이의 선분에서 가장 먼 점 찾기
+            distances = self._segment_distances(
+                xs[first + 1:last], ys[first + 1:last], xs[first], ys[first], xs[last], ys[last]
+            )
+            max_idx = int(np.argmax(distances))
+
+            # 임계값보다 거리가 크면 그 점을 남기고 양쪽 구간을 다시 검사
+            if distances[max_idx] > tolerance:
+                split = first + 1 + max_idx
+                keep[split] = True
+                stack.append((split, last))
+                stack.append((first, split))
+
+        return [path[i] for i in np.flatnonzero(keep)]
 
     def apply_constraints(self, path: List[Tuple[float, float]],
                          constraints: Dict[str, Any]) -> List[Tuple[float, float]]:
@@ -180,7 +288,8 @@ class PathOptimizer:
 
         Args:
             path: 원본 경로
-            constraints: 제약 조건 (예: 특정 영역 회피, 최대 회전 각도 등)
+            constraints: 제약 조건 (예: 최대 회전 각도)
+                회피/선호 영역(avoid_areas, prefer_areas)은 탐색 단계에서 비용 오버레이로 반영된다
 
         Returns:
             제약 조건이 적용된 경로
@@ -192,22 +301,15 @@ class PathOptimizer:
             max_angle = constraints['max_turn_angle']
             constrained_path = self._apply_turn_angle_constraint(constrained_path, max_angle)
 
-        # 금지 구역 회피
-        if 'avoid_areas' in constraints:
-            avoid_areas = constraints['avoid_areas']
-            constrained_path = self._avoid_areas(constrained_path, avoid_areas)
-
-        # 선호 경로 따라가기
-        if 'prefer_path' in constraints:
-            prefer_path = constraints['prefer_path']
-            constrained_path = self._follow_preferred_path(constrained_path, prefer_path)
-
         return constrained_path
 
     def create_svg_path(self, path: List[Tuple[float, float]]) -> str:
         """
         경로를 SVG path 문자열로 변환
 
+        첫 점으로 이동(M)한 뒤 두 점씩 2차 베지어 곡선(Q)으로 잇고, 점 수가 짝수면 마지막 점은 직선(L)으로 잇는다.
+        명령 템플릿을 한 번 만들어 전체 좌표를 한 번의 문자열 포맷으로 채운다.
+
         Args:
             path: 경로 좌표 리스트
 
@@ -217,32 +319,12 @@ class PathOptimizer:
         if not path:
             return ""
 
-        # SVG 명령어 생성
-        svg_commands = []
-
-        # 시작점으로 이동
-        svg_commands.append(f"M {path[0][0]:.4f},{path[0][1]:.4f}")
-
-        if len(path) > 2:
-            # 베지어 곡선으로 부드러운 경로 생성
-            for i in range(1, len(path) - 1, 2):
-                if i + 1 < len(path):
-                    # Quadratic Bezier curve
-                    control = path[i]
-                    end = path[i + 1]
-                    svg_commands.append(f"Q {control[0]:.4f},{control[1]:.4f} {end[0]:.4f},{end[1]:.4f}")
-                else:
-                    # 마지막 점은 직선으로
-                    svg_commands.append(f"L {path[i][0]:.4f},{path[i][1]:.4f}")
-
-            # 마지막 점이 처리되지 않았다면 추가
-            if len(path) % 2 == 0:
-                svg_commands.append(f"L {path[-1][0]:.4f},{path[-1][1]:.4f}")
-        else:
-            # 점이 2개만 있으면 직선
-            svg_commands.append(f"L {path[1][0]:.4f},{path[1][1]:.4f}")
-
-        return " ".join(svg_commands)
+        count = len(path)
+        template = "M %.4f,%.4f" + " Q %.4f,%.4f %.4f,%.4f" * ((count - 1) // 2)
+        if count % 2 == 0:
+            template += " L %.4f,%.4f"
+
+        return template % tuple(value for point in path for value in point)
 
     def calculate_distance(self, path: List[Tuple[float, float]]) -> float:
         """
@@ -296,26 +378,19 @@ class PathOptimizer:
         waypoints.append(path[-1])
         return waypoints
 
-    def _point_to_line_distance(self, point: Tuple[float, float],
-                                line_start: Tuple[float, float],
-                                line_end: Tuple[float, float]) -> float:
-        """점에서 직선까지의 수직 거리 계산"""
-        x0, y0 = point
-        x1, y1 = line_start
-        x2, y2 = line_end
-
-        # 직선의 길이
-        line_length = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-
-        if line_length == 0:
-            return math.sqrt((x0 - x1) ** 2 + (y0 - y1) ** 2)
+    @staticmethod
+    def _segment_distances(x0: np.ndarray, y0: np.ndarray, x1: float, y1: float,
+                           x2: float, y2: float) -> np.ndarray:
+        """점들 (x0, y0)에서 선분 (x1, y1)-(x2, y2)까지의 거리 (선분 밖으로 벗어난 투영은 끝점으로 제한)"""
+        dx, dy = x2 - x1, y2 - y1
+        # 선분 길이를 구한 뒤 제곱 - 점별 계산과 같은 값이 나와 거리가 같은 점 중 같은 점을 고름
+        length_sq = math.sqrt(dx * dx + dy * dy) ** 2
 
-        # 점에서 직선까지의 거리
-        t = max(0, min(1, ((x0 - x1) * (x2 - x1) + (y0 - y1) * (y2 - y1)) / (line_length ** 2)))
-        projection_x = x1 + t * (x2 - x1)
-        projection_y = y1 + t * (y2 - y1)
+        if length_sq == 0:
+            return np.sqrt((x0 - x1) ** 2 + (y0 - y1) ** 2)
 
-        return math.sqrt((x0 - projection_x) ** 2 + (y0 - projection_y) ** 2)
+        t = np.clip(((x0 - x1) * dx + (y0 - y1) * dy) / length_sq, 0, 1)
+        return np.sqrt((x0 - (x1 + t * dx)) ** 2 + (y0 - (y1 + t * dy)) ** 2)
 
     def _calculate_angle(self, p1: Tuple[float, float],
                         p2: Tuple[float, float],
@@ -342,16 +417,4 @@ class PathOptimizer:
                                     max_angle: float) -> List[Tuple[float, float]]:
         """최대 회전 각도 제약 적용"""
         # TODO: 구현 필요 (복잡한 로직)
-        return path
-
-    def _avoid_areas(self, path: List[Tuple[float, float]],
-                    avoid_areas: List[Dict]) -> List[Tuple[float, float]]:
-        """금지 구역 회피"""
-        # TODO: 구현 필요 (복잡한 로직)
-        return path
-
-    def _follow_preferred_path(self, path: List[Tuple[float, float]],
-                              preferred_path: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
-        """선호 경로 따라가기"""
-        # TODO: 구현 필요 (복잡한 로직)
         return path
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""
+요청별 비용 오버레이 (회피/선호 영역)
+options.avoid_areas / prefer_areas의 다각형(정규화 좌표)을 cv2.fillPoly로 그리드에 한 번 래스터화해
+통행 금지 셀을 지운 그리드와 셀별 이동 비용 배율을 만든다.
+같은 다각형 집합은 overlay_key가 같으므로 서비스에서 캐시해 다시 래스터화하지 않는다.
+
+영역 형식:
+- 좌표 리스트 [[x, y], ...] 또는 {'polygon': [[x, y], ...]}
+- avoid_areas: 'penalty'(1보다 큰 비용 배율)가 있으면 그만큼 돌아가더라도 피하고, 없으면 통행 금지
+- prefer_areas: 'weight'(0-1 비용 배율, 기본 0.5)만큼 그 영역의 이동 비용을 낮춤
+"""
+import hashlib
+import json
+import logging
+from typing import List, Optional, Dict, Any, Tuple
+
+import cv2
+import numpy as np
+
+from app.core.pathfinding.weighted import CostField
+
+logger = logging.getLogger(__name__)
+
+# 선호 영역의 기본 비용 배율
+DEFAULT_PREFER_WEIGHT = 0.5
+
+# 선호 영역 비용 배율 하한 (휴리스틱이 너무 약해져 탐색이 넓어지는 것을 막음)
+MIN_PREFER_WEIGHT = 0.1
+
+
+def overlay_key(avoid_areas: Optional[List[Any]], prefer_areas: Optional[List[Any]]) -> str:
+    """다각형 집합의 해시 (같은 영역 요청이면 같은 키)"""
+    payload = json.dumps({'avoid': avoid_areas or [], 'prefer': prefer_areas or []},
+                         sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class CostOverlay:
+    """
+    래스터화한 회피/선호 영역
+
+    grid: 통행 금지 영역을 장애물(0)로 바꾼 그리드 (통행 금지 영역이 없으면 원본 그리드)
+    costs: 셀별 이동 비용 배율 (비용 영역이 없으면 None) - 가중치 A*(WeightedAStar)가 사용
+    """
+
+    def __init__(self, key: str, grid: np.ndarray, costs: Optional[CostField], blocked_cells: int):
+        self.key = key
+        self.grid = grid
+        self.costs = costs
+        self.blocked_cells = blocked_cells
+
+    @property
+    def has_blocked(self) -> bool:
+        return self.blocked_cells > 0
+
+    @classmethod
+    def build(cls, grid: np.ndarray, avoid_areas: Optional[List[Any]],
+              prefer_areas: Optional[List[Any]],
+              base_costs: Optional[np.ndarray] = None) -> 'CostOverlay':
+        """
+        영역 다각형을 그리드 크기로 래스터화
+
+        Args:
+            base_costs: 영역 비용에 곱할 지도 전체 비용 배율 (벽 간격 비용 등)
+
+        Raises:
+            ValueError: 영역 형식이 잘못된 경우
+        """
+        height, width = grid.shape
+        blocked = np.zeros((height, width), dtype=np.uint8)
+        costs = np.ones((height, width), dtype=np.float64)
+        has_costs = False
+
+        for area in avoid_areas or []:
+            polygon, spec = cls._polygon(area, width, height)
+            penalty = spec.get('penalty')
+            if penalty is None:
+                cv2.fillPoly(blocked, [polygon], 1)
+                continue
+            if not isinstance(penalty, (int, float)) or penalty <= 1:
+                raise ValueError("회피 영역의 penalty는 1보다 큰 숫자여야 합니다")
+            np.maximum(costs, cls._fill(polygon, height, width) * float(penalty), out=costs)
+            has_costs = True
+
+        preferred = np.ones((height, width), dtype=np.float64)
+        for area in prefer_areas or []:
+            polygon, spec = cls._polygon(area, width, height)
+            weight = spec.get('weight', DEFAULT_PREFER_WEIGHT)
+            if not isinstance(weight, (int, float)) or not MIN_PREFER_WEIGHT <= weight <= 1:
+                raise ValueError(f"선호 영역의 weight는 {MIN_PREFER_WEIGHT}-1 사이여야 합니다")
+            mask = cls._fill(polygon, height, width).astype(bool)
+            preferred[mask] = np.minimum(preferred[mask], float(weight))
+            has_costs = True
+
+        if base_costs is not None:
+            costs *= base_costs
+            has_costs = True
+
+        blocked_cells = int(blocked.sum())
+        if blocked_cells:
+            grid = np.where(blocked == 1, 0, np.asarray(grid) == 1).astype(np.uint8)
+        logger.info(f"비용 오버레이 생성: 회피 {len(avoid_areas or [])}개, 선호 {len(prefer_areas or [])}개, "
+                    f"통행 금지 셀 {blocked_cells}개")
+
+        return cls(
+            key=overlay_key(avoid_areas, prefer_areas),
+            grid=grid,
+            costs=CostField(costs * preferred) if has_costs else None,
+            blocked_cells=blocked_cells
+        )
+
+    @staticmethod
+    def _polygon(area: Any, width: int, height: int) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """영역 항목 -> (그리드 좌표 다각형 int32 배열, 옵션 딕셔너리)"""
+        spec = area if isinstance(area, dict) else {'polygon': area}
+        try:
+            points = np.asarray(spec.get('polygon'), dtype=np.float64).reshape(-1, 2)
+        except (TypeError, ValueError):
+            raise ValueError("영역 다각형은 [[x, y], ...] 좌표 리스트여야 합니다")
+        if len(points) < 3:
+            raise ValueError("영역 다각형은 3개 이상의 좌표가 필요합니다")
+
+        return np.round(points * [width, height]).astype(np.int32), spec
+
+    @staticmethod
+    def _fill(polygon: np.ndarray, height: int, width: int) -> np.ndarray:
+        mask = np.zeros((height, width), dtype=np.uint8)
+        cv2.fillPoly(mask, [polygon], 1)
+        return mask
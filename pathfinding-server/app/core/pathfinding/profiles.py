@@ -0,0 +1,34 @@
+"""
+접근성 경로 프로필
+휠체어/카트처럼 일정 폭 이상의 통로만 지날 수 있는 이용자를 위해
+보행 가능 영역을 최소 통로 폭만큼 침식한 그리드로 탐색한다.
+침식 그리드와 그 보조 인덱스는 전처리 시 지도 배열 저장소에 프로필별로 만들어 두고,
+요청은 options.profile로 이름만 골라 쓰므로 요청마다 형태학 연산을 하지 않는다.
+"""
+import numpy as np
+from scipy import ndimage
+
+# 침식하지 않은 원본 그리드를 쓰는 프로필
+DEFAULT_PROFILE = 'default'
+
+# 프로필 -> 최소 통로 폭 (그리드 셀) - 설정(routing_profiles)이 없을 때 사용
+ROUTING_PROFILES = {
+    'wheelchair': 3,
+    'cart': 5
+}
+
+
+def erode_grid(grid: np.ndarray, min_width: int) -> np.ndarray:
+    """
+    폭 min_width 셀 이상의 통로 가운데만 남긴 그리드 (uint8, 1: 통행 가능)
+
+    이용자 중심이 지날 수 있는 셀은 가장 가까운 장애물(지도 바깥 포함)까지의 거리가
+    (min_width + 1) / 2 이상인 셀이다. 폭이 정확히 min_width인 직선 통로는 가운데 줄이 남는다.
+    """
+    walkable = np.asarray(grid) == 1
+    if min_width <= 1:
+        return walkable.astype(np.uint8)
+
+    padded = np.pad(walkable, 1, constant_values=False)
+    distances = ndimage.distance_transform_edt(padded)[1:-1, 1:-1]
+    return (distances >= (min_width + 1) / 2).astype(np.uint8)
@@ -0,0 +1,86 @@
+"""
+최근접 보행 가능 지점 인덱스
+유클리드 거리 변환(distance transform)으로 모든 셀에서 가장 가까운 보행 가능 셀을 미리 계산해
+장애물 위 좌표 보정을 배열 조회 한 번으로 처리
+"""
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy import ndimage
+
+logger = logging.getLogger(__name__)
+
+# 보정 최대 거리 (그리드 셀 단위, 유클리드 거리)
+DEFAULT_SNAP_RADIUS = 50
+
+
+class SnapIndex:
+    """
+    셀별 최근접 보행 가능 셀 좌표 테이블
+
+    scipy.ndimage.distance_transform_edt(return_indices=True)로 생성하며,
+    보행 가능한 셀은 자기 자신을, 장애물 셀은 가장 가까운 보행 가능 셀을 가리킨다.
+    """
+
+    def __init__(self, nearest_x: np.ndarray, nearest_y: np.ndarray, has_walkable: bool = True):
+        self.nearest_x = nearest_x
+        self.nearest_y = nearest_y
+        self.height, self.width = nearest_x.shape
+        self.has_walkable = has_walkable
+
+    @classmethod
+    def build(cls, grid: np.ndarray) -> 'SnapIndex':
+        """그리드에서 최근접 보행 가능 셀 테이블 생성"""
+        obstacles = np.asarray(grid) != 1
+        has_walkable = not obstacles.all()
+        if has_walkable:
+            _, (nearest_y, nearest_x) = ndimage.distance_transform_edt(obstacles, return_indices=True)
+        else:
+            nearest_y, nearest_x = np.indices(obstacles.shape)
+
+        dtype = np.uint16 if max(obstacles.shape) <= np.iinfo(np.uint16).max else np.int32
+        return cls(nearest_x.astype(dtype), nearest_y.astype(dtype), has_walkable)
+
+    def snap(self, x: int, y: int,
+             max_distance: Optional[float] = DEFAULT_SNAP_RADIUS) -> Optional[Tuple[int, int]]:
+        """
+        가장 가까운 보행 가능 셀 (x, y)
+
+        그리드 밖 좌표는 가장자리 셀 기준으로 조회하고, 거리는 원래 좌표에서 잰다.
+        max_distance보다 멀면 None
+        """
+        if not self.has_walkable:
+            return None
+        cx = min(max(x, 0), self.width - 1)
+        cy = min(max(y, 0), self.height - 1)
+        nx = int(self.nearest_x[cy, cx])
+        ny = int(self.nearest_y[cy, cx])
+        if max_distance is not None and (nx - x) ** 2 + (ny - y) ** 2 > max_distance ** 2:
+            return None
+        return nx, ny
+
+    def snap_many(self, xs: np.ndarray, ys: np.ndarray,
+                  max_distance: Optional[float] = DEFAULT_SNAP_RADIUS
+                  ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        여러 좌표를 한 번에 보정 (벡터화)
+
+        Args:
+            xs, ys: 그리드 좌표 배열
+
+        Returns:
+            (보정된 x 배열, 보정된 y 배열, 보정 거리 배열, 보정 성공 여부 배열)
+        """
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        cx = np.clip(xs, 0, self.width - 1)
+        cy = np.clip(ys, 0, self.height - 1)
+        nx = self.nearest_x[cy, cx].astype(np.int64)
+        ny = self.nearest_y[cy, cx].astype(np.int64)
+        distances = np.hypot(nx - xs, ny - ys)
+
+        found = np.full(xs.shape, self.has_walkable)
+        if max_distance is not None:
+            found &= distances <= max_distance
+        return nx, ny, distances, found
@@ -0,0 +1,129 @@
+"""
+Lazy Theta* 길찾기 엔진
+그리드 셀 중심 사이를 임의의 각도로 잇는 any-angle 경로를 탐색
+결과 경로는 방향이 바뀌는 지점만 담고 있어 별도의 스무딩/웨이포인트 감소가 필요 없음
+"""
+import heapq
+import math
+import time
+from typing import List, Tuple, Optional
+
+from app.core.pathfinding.grid import SearchGrid, SearchStats, get_workspace
+
+
+class LazyThetaStar:
+    """
+    Lazy Theta* 엔진
+
+    A*와 같은 8방향 이웃을 확장하되, 이웃의 부모를 현재 셀의 부모로 바로 연결(경로 2)하고
+    가시선(line of sight) 검사는 셀을 열린 집합에서 꺼낼 때까지 미룬다.
+    꺼낸 셀이 부모를 볼 수 없으면 닫힌 이웃 중 g + 이동 비용이 가장 작은 셀을 부모로 다시 정한다.
+    g 비용은 유클리드 거리이며 휴리스틱도 유클리드 거리를 사용한다.
+
+    가시선은 SearchGrid.has_line_of_sight (모서리 통과 방지 규칙 포함)로 검사하므로,
+    반환된 경로의 각 선분은 장애물 셀을 지나지 않는다.
+    """
+
+    def __init__(self, search_grid: SearchGrid):
+        self.grid = search_grid
+
+    def search(self, start: int, goal: int) -> Tuple[Optional[List[int]], SearchStats]:
+        """
+        Lazy Theta* 탐색
+
+        Returns:
+            (셀 인덱스 웨이포인트 경로 또는 None, 탐색 통계)
+            경로는 연속된 셀이 아니라 서로 가시선이 확보된 꺾임 지점들의 목록
+        """
+        started = time.perf_counter()
+        stats = SearchStats(algorithm='lazy_theta')
+
+        search_grid = self.grid
+        workspace = get_workspace(search_grid.size)
+        g_costs = workspace.g_view
+        parents = workspace.parent_view
+        closed = workspace.closed_view
+        walkable = search_grid.walkable_view
+        neighbors = search_grid.neighbors
+        stride = search_grid.stride
+        line_of_sight = search_grid.has_line_of_sight
+        hypot = math.hypot
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        goal_y, goal_x = divmod(goal, stride)
+        start_y, start_x = divmod(start, stride)
+        start_h = hypot(start_x - goal_x, start_y - goal_y)
+        g_costs[start] = 0.0
+
+        open_set = [(start_h, start_h, 0, start)]
+        counter = 1
+        expansions = 0
+        line_checks = 0
+        path = None
+
+        while open_set:
+            _, _, _, current = heappop(open_set)
+
+            if closed[current]:
+                continue
+
+            # SetVertex: 미뤄둔 가시선 검사 - 부모가 보이지 않으면 닫힌 이웃 중에서 부모 재선택
+            parent = parents[current]
+            if parent >= 0:
+                line_checks += 1
+                if not line_of_sight(parent, current):
+                    best_g = math.inf
+                    best_parent = -1
+                    for offset, move_cost, side_a, side_b in neighbors:
+                        neighbor = current + offset
+                        if not closed[neighbor]:
+                            continue
+                        if side_a and not (walkable[current + side_a] and walkable[current + side_b]):
+                            continue
+                        candidate = g_costs[neighbor] + move_cost
+                        if candidate < best_g:
+                            best_g = candidate
+                            best_parent = neighbor
+                    g_costs[current] = best_g
+                    parents[current] = best_parent
+
+            if current == goal:
+                path = workspace.reconstruct(goal)
+                break
+
+            closed[current] = 1
+            expansions += 1
+
+            # 이웃은 현재 셀의 부모에 바로 연결 (시작 셀은 자기 자신)
+            anchor = parents[current]
+            if anchor < 0:
+                anchor = current
+            anchor_g = g_costs[anchor]
+            anchor_y, anchor_x = divmod(anchor, stride)
+
+            for offset, move_cost, side_a, side_b in neighbors:
+                neighbor = current + offset
+                if not walkable[neighbor] or closed[neighbor]:
+                    continue
+
+                # 대각선 이동 시 벽 모서리 통과 방지
+                if side_a and not (walkable[current + side_a] and walkable[current + side_b]):
+                    continue
+
+                ny, nx = divmod(neighbor, stride)
+                tentative_g = anchor_g + hypot(nx - anchor_x, ny - anchor_y)
+                if tentative_g < g_costs[neighbor]:
+                    g_costs[neighbor] = tentative_g
+                    parents[neighbor] = anchor
+
+                    h = hypot(nx - goal_x, ny - goal_y)
+                    heappush(open_set, (tentative_g + h, h, counter, neighbor))
+                    counter += 1
+
+        stats.expansions = expansions
+        stats.extra = {'line_of_sight_checks': line_checks}
+        stats.elapsed = time.perf_counter() - started
+        if path is not None:
+            stats.path_cost = g_costs[goal]
+        return path, stats
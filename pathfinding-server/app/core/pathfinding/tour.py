@@ -0,0 +1,182 @@
+"""
+경유지 순서 최적화 (TSP 근사)
+보행 거리 행렬 위에서 최근접 이웃으로 초기 순서를 만든 뒤
+2-opt(구간 뒤집기)와 Or-opt(1~3개 지점 구간 이동) 지역 탐색으로 시간 예산 안에서 개선
+"""
+import logging
+import time
+from typing import List, Tuple, Optional, Dict, Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 지역 탐색 기본 시간 예산 (밀리초)
+DEFAULT_TIME_BUDGET_MS = 200
+
+# Or-opt로 옮기는 구간의 최대 길이
+_OR_OPT_MAX_SEGMENT = 3
+
+# 개선으로 인정하는 최소 비용 감소량 (부동소수점 오차로 같은 이동을 반복하지 않도록)
+_EPSILON = 1e-9
+
+
+class TourOptimizer:
+    """
+    거리 행렬 기반 경유지 순서 최적화
+
+    0번 지점이 출발지이며, 도착 조건에 따라 순서의 끝을 고정한다.
+    - 기본: 마지막 지점 자유 (모든 지점과 거리 0인 가상 도착 지점을 끝에 고정)
+    - fixed_end: 마지막 입력 지점을 도착지로 고정
+    - return_to_start: 출발지로 복귀 (출발지를 끝에 한 번 더 고정)
+    이렇게 하면 세 경우 모두 '양 끝이 고정된 경로'가 되어 같은 2-opt/Or-opt 이동을 쓸 수 있다.
+    거리 행렬은 대칭이어야 한다 (격자 이동 그래프는 무방향).
+    """
+
+    def __init__(self, distances: np.ndarray, time_budget_ms: Optional[float] = DEFAULT_TIME_BUDGET_MS):
+        distances = np.asarray(distances, dtype=np.float64)
+        self.count = len(distances)
+        self.time_budget_ms = time_budget_ms
+
+        # 도달 불가(inf) 쌍은 어떤 실제 경로보다 비싼 유한 비용으로 바꿔 지역 탐색이 피하도록 함
+        finite = distances[np.isfinite(distances)]
+        penalty = (finite.max() if finite.size else 0.0) * (self.count + 1) + 1.0
+
+        # 마지막 행/열은 가상 도착 지점 (모든 지점과 거리 0)
+        augmented = np.zeros((self.count + 1, self.count + 1))
+        augmented[:-1, :-1] = np.where(np.isfinite(distances), distances, penalty)
+        self.dummy = self.count
+        self.matrix = augmented.tolist()
+
+    def optimize(self, return_to_start: bool = False,
+                 fixed_end: bool = False) -> Tuple[List[int], Dict[str, Any]]:
+        """
+        방문 순서 최적화
+
+        Returns:
+            (방문 순서 - 0으로 시작하는 지점 인덱스 리스트 (복귀 지점은 포함하지 않음), 최적화 통계)
+        """
+        started = time.perf_counter()
+        deadline = None
+        if self.time_budget_ms is not None:
+            deadline = started + self.time_budget_ms / 1000
+
+        suffix = []
+        if fixed_end and self.count > 1:
+            suffix.append(self.count - 1)
+        suffix.append(0 if return_to_start else self.dummy)
+
+        stops = [i for i in range(1, self.count) if i not in suffix]
+        tour = [0] + self._nearest_neighbor(stops) + suffix
+        greedy_length = self._length(tour)
+
+        moves = {'two_opt': 0, 'or_opt': 0}
+        timed_out = False
+        # 움직일 수 있는 위치: 1 .. last (끝의 고정 지점 제외)
+        last = len(tour) - 1 - len(suffix)
+        if last >= 2:
+            improved = True
+            while improved:
+                if deadline is not None and time.perf_counter() > deadline:
+                    timed_out = True
+                    break
+                improved = self._two_opt(tour, last, moves, deadline)
+                improved = self._or_opt(tour, last, moves, deadline) or improved
+
+        optimized_length = self._length(tour)
+        order = [node for node in tour if node != self.dummy]
+        if return_to_start:
+            order.pop()
+
+        stats = {
+            'greedy_length': greedy_length,
+            'optimized_length': optimized_length,
+            'improvement': greedy_length - optimized_length,
+            'improvement_percent': (greedy_length - optimized_length) / greedy_length * 100 if greedy_length else 0.0,
+            'moves': moves,
+            'timed_out': timed_out,
+            'elapsed': time.perf_counter() - started
+        }
+        return order, stats
+
+    def _nearest_neighbor(self, stops: List[int]) -> List[int]:
+        """출발지에서 가장 가까운 지점을 차례로 방문하는 초기 순서 (같으면 먼저 입력된 지점)"""
+        matrix = self.matrix
+        order = []
+        remaining = set(stops)
+        current = 0
+        while remaining:
+            row = matrix[current]
+            current = min(remaining, key=lambda j: (row[j], j))
+            order.append(current)
+            remaining.remove(current)
+        return order
+
+    def _length(self, tour: List[int]) -> float:
+        """순서의 총 거리 (가상 도착 지점으로 가는 간선은 0)"""
+        matrix = self.matrix
+        return sum(matrix[a][b] for a, b in zip(tour, tour[1:]))
+
+    def _two_opt(self, tour: List[int], last: int, moves: Dict[str, int],
+                 deadline: Optional[float]) -> bool:
+        """
+        2-opt: tour[i..j] 구간을 뒤집어 간선 (a,b),(c,e)를 (a,c),(b,e)로 교체
+        한 바퀴 동안 찾은 개선을 즉시 적용하고, 개선이 있었으면 True
+        """
+        matrix = self.matrix
+        improved = False
+        for i in range(1, last):
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            for j in range(i + 1, last + 1):
+                a, b = tour[i - 1], tour[i]
+                c, e = tour[j], tour[j + 1]
+                delta = matrix[a][c] + matrix[b][e] - matrix[a][b] - matrix[c][e]
+                if delta < -_EPSILON:
+                    tour[i:j + 1] = tour[i:j + 1][::-1]
+                    moves['two_opt'] += 1
+                    improved = True
+        return improved
+
+    def _or_opt(self, tour: List[int], last: int, moves: Dict[str, int],
+                deadline: Optional[float]) -> bool:
+        """
+        Or-opt: 길이 1~3의 연속 구간을 떼어 다른 두 지점 사이에 (필요하면 뒤집어) 삽입
+        개선이 있었으면 True
+        """
+        matrix = self.matrix
+        improved = False
+        for length in range(1, _OR_OPT_MAX_SEGMENT + 1):
+            i = 1
+            while i + length - 1 <= last:
+                if deadline is not None and time.perf_counter() > deadline:
+                    return improved
+
+                first, end = tour[i], tour[i + length - 1]
+                prev, following = tour[i - 1], tour[i + length]
+                removal_gain = matrix[prev][first] + matrix[end][following] - matrix[prev][following]
+
+                rest = tour[:i] + tour[i + length:]
+                best_delta, best_position, best_reversed = -_EPSILON, -1, False
+                # rest[p]와 rest[p+1] 사이에 삽입 (끝의 고정 지점 뒤로는 삽입 불가)
+                for p in range(0, last - length + 1):
+                    if p == i - 1:
+                        continue
+                    u, v = rest[p], rest[p + 1]
+                    base = matrix[u][v]
+                    forward = matrix[u][first] + matrix[end][v] - base - removal_gain
+                    backward = matrix[u][end] + matrix[first][v] - base - removal_gain
+                    if forward < best_delta:
+                        best_delta, best_position, best_reversed = forward, p, False
+                    if backward < best_delta:
+                        best_delta, best_position, best_reversed = backward, p, True
+
+                if best_position >= 0:
+                    segment = tour[i:i + length]
+                    if best_reversed:
+                        segment.reverse()
+                    tour[:] = rest[:best_position + 1] + segment + rest[best_position + 1:]
+                    moves['or_opt'] += 1
+                    improved = True
+                i += 1
+        return improved
@@ -0,0 +1,140 @@
+"""
+셀별 이동 비용 배율을 반영하는 A* 탐색
+회피/선호 영역 오버레이처럼 셀마다 통과 비용이 다른 경우에 사용한다.
+두 셀 사이 이동 비용은 (이동 거리) x (두 셀 비용 배율의 평균)이고,
+휴리스틱은 옥타일 거리에 가장 작은 배율을 곱해 실제 비용을 넘지 않게 한다.
+"""
+import heapq
+import time
+from typing import List, Tuple, Optional
+
+import numpy as np
+
+from app.core.pathfinding.grid import SearchGrid, SearchStats, get_workspace, OCTILE_DIAGONAL_DELTA
+
+
+class CostField:
+    """
+    탐색 그리드와 같은 패딩 인덱스 공간의 셀별 비용 배율
+
+    한 번 만들어 여러 탐색에서 공유한다 (요청마다 패딩 배열을 다시 만들지 않음).
+    지도 크기만큼 메모리를 쓰므로 float32로 보관한다.
+    """
+
+    def __init__(self, costs: np.ndarray):
+        """
+        Args:
+            costs: (높이 x 너비) 비용 배율 배열 (양수)
+        """
+        costs = np.asarray(costs, dtype=np.float32)
+        if costs.ndim != 2 or not np.all(costs > 0):
+            raise ValueError("비용 배율은 양수로 이루어진 2차원 배열이어야 합니다")
+
+        self.height, self.width = costs.shape
+        padded = np.ones((self.height + 2, self.width + 2), dtype=np.float32)
+        padded[1:-1, 1:-1] = costs
+        self.values = padded.ravel()
+        self.view = memoryview(self.values)
+        self.min_cost = float(costs.min())
+
+    def at(self, x: int, y: int) -> float:
+        """그리드 좌표의 비용 배율"""
+        return self.view[(y + 1) * (self.width + 2) + x + 1]
+
+    def matches(self, search_grid: SearchGrid) -> bool:
+        """같은 크기의 그리드에서 만든 비용인지 확인"""
+        return self.height == search_grid.height and self.width == search_grid.width
+
+
+class WeightedAStar:
+    """
+    셀 비용 배율 A*
+
+    이동 규칙과 열린 집합 순서는 AStarPathfinder._astar_search와 같다
+    (대각선 이동은 인접한 두 직선 칸이 모두 통행 가능할 때만 허용, 동일 f에서는 h가 작은 노드 우선).
+    """
+
+    def __init__(self, search_grid: SearchGrid, cost_field: CostField):
+        self.grid = search_grid
+        self.costs = cost_field
+
+    def search(self, start: int, goal: int) -> Tuple[Optional[List[int]], SearchStats]:
+        """
+        비용 배율을 반영한 최소 비용 경로 탐색
+
+        Returns:
+            (셀 인덱스 경로 또는 None, 탐색 통계 - path_cost는 배율을 반영한 비용)
+        """
+        started = time.perf_counter()
+        stats = SearchStats(algorithm='weighted_astar')
+        search_grid = self.grid
+
+        workspace = get_workspace(search_grid.size)
+        g_costs = workspace.g_view
+        parents = workspace.parent_view
+        closed = workspace.closed_view
+        walkable = search_grid.walkable_view
+        neighbors = search_grid.neighbors
+        costs = self.costs.view
+        stride = search_grid.stride
+        octile = search_grid.diagonal_movement
+        diagonal_delta = OCTILE_DIAGONAL_DELTA
+        scale = self.costs.min_cost
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        goal_y, goal_x = divmod(goal, stride)
+        start_h = search_grid.heuristic(start, goal) * scale
+        g_costs[start] = 0.0
+
+        open_set = [(start_h, start_h, 0, start)]
+        counter = 1
+        expansions = 0
+        path = None
+
+        while open_set:
+            _, _, _, current = heappop(open_set)
+            if closed[current]:
+                continue
+
+            if current == goal:
+                path = workspace.reconstruct(goal)
+                break
+
+            closed[current] = 1
+            expansions += 1
+            current_g = g_costs[current]
+            # 두 셀 배율의 평균 = (현재 셀 배율 + 이웃 셀 배율) / 2
+            current_cost = costs[current] * 0.5
+
+            for offset, move_cost, side_a, side_b in neighbors:
+                neighbor = current + offset
+                if not walkable[neighbor] or closed[neighbor]:
+                    continue
+
+                # 대각선 이동 시 벽 모서리 통과 방지
+                if side_a and not (walkable[current + side_a] and walkable[current + side_b]):
+                    continue
+
+                tentative_g = current_g + move_cost * (current_cost + costs[neighbor] * 0.5)
+                if tentative_g < g_costs[neighbor]:
+                    g_costs[neighbor] = tentative_g
+                    parents[neighbor] = current
+
+                    ny, nx = divmod(neighbor, stride)
+                    dx = nx - goal_x if nx > goal_x else goal_x - nx
+                    dy = ny - goal_y if ny > goal_y else goal_y - ny
+                    if octile:
+                        h = (dx + dy + diagonal_delta * (dx if dx < dy else dy)) * scale
+                    else:
+                        h = (dx + dy) * scale
+
+                    heappush(open_set, (tentative_g + h, h, counter, neighbor))
+                    counter += 1
+
+        stats.expansions = expansions
+        stats.elapsed = time.perf_counter() - started
+        stats.extra['min_cost'] = scale
+        if path is not None:
+            stats.path_cost = g_costs[goal]
+        return path, stats
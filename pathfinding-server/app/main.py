@@ -45,6 +45,8 @@ async def lifespan(app: FastAPI):
 
     # 종료 시
     logger.info("서버 종료 중...")
+    if pathfinding.search_executor is not None:
+        pathfinding.search_executor.shutdown()
     await engine.dispose()
 
 
@@ -81,6 +81,9 @@ class PathfindingResponse(BaseModel):
     svg_path: str = Field(..., description="SVG 경로 문자열")
     metadata: PathMetadata
     alternatives: Optional[List['PathfindingResponse']] = None
+    search_stats: Optional[Dict[str, Any]] = Field(
+        None, description="탐색 통계 (알고리즘, 확장 노드 수, ARA* 준최적 한계 suboptimality_bound 등)"
+    )
     cached: bool = False
     processing_time: float
 
@@ -88,12 +91,54 @@ class PathfindingResponse(BaseModel):
 class MultiPathfindingRequest(BaseModel):
     """다중 경로 요청 (여러 경유지)"""
     map_id: str
-    points: List[Tuple[float, float]] = Field(..., min_length=2, description="방문할 지점들")
+    points: List[Tuple[float, float]] = Field(..., min_length=2, max_length=100, description="방문할 지점들")
     optimize_order: bool = Field(False, description="최적 순서로 재정렬")
     return_to_start: bool = Field(False, description="시작점으로 복귀")
+    fixed_end: bool = Field(False, description="마지막 지점을 도착지로 고정 (순서 최적화 시)")
     options: Optional[Dict[str, Any]] = Field(default_factory=dict)
 
 
+class BatchRoutePair(BaseModel):
+    """배치 길찾기의 출발지/목적지 쌍"""
+    start: Tuple[float, float] = Field(..., description="시작 좌표 (정규화된 0-1)")
+    end: Tuple[float, float] = Field(..., description="종료 좌표 (정규화된 0-1)")
+    id: Optional[str] = Field(None, description="결과와 짝을 맞추기 위한 호출자 지정 ID")
+
+
+class BatchRouteRequest(BaseModel):
+    """한 지도의 여러 출발지/목적지 쌍 길찾기 요청"""
+    map_id: str = Field(..., description="지도 ID")
+    pairs: List[BatchRoutePair] = Field(..., min_length=1, max_length=1000, description="출발지/목적지 쌍 리스트")
+    options: Optional[Dict[str, Any]] = Field(default_factory=dict)
+
+
+class RouteMatrixRequest(BaseModel):
+    """다대다 보행 거리 행렬 요청"""
+    map_id: str = Field(..., description="지도 ID")
+    points: List[Tuple[float, float]] = Field(..., min_length=2, max_length=100, description="지점 리스트 (정규화된 좌표 0-1)")
+    return_paths: bool = Field(False, description="지점 쌍별 경로 포함 여부")
+
+
+class IsochroneRequest(BaseModel):
+    """도달 가능 영역(isochrone) 요청"""
+    map_id: str = Field(..., description="지도 ID")
+    start: Tuple[float, float] = Field(..., description="출발 좌표 (정규화된 0-1)")
+    bands_minutes: List[float] = Field(
+        default_factory=lambda: [1.0, 3.0, 5.0], min_length=1, max_length=10,
+        description="도보 시간 구간 (분)"
+    )
+
+
+class NearestPOIRequest(BaseModel):
+    """가장 가까운 POI 탐색 요청"""
+    map_id: str = Field(..., description="지도 ID")
+    start: Tuple[float, float] = Field(..., description="출발 좌표 (정규화된 0-1)")
+    category: Optional[str] = Field(None, description="POI 분류 (없으면 모든 POI)")
+    k: int = Field(3, ge=1, le=10, description="찾을 POI 수")
+    include_entrances: bool = Field(False, description="전처리에서 감지한 출입구도 후보에 포함")
+    options: Optional[Dict[str, Any]] = Field(default_factory=dict, description="경로 최적화 옵션")
+
+
 class ValidatePointRequest(BaseModel):
     """좌표 검증 및 보정 요청"""
     map_id: str = Field(..., description="지도 ID")
@@ -109,6 +154,42 @@ class ValidatePointResponse(BaseModel):
     adjustment_distance: Optional[float] = Field(None, description="보정 거리 (픽셀)")
 
 
+class ValidatePointsRequest(BaseModel):
+    """여러 좌표 일괄 검증 및 보정 요청"""
+    map_id: str = Field(..., description="지도 ID")
+    points: List[Tuple[float, float]] = Field(..., min_length=1, description="검증할 좌표 리스트 (정규화된 0-1)")
+
+
+class ValidatedPoint(BaseModel):
+    """일괄 검증 결과 항목 (보정할 지점을 찾지 못하면 adjusted_point는 None)"""
+    is_valid: bool
+    original_point: Tuple[float, float]
+    adjusted_point: Optional[Tuple[float, float]] = None
+    was_adjusted: bool
+    adjustment_distance: Optional[float] = None
+
+
+class ValidatePointsResponse(BaseModel):
+    """여러 좌표 일괄 검증 및 보정 응답"""
+    results: List[ValidatedPoint]
+
+
+class POIRegisterRequest(BaseModel):
+    """POI(자주 찾는 목적지) 등록 요청"""
+    map_id: str = Field(..., description="지도 ID")
+    name: str = Field(..., description="POI 이름")
+    position: Tuple[float, float] = Field(..., description="POI 위치 (정규화된 좌표 0-1)")
+    category: Optional[str] = Field(None, description="분류 (상점, 출구, 화장실 등)")
+
+
+class POIResponse(BaseModel):
+    """등록된 POI"""
+    id: str
+    name: str
+    position: Tuple[float, float]
+    category: Optional[str] = None
+
+
 # ===== 장애물/편집 관련 스키마 =====
 class ObstacleUpdate(BaseModel):
     """장애물 업데이트"""
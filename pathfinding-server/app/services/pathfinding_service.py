@@ -2,26 +2,82 @@
 길찾기 서비스 레이어
 A* 알고리즘과 경로 최적화를 통합하여 실제 길찾기 기능 제공
 """
+import asyncio
 import json
+import threading
 import time
 import hashlib
-import math
-from typing import List, Tuple, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Tuple, Optional, Dict, Any, AsyncIterator
 from pathlib import Path
 import numpy as np
 import logging
 from datetime import datetime
 import uuid
 
-from app.core.pathfinding.astar import AStarPathfinder
+from app.core.pathfinding.astar import AStarPathfinder, Point, ANY_ANGLE_ALGORITHMS
+from app.core.pathfinding.grid import SearchGrid, SearchStats
 from app.core.pathfinding.optimizer import PathOptimizer
+from app.core.pathfinding.hpa import HierarchicalGraph
+from app.core.pathfinding.components import ComponentIndex
+from app.core.pathfinding.asset_store import MapAssetStore, StoredMapAssets
+from app.core.pathfinding.snapping import SnapIndex
+from app.core.pathfinding.alt import LandmarkTable, landmarks_directory
+from app.core.pathfinding.flowfield import FlowField, flow_fields_directory, goal_cell
+from app.core.pathfinding.matrix import RouteMatrix
+from app.core.pathfinding.tour import TourOptimizer, DEFAULT_TIME_BUDGET_MS
+from app.core.pathfinding.isochrone import IsochroneEngine, WALKING_SPEED_MPS
+from app.core.pathfinding.nearest import NearestGoalSearch
+from app.core.pathfinding.overlay import CostOverlay, overlay_key
+from app.core.pathfinding.clearance import ClearanceField
+from app.core.pathfinding.weighted import CostField
+from app.core.pathfinding.profiles import DEFAULT_PROFILE
 from app.models.database import Map, PreprocessedMapData, PathfindingRequest
 from app.models.enums import PathDifficulty
+from app.services.search_executor import SearchExecutor, SearchQueueFullError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import defer
 
 logger = logging.getLogger(__name__)
 
+# 배치 길찾기에서 동시에 실행하는 탐색 수 (탐색 대기열을 배치 하나가 채우지 않도록)
+BATCH_CONCURRENCY = 8
+
+# 가장 가까운 POI 탐색에서 전처리로 감지한 출입구 후보의 분류
+ENTRANCE_CATEGORY = 'entrance'
+
+# 보관하는 회피/선호 영역 오버레이 수 (지도 크기의 배열을 담으므로 오래된 것부터 제거)
+OVERLAY_CACHE_SIZE = 32
+
+# 보관하는 도달 가능 영역 결과 수 (출발 셀/시간 구간을 요청마다 고를 수 있어 가장 오래 쓰지 않은 것부터 제거)
+ISOCHRONE_CACHE_SIZE = 256
+
+
+@dataclass
+class RouteAssets:
+    """
+    경로 탐색에 필요한 지도별 데이터 (요청마다 한 번만 로드해 모든 구간이 공유)
+    DB 객체를 담지 않으므로 탐색 워커 프로세스에서도 지도 배열 저장소의 메모리 맵으로 복원할 수 있다.
+    """
+    map_id: str
+    scale_meters_per_pixel: float
+    preprocessed_id: str
+    grid: np.ndarray
+    hierarchy: Optional[HierarchicalGraph]
+    landmarks: Optional[LandmarkTable]
+    components: ComponentIndex
+    snap_index: SnapIndex
+    clearance: ClearanceField
+    flow_fields: Dict[Tuple[int, int], FlowField]
+    profile: str = DEFAULT_PROFILE  # 접근성 프로필 (grid/components/snap_index는 프로필의 침식 그리드 기준)
+
+    @property
+    def asset_key(self) -> Tuple[str, str]:
+        """그리드 기준 캐시 키 (프로필마다 그리드가 다르므로 전처리 데이터 ID와 프로필을 함께 사용)"""
+        return self.preprocessed_id, self.profile
+
 
 class PathfindingService:
     """
@@ -29,11 +85,40 @@ class PathfindingService:
     전처리된 지도 데이터를 사용하여 최적 경로를 찾고 반환
     """
 
-    def __init__(self, storage_path: str = "./storage"):
+    def __init__(self, storage_path: str = "./storage", max_workers: Optional[int] = None,
+                 search_executor: Optional[SearchExecutor] = None,
+                 profiles: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            profiles: 지도 배열 저장소를 새로 만들 때 함께 만들 접근성 프로필 -> 최소 통로 폭 (그리드 셀)
+        """
         self.storage_path = Path(storage_path)
+        # 탐색을 이벤트 루프 밖에서 실행 - 프로세스 풀 실행기가 없으면 스레드 풀 사용
+        # (탐색 버퍼는 스레드별로 분리됨)
+        self.search_executor = search_executor
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="route")
         self.astar = AStarPathfinder(diagonal_movement=True, smooth_path=True)
         self.optimizer = PathOptimizer()
         self.cache = {}  # 간단한 메모리 캐시 (실제로는 Redis 사용 권장)
+        # 지도 ID -> 현재 전처리 데이터 ID (재전처리되면 이전 ID의 캐시를 삭제)
+        self.preprocessed_ids: Dict[str, str] = {}
+        self.hierarchies: Dict[str, HierarchicalGraph] = {}  # 전처리 데이터 ID -> HPA* 추상 그래프
+        # 그리드/연결 영역/최근접 지점 인덱스는 워커 간에 공유되는 메모리 맵 파일로 보관
+        self.asset_store = MapAssetStore(storage_path, profiles)
+        self.stored_assets: Dict[str, StoredMapAssets] = {}  # 전처리 데이터 ID -> 메모리 맵 지도 배열
+        # (전처리 데이터 ID, 프로필) -> 접근성 프로필의 메모리 맵 침식 그리드 (처음 요청할 때 로드)
+        self.profile_assets: Dict[Tuple[str, str], StoredMapAssets] = {}
+        self.landmarks: Dict[str, Optional[LandmarkTable]] = {}  # 전처리 데이터 ID -> ALT 랜드마크 테이블
+        self.flow_fields: Dict[str, Dict[Tuple[int, int], FlowField]] = {}  # 전처리 데이터 ID -> 목적지 셀 -> POI 흐름장
+        # (전처리 데이터 ID, 프로필) -> 보행 거리 행렬 엔진 (이동 그래프 재사용)
+        self.route_matrices: Dict[Tuple[str, str], RouteMatrix] = {}
+        # ((전처리 데이터 ID, 프로필), 출발 셀, 시간 구간) -> 도달 가능 영역
+        self.isochrones: Dict[Tuple[Tuple[str, str], Tuple[int, int], Tuple[float, ...]], Dict[str, Any]] = {}
+        self.isochrone_lock = threading.Lock()
+        # ((전처리 데이터 ID, 프로필), 영역 해시, 벽 간격 비용 여부) -> 회피/선호 영역 오버레이 (워커 스레드들이 공유)
+        self.overlays: Dict[Tuple[Tuple[str, str], str, bool], CostOverlay] = {}
+        self.overlay_lock = threading.Lock()
+        self.clearance_costs: Dict[str, CostField] = {}  # 전처리 데이터 ID -> 벽 간격 비용 배율 (가중치 A*용)
 
     async def find_route(self, db: AsyncSession, map_id: str,
                         start: Tuple[float, float], end: Tuple[float, float],
@@ -65,69 +150,12 @@ class PathfindingService:
             return cached_result
 
         try:
-            # 지도 정보 조회
-            map_data = await self._get_map_data(db, map_id)
-            if not map_data:
-                raise ValueError(f"지도를 찾을 수 없습니다: {map_id}")
-
-            # 전처리된 데이터 조회
-            preprocessed_data = await self._get_preprocessed_data(db, map_id)
-            if not preprocessed_data:
-                raise ValueError(f"전처리된 데이터를 찾을 수 없습니다: {map_id}")
-
-            # 그리드 데이터 로드
-            grid = await self._load_grid_data(preprocessed_data)
-            if grid is None:
-                raise ValueError(f"그리드 데이터를 로드할 수 없습니다: {map_id}")
+            assets = await self._load_route_assets(db, map_id, options.get('profile'))
+            result = await self._run_solver(assets, start, end, options)
+            if not result['success']:
+                return result
 
-            # A* 알고리즘으로 경로 찾기
-            raw_path = self.astar.find_path(grid, start, end)
-            if raw_path is None:
-                return {
-                    'success': False,
-                    'error': '경로를 찾을 수 없습니다',
-                    'start': start,
-                    'end': end,
-                    'map_id': map_id
-                }
-
-            # 경로 최적화
-            optimized = self.optimizer.optimize_path(raw_path, options)
-
-            # 실제 거리 계산 (미터 단위)
-            pixel_distance = optimized['distance'] * max(grid.shape)
-            real_distance = pixel_distance * map_data.scale_meters_per_pixel
-
-            # 예상 시간 계산 (보행 속도 5km/h 기준)
-            walking_speed = 5000 / 3600  # m/s
-            estimated_time = real_distance / walking_speed
-
-            # 난이도 계산
-            difficulty = self._calculate_difficulty(optimized, real_distance)
-
-            # 처리 시간
-            processing_time = time.time() - start_time
-
-            # 결과 생성
-            result = {
-                'success': True,
-                'path_id': str(uuid.uuid4()),
-                'map_id': map_id,
-                'start': start,
-                'end': end,
-                'polyline': optimized['smooth_path'],
-                'waypoints': optimized['waypoints'],
-                'svg_path': optimized['svg_path'],
-                'distance_pixels': pixel_distance,
-                'distance_meters': real_distance,
-                'estimated_time_seconds': estimated_time,
-                'difficulty': difficulty,
-                'accessibility_score': self._calculate_accessibility_score(optimized),
-                'turn_count': len(optimized['waypoints']) - 2 if len(optimized['waypoints']) > 2 else 0,
-                'processing_time': processing_time,
-                'cached': False,
-                'optimization_stats': optimized['optimization_stats']
-            }
+            result['processing_time'] = time.time() - start_time
 
             # 결과를 데이터베이스에 저장
             await self._save_pathfinding_request(db, result)
@@ -137,6 +165,8 @@ class PathfindingService:
 
             return result
 
+        except SearchQueueFullError:
+            raise
         except Exception as e:
             logger.error(f"경로 찾기 실패: {e}")
             return {
@@ -148,17 +178,222 @@ class PathfindingService:
                 'processing_time': time.time() - start_time
             }
 
+    async def _load_route_assets(self, db: AsyncSession, map_id: str,
+                                 profile: Optional[str] = None) -> RouteAssets:
+        """
+        지도/전처리 데이터 조회와 그리드·보조 인덱스 로드 (실패 시 ValueError)
+
+        접근성 프로필을 지정하면 그리드/연결 영역/최근접 지점 인덱스를 프로필의 침식 그리드 것으로 바꾸고,
+        원본 그리드로 만든 HPA* 추상 그래프와 POI 흐름장은 쓰지 않는다.
+        ALT 랜드마크 거리는 침식 그리드에서도 실제 거리 이하이므로 그대로 사용한다.
+        """
+        profile = profile or DEFAULT_PROFILE
+        # 지도 정보 조회
+        map_data = await self._get_map_data(db, map_id)
+        if not map_data:
+            raise ValueError(f"지도를 찾을 수 없습니다: {map_id}")
+
+        # 전처리된 데이터 조회
+        preprocessed_data = await self._get_preprocessed_data(db, map_id)
+        if not preprocessed_data:
+            raise ValueError(f"전처리된 데이터를 찾을 수 없습니다: {map_id}")
+
+        # 그리드와 보조 인덱스 (메모리 맵)
+        stored = await self._load_stored_assets(db, preprocessed_data)
+        grid = stored.grid
+
+        if profile != DEFAULT_PROFILE:
+            profiled = self._load_profile_assets(preprocessed_data, profile)
+            return RouteAssets(
+                map_id=map_id,
+                scale_meters_per_pixel=map_data.scale_meters_per_pixel,
+                preprocessed_id=preprocessed_data.id,
+                grid=profiled.grid,
+                hierarchy=None,
+                landmarks=self._load_landmarks(preprocessed_data, grid),
+                components=profiled.components,
+                snap_index=profiled.snap_index,
+                clearance=stored.clearance,
+                flow_fields={},
+                profile=profile
+            )
+
+        return RouteAssets(
+            map_id=map_id,
+            scale_meters_per_pixel=map_data.scale_meters_per_pixel,
+            preprocessed_id=preprocessed_data.id,
+            grid=grid,
+            hierarchy=await self._load_hierarchy(db, preprocessed_data, grid),
+            landmarks=self._load_landmarks(preprocessed_data, grid),
+            components=stored.components,
+            snap_index=stored.snap_index,
+            clearance=stored.clearance,
+            flow_fields=self._load_flow_fields(preprocessed_data, grid)
+        )
+
+    async def _run_solver(self, assets: RouteAssets, start: Tuple[float, float],
+                          end: Tuple[float, float], options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        _solve_route를 이벤트 루프 밖에서 실행 (프로세스 풀, 없으면 스레드 풀)
+        POI 흐름장은 요청 프로세스에만 있으므로 흐름장 목적지는 스레드 풀에서 처리한다
+        (출발지 보정 결과 등으로 A*와 스무딩으로 대체되어도 이벤트 루프를 막지 않음)
+        """
+        loop = asyncio.get_running_loop()
+        if (options.get('algorithm') in (None, 'flow_field') and not self._has_route_costs(options)
+                and self._match_flow_field(assets, end) is not None):
+            return await loop.run_in_executor(self.executor, self._solve_route, assets, start, end, options)
+
+        if self.search_executor is not None:
+            return await self.search_executor.solve_route(assets, start, end, options)
+
+        return await loop.run_in_executor(self.executor, self._solve_route, assets, start, end, options)
+
+    async def _run_search(self, method, assets: RouteAssets, *args) -> Any:
+        """
+        assets를 첫 인자로 받는 탐색 메서드를 이벤트 루프 밖에서 실행
+        (공유 출발지 최단 경로 트리, 대체 경로, 가까운 POI, 도달 가능 영역)
+        프로세스 풀 실행기가 있으면 워커 프로세스에서 GIL 없이 병렬로, 없으면 스레드 풀에서 실행
+
+        Raises:
+            SearchQueueFullError: 프로세스 풀의 실행/대기 요청이 가득 참
+        """
+        if self.search_executor is not None:
+            return await self.search_executor.run(assets, method.__name__, *args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, method, assets, *args)
+
+    def _solve_route(self, assets: RouteAssets, start: Tuple[float, float],
+                     end: Tuple[float, float], options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        로드된 지도 데이터로 한 구간의 경로 탐색 + 최적화 (DB 접근 없음 - 워커 스레드에서 실행 가능)
+
+        Returns:
+            경로 정보 딕셔너리 (실패 시 success=False와 error)
+        """
+        solve_started = time.time()
+        map_id = assets.map_id
+        grid = assets.grid
+
+        if self._has_route_costs(options) and (options.get('algorithm') == 'ara' or options.get('time_budget_ms')):
+            # 셀 비용 배율이 있으면 가중치 A*만 사용하므로 시간 예산을 지킬 수 없음
+            raise ValueError("시간 예산 탐색(ara, time_budget_ms)은 회피/선호 영역, prefer_clearance와 함께 쓸 수 없습니다")
+
+        # 경로 찾기 (options.algorithm 으로 'astar', 'jps' 등 선택 가능)
+        # 지정하지 않으면 최적 경로를 보장하는 엔진 - 랜드마크 테이블이 있으면 'alt', 없으면 'astar'
+        # (HPA*는 준최적 경로를 반환하므로 algorithm='hpa'로 지정한 경우에만 사용)
+        # time_budget_ms만 지정된 경우 ARA*로 예산 내 준최적 경로 탐색
+        # 목적지가 등록된 POI면 탐색 없이 POI 흐름장을 따라감 ('flow_field')
+        # 회피/선호 영역(avoid_areas, prefer_areas)이 있으면 래스터화한 오버레이를 반영해 탐색하고,
+        # prefer_clearance면 벽 간격 비용으로 복도 가운데를 따라가는 가중치 A* 사용
+        overlay = self._route_overlay(assets, options)
+        cost_field = self._route_cost_field(assets, overlay, options)
+        flow_field = None
+        if options.get('algorithm') in (None, 'flow_field') and not self._has_route_costs(options):
+            flow_field = self._match_flow_field(assets, end)
+        algorithm = options.get('algorithm') or (
+            'flow_field' if flow_field is not None
+            else 'astar' if self._has_route_costs(options)
+            else self._default_algorithm(options, assets.landmarks)
+        )
+        raw_path, search_stats = self.astar.search(
+            grid, start, end, algorithm,
+            components=assets.components,
+            snap_index=assets.snap_index,
+            time_budget_ms=options.get('time_budget_ms'),
+            search_until_first_solution=options.get('search_until_first_solution', False),
+            hierarchy=assets.hierarchy,
+            landmarks=assets.landmarks,
+            flow_field=flow_field,
+            overlay=overlay,
+            cost_field=cost_field
+        )
+        if raw_path is None:
+            return self._search_failure(map_id, start, end, search_stats)
+
+        result = self._build_route_result(
+            assets, start, end, raw_path, options,
+            reduce_waypoints=algorithm not in ANY_ANGLE_ALGORITHMS,
+            grid=overlay.grid if overlay is not None else None
+        )
+        result['processing_time'] = time.time() - solve_started
+        result['search_stats'] = search_stats.to_dict()
+        return result
+
+    def _search_failure(self, map_id: str, start: Tuple[float, float], end: Tuple[float, float],
+                        search_stats: Optional[SearchStats]) -> Dict[str, Any]:
+        """경로를 찾지 못한 경우의 결과 딕셔너리 (탐색 통계로 원인 구분)"""
+        extra = search_stats.extra if search_stats is not None else {}
+        if extra.get('unreachable'):
+            error = '출발지와 목적지가 서로 연결되지 않은 구역에 있습니다'
+        elif extra.get('timed_out'):
+            error = '시간 예산 내에 경로를 찾지 못했습니다'
+        else:
+            error = '경로를 찾을 수 없습니다'
+        return {
+            'success': False,
+            'error': error,
+            'start': start,
+            'end': end,
+            'map_id': map_id,
+            'search_stats': search_stats.to_dict() if search_stats else None
+        }
+
+    def _build_route_result(self, assets: RouteAssets, start: Tuple[float, float],
+                            end: Tuple[float, float], raw_path: List[Tuple[float, float]],
+                            options: Dict[str, Any], reduce_waypoints: bool = True,
+                            grid: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        탐색한 경로(정규화된 좌표)를 최적화해 거리·시간·난이도와 함께 경로 정보 딕셔너리로 구성
+        grid가 주어지면 (통행 금지 영역을 지운 그리드) 스무딩 충돌 검사에 사용
+        """
+        grid = grid if grid is not None else assets.grid
+
+        # 경로 최적화 (any-angle 경로는 이미 꺾임 지점만 남아 있으므로 웨이포인트 감소 생략)
+        optimized = self.optimizer.optimize_path(raw_path, options, reduce_waypoints=reduce_waypoints, grid=grid)
+
+        # 실제 거리 계산 (미터 단위)
+        pixel_distance = optimized['distance'] * max(grid.shape)
+        real_distance = pixel_distance * assets.scale_meters_per_pixel
+
+        # 예상 시간 계산 (보행 속도 5km/h 기준)
+        estimated_time = real_distance / WALKING_SPEED_MPS
+
+        # 난이도 계산
+        difficulty = self._calculate_difficulty(optimized, real_distance)
+
+        return {
+            'success': True,
+            'path_id': str(uuid.uuid4()),
+            'map_id': assets.map_id,
+            'start': start,
+            'end': end,
+            'polyline': optimized['smooth_path'],
+            'waypoints': optimized['waypoints'],
+            'svg_path': optimized['svg_path'],
+            'distance_pixels': pixel_distance,
+            'distance_meters': real_distance,
+            'estimated_time_seconds': estimated_time,
+            'difficulty': difficulty,
+            'accessibility_score': self._calculate_accessibility_score(optimized),
+            'turn_count': len(optimized['waypoints']) - 2 if len(optimized['waypoints']) > 2 else 0,
+            'cached': False,
+            'optimization_stats': optimized['optimization_stats']
+        }
+
     async def find_multi_route(self, db: AsyncSession, map_id: str,
                              points: List[Tuple[float, float]],
                              options: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         여러 지점을 경유하는 경로 찾기
 
+        지도 데이터는 한 번만 로드해 모든 구간이 공유하고, 구간들은 워커 풀에서 동시에 탐색한다.
+        길찾기 기록은 전체 경로에 대해 한 건만 저장한다.
+
         Args:
             db: 데이터베이스 세션
             map_id: 지도 ID
             points: 경유할 지점들 (정규화된 좌표)
-            options: 추가 옵션 (optimize_order, return_to_start 등)
+            options: 추가 옵션 (optimize_order, return_to_start, fixed_end, order_time_budget_ms 등)
 
         Returns:
             다중 경로 정보
@@ -172,24 +407,35 @@ class PathfindingService:
         options = options or {}
         start_time = time.time()
 
+        try:
+            assets = await self._load_route_assets(db, map_id, options.get('profile'))
+        except ValueError as e:
+            logger.error(f"다중 경로 찾기 실패: {e}")
+            return {'success': False, 'error': str(e), 'map_id': map_id}
+
         # 순서 최적화 여부
-        if options.get('optimize_order', False) and len(points) > 3:
-            points = await self._optimize_waypoint_order(db, map_id, points)
+        order_stats = None
+        if options.get('optimize_order', False) and len(points) > 2:
+            # 지점마다 전체 지도 Dijkstra + 지역 탐색 시간 예산만큼 CPU를 쓰므로 이벤트 루프 밖에서 실행
+            loop = asyncio.get_running_loop()
+            points, order_stats = await loop.run_in_executor(
+                self.executor, self._optimize_waypoint_order, assets, points,
+                options.get('return_to_start', False),
+                options.get('fixed_end', False),
+                options.get('order_time_budget_ms', DEFAULT_TIME_BUDGET_MS)
+            )
 
         # 시작점으로 복귀 여부
         if options.get('return_to_start', False):
-            points.append(points[0])
+            points = [*points, points[0]]
 
-        # 각 구간별 경로 찾기
-        segments = []
-        total_distance = 0
-        total_time = 0
-
-        for i in range(len(points) - 1):
-            segment_result = await self.find_route(
-                db, map_id, points[i], points[i + 1], options
-            )
+        # 각 구간별 경로를 워커 풀에서 동시에 탐색
+        segment_results = await asyncio.gather(*(
+            self._solve_segment(assets, points[i], points[i + 1], options)
+            for i in range(len(points) - 1)
+        ))
 
+        for i, segment_result in enumerate(segment_results):
             if not segment_result.get('success'):
                 return {
                     'success': False,
@@ -199,114 +445,279 @@ class PathfindingService:
                     'end': points[i + 1]
                 }
 
-            segments.append({
+        segments = [
+            {
                 'segment_index': i,
                 'start': points[i],
                 'end': points[i + 1],
                 'polyline': segment_result['polyline'],
                 'distance': segment_result['distance_meters'],
-                'time': segment_result['estimated_time_seconds']
-            })
-
-            total_distance += segment_result['distance_meters']
-            total_time += segment_result['estimated_time_seconds']
-
-        # 전체 경로 결합
-        combined_polyline = []
-        for segment in segments:
-            if combined_polyline and segment['polyline']:
-                # 중복 점 제거
-                if combined_polyline[-1] == segment['polyline'][0]:
-                    combined_polyline.extend(segment['polyline'][1:])
-                else:
-                    combined_polyline.extend(segment['polyline'])
-            else:
-                combined_polyline.extend(segment['polyline'])
-
-        return {
+                'time': segment_result['estimated_time_seconds'],
+                'search_stats': segment_result.get('search_stats')
+            }
+            for i, segment_result in enumerate(segment_results)
+        ]
+
+        # 전체 경로 결합 (구간 경계의 중복 점 제거 후 배열 연결)
+        polylines = [np.asarray(r['polyline'], dtype=np.float64).reshape(-1, 2) for r in segment_results]
+        parts = [polylines[0]]
+        for previous, polyline in zip(polylines, polylines[1:]):
+            duplicated = len(previous) and len(polyline) and np.array_equal(previous[-1], polyline[0])
+            parts.append(polyline[1:] if duplicated else polyline)
+        combined_polyline = np.concatenate(parts)
+
+        distances = np.array([[r['distance_pixels'], r['distance_meters'], r['estimated_time_seconds']]
+                              for r in segment_results])
+        total_pixels, total_distance, total_time = distances.sum(axis=0).tolist()
+
+        result = {
             'success': True,
             'path_id': str(uuid.uuid4()),
             'map_id': map_id,
             'points': points,
             'segments': segments,
-            'combined_polyline': combined_polyline,
+            'combined_polyline': combined_polyline.tolist(),
+            'total_distance_pixels': total_pixels,
             'total_distance_meters': total_distance,
             'total_time_seconds': total_time,
             'segment_count': len(segments),
+            'order_optimization': order_stats,
+            'processing_time': time.time() - start_time
+        }
+
+        # 전체 경로를 한 건의 길찾기 기록으로 저장
+        await self._save_pathfinding_request(
+            db,
+            {
+                **result,
+                'start': points[0],
+                'end': points[-1],
+                'polyline': result['combined_polyline'],
+                'distance_pixels': total_pixels,
+                'distance_meters': total_distance
+            },
+            waypoints=points[1:-1],
+            options=options
+        )
+
+        return result
+
+    async def _solve_segment(self, assets: RouteAssets, start: Tuple[float, float],
+                             end: Tuple[float, float], options: Dict[str, Any]) -> Dict[str, Any]:
+        """다중 경로의 한 구간 - 캐시에 없으면 워커 풀에서 탐색"""
+        cache_key = self._generate_cache_key(assets.map_id, start, end, options)
+        if cache_key in self.cache and options.get('use_cache', True):
+            return self.cache[cache_key]
+
+        try:
+            result = await self._run_solver(assets, start, end, options)
+        except SearchQueueFullError:
+            raise
+        except Exception as e:
+            logger.error(f"구간 경로 찾기 실패: {e}")
+            return {'success': False, 'error': str(e), 'start': start, 'end': end}
+
+        if result['success']:
+            self.cache[cache_key] = result.copy()
+        return result
+
+    async def find_route_batch(self, db: AsyncSession, map_id: str,
+                               pairs: List[Dict[str, Any]],
+                               options: Dict[str, Any] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        한 지도의 여러 출발지/목적지 쌍 경로를 완료되는 순서대로 반환하는 비동기 이터레이터 생성
+
+        지도 데이터는 한 번만 로드하고(실패 시 여기서 ValueError - 스트림 시작 전),
+        출발 셀이 같은 쌍들은 Dijkstra 최단 경로 트리 하나로 함께 풀며,
+        나머지는 단일 경로 탐색과 같은 방식(캐시 -> 탐색 실행기)으로 동시에 탐색한다.
+        개별 경로는 길찾기 기록에 저장하지 않는다.
+
+        Args:
+            pairs: {'start': (x, y), 'end': (x, y), 'id': 선택} 리스트 (정규화된 좌표)
+
+        Returns:
+            경로 결과 딕셔너리(index, id 포함)를 완료 순서대로 내보내고
+            마지막에 요약(summary=True)을 내보내는 비동기 이터레이터
+        """
+        options = options or {}
+        assets = await self._load_route_assets(db, map_id, options.get('profile'))
+        return self._stream_route_batch(assets, pairs, options)
+
+    async def _stream_route_batch(self, assets: RouteAssets, pairs: List[Dict[str, Any]],
+                                  options: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        start_time = time.time()
+        limiter = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        # 보정된 출발 셀별로 묶기 (보정 실패/연결 불가 쌍은 단일 탐색에서 오류로 처리)
+        # 최단 경로 트리는 원본 그리드와 균일 비용으로 풀기 때문에 셀 비용 옵션이 있으면 모두 단일 탐색
+        groups: Dict[Tuple[int, int], List[Tuple[int, Tuple[int, int]]]] = {}
+        singles: List[int] = []
+        costs_requested = self._has_route_costs(options)
+        for i, pair in enumerate(pairs):
+            if costs_requested:
+                singles.append(i)
+                continue
+            endpoints, _ = self.astar._resolve_endpoints(
+                assets.grid, pair['start'], pair['end'], 'astar', assets.components, assets.snap_index
+            )
+            if endpoints is None:
+                singles.append(i)
+            else:
+                groups.setdefault(endpoints[0].to_tuple(), []).append((i, endpoints[1].to_tuple()))
+        trees = {source: members for source, members in groups.items() if len(members) > 1}
+        singles.extend(members[0][0] for members in groups.values() if len(members) == 1)
+
+        async def solve_tree(source: Tuple[int, int], members: List[Tuple[int, Tuple[int, int]]]):
+            tree_members = [(i, pairs[i]['start'], pairs[i]['end'], target) for i, target in members]
+            async with limiter:
+                try:
+                    return await self._run_search(self._solve_shared_source, assets, source, tree_members, options)
+                except SearchQueueFullError as e:
+                    return [(i, {'success': False, 'error': str(e), 'start': start, 'end': end})
+                            for i, start, end, _ in tree_members]
+
+        async def solve_single(i: int):
+            start, end = pairs[i]['start'], pairs[i]['end']
+            async with limiter:
+                try:
+                    return [(i, await self._solve_segment(assets, start, end, options))]
+                except SearchQueueFullError as e:
+                    return [(i, {'success': False, 'error': str(e), 'start': start, 'end': end})]
+
+        tasks = [asyncio.ensure_future(solve_tree(source, members)) for source, members in trees.items()]
+        tasks.extend(asyncio.ensure_future(solve_single(i)) for i in singles)
+
+        succeeded = 0
+        try:
+            for finished in asyncio.as_completed(tasks):
+                for i, result in await finished:
+                    succeeded += bool(result.get('success'))
+                    yield {'index': i, 'id': pairs[i].get('id'), **result}
+        finally:
+            # 클라이언트가 연결을 끊으면 남은 탐색 취소
+            for task in tasks:
+                task.cancel()
+
+        yield {
+            'summary': True,
+            'map_id': assets.map_id,
+            'count': len(pairs),
+            'succeeded': succeeded,
+            'failed': len(pairs) - succeeded,
+            'shared_source_trees': len(trees),
+            'single_searches': len(singles),
             'processing_time': time.time() - start_time
         }
 
+    def _solve_shared_source(self, assets: RouteAssets, source: Tuple[int, int],
+                             members: List[Tuple[int, Tuple[float, float], Tuple[float, float], Tuple[int, int]]],
+                             options: Dict[str, Any]) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        출발 셀이 같은 쌍들을 최단 경로 트리 하나로 풀기 (DB 접근 없음 - 워커 스레드에서 실행)
+
+        Args:
+            source: 보정된 출발 셀 (x, y)
+            members: (쌍 인덱스, 출발 좌표, 도착 좌표, 보정된 도착 셀) 리스트
+
+        Returns:
+            (쌍 인덱스, 경로 정보 딕셔너리) 리스트
+        """
+        solve_started = time.time()
+        engine = self._route_matrix_engine(assets.asset_key, assets.grid)
+        costs, cell_paths = engine.paths_from(source, [target for *_, target in members])
+        search_stats = SearchStats(
+            algorithm='dijkstra_tree',
+            elapsed=time.time() - solve_started,
+            extra={'shared_source': len(members)}
+        )
+
+        results = []
+        for (i, start, end, _), cost, cells in zip(members, costs.tolist(), cell_paths):
+            if cells is None:
+                results.append((i, self._search_failure(assets.map_id, start, end, search_stats)))
+                continue
+            raw_path = self.astar._normalize_path(assets.grid, [Point(x, y) for x, y in cells], 'astar')
+            result = self._build_route_result(assets, start, end, raw_path, options)
+            result['search_stats'] = {**search_stats.to_dict(), 'path_cost': cost}
+            result['processing_time'] = time.time() - solve_started
+            results.append((i, result))
+        return results
+
     async def find_alternative_routes(self, db: AsyncSession, map_id: str,
                                      start: Tuple[float, float], end: Tuple[float, float],
-                                     max_alternatives: int = 3) -> Dict[str, Any]:
+                                     max_alternatives: int = 3,
+                                     options: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         대체 경로 찾기
 
+        출발지/목적지 최단 경로 트리 두 개에서 plateau를 찾아 최적 경로와 뚜렷이 다른 경로들을 만든다.
+        공유 탐색기 상태를 바꾸지 않으므로 동시 요청과 안전하게 함께 실행된다.
+
         Args:
             db: 데이터베이스 세션
             map_id: 지도 ID
             start: 시작 좌표
             end: 종료 좌표
-            max_alternatives: 최대 대체 경로 수
+            max_alternatives: 최대 대체 경로 수 (최적 경로 제외)
+            options: 추가 옵션 (max_stretch, max_overlap 및 경로 최적화 옵션)
 
         Returns:
             주 경로와 대체 경로들
         """
         start_time = time.time()
-        alternatives = []
-
-        # 메인 경로 찾기
-        main_route = await self.find_route(db, map_id, start, end)
-        if not main_route.get('success'):
-            return main_route
-
-        alternatives.append({
-            'type': 'optimal',
-            'description': '최적 경로',
-            **main_route
-        })
-
-        # 대체 경로 생성 전략
-        # 1. 대각선 이동 비활성화
-        if len(alternatives) < max_alternatives:
-            self.astar.diagonal_movement = False
-            alt_route = await self.find_route(
-                db, map_id, start, end,
-                {'use_cache': False, 'smoothing_level': 'low'}
-            )
-            if alt_route.get('success') and alt_route['polyline'] != main_route['polyline']:
-                alternatives.append({
-                    'type': 'no_diagonal',
-                    'description': '직각 이동 경로',
-                    **alt_route
-                })
-            self.astar.diagonal_movement = True
-
-        # 2. 스무딩 레벨 변경
-        if len(alternatives) < max_alternatives:
-            smooth_route = await self.find_route(
-                db, map_id, start, end,
-                {'use_cache': False, 'smoothing_level': 'high'}
-            )
-            if smooth_route.get('success') and smooth_route['polyline'] != main_route['polyline']:
-                alternatives.append({
-                    'type': 'smooth',
-                    'description': '부드러운 경로',
-                    **smooth_route
-                })
+        options = options or {}
 
-        # 대체 경로 정렬 (거리 기준)
-        alternatives.sort(key=lambda x: x.get('distance_meters', float('inf')))
+        try:
+            assets = await self._load_route_assets(db, map_id, options.get('profile'))
+        except ValueError as e:
+            logger.error(f"대체 경로 찾기 실패: {e}")
+            return {'success': False, 'error': str(e), 'map_id': map_id}
+
+        result = await self._run_search(self._solve_alternatives, assets, start, end, max_alternatives, options)
+        result['processing_time'] = time.time() - start_time
+        return result
+
+    def _solve_alternatives(self, assets: RouteAssets, start: Tuple[float, float],
+                            end: Tuple[float, float], max_alternatives: int,
+                            options: Dict[str, Any]) -> Dict[str, Any]:
+        """대체 경로 탐색 + 경로별 최적화 (DB 접근 없음 - 워커 스레드에서 실행)"""
+        finder_options = {key: options[key] for key in ('max_stretch', 'max_overlap') if key in options}
+        routes, search_stats = self.astar.search_alternatives(
+            assets.grid, start, end, max_alternatives,
+            components=assets.components,
+            snap_index=assets.snap_index,
+            graph=self._route_matrix_engine(assets.asset_key, assets.grid).graph,
+            **finder_options
+        )
+        if not routes:
+            return self._search_failure(assets.map_id, start, end, search_stats)
+
+        results = []
+        for i, route in enumerate(routes):
+            result = self._build_route_result(assets, start, end, route['path'], options)
+            if i == 0:
+                result.update(type='optimal', description='최적 경로')
+            else:
+                result.update(
+                    type='alternative',
+                    description=f"대체 경로 {i} (최적 경로보다 {route['stretch'] * 100:.1f}% 김)"
+                )
+            result.update(
+                stretch=route['stretch'],
+                overlap=route['overlap'],
+                plateau_length_pixels=route['plateau_length']
+            )
+            results.append(result)
 
         return {
             'success': True,
-            'map_id': map_id,
+            'map_id': assets.map_id,
             'start': start,
             'end': end,
-            'main_route': alternatives[0] if alternatives else None,
-            'alternatives': alternatives[1:] if len(alternatives) > 1 else [],
-            'total_alternatives': len(alternatives) - 1,
-            'processing_time': time.time() - start_time
+            'main_route': results[0],
+            'alternatives': results[1:],
+            'total_alternatives': len(results) - 1,
+            'search_stats': search_stats.to_dict()
         }
 
     async def _get_map_data(self, db: AsyncSession, map_id: str) -> Optional[Map]:
@@ -315,15 +726,102 @@ class PathfindingService:
         return result.scalar_one_or_none()
 
     async def _get_preprocessed_data(self, db: AsyncSession, map_id: str) -> Optional[PreprocessedMapData]:
-        """전처리된 데이터 조회"""
+        """
+        전처리된 데이터 조회
+        큰 JSON 컬럼(그리드, HPA* 그래프)은 필요할 때만 읽음 (_load_grid_data, _load_hierarchy)
+        """
+        result = await db.execute(
+            select(PreprocessedMapData)
+            .options(defer(PreprocessedMapData.walkable_grid), defer(PreprocessedMapData.graph_data))
+            .where(PreprocessedMapData.map_id == map_id)
+        )
+        preprocessed_data = result.scalar_one_or_none()
+        if preprocessed_data is not None:
+            previous_id = self.preprocessed_ids.get(map_id)
+            if previous_id is not None and previous_id != preprocessed_data.id:
+                self._evict_preprocessed(previous_id)
+            self.preprocessed_ids[map_id] = preprocessed_data.id
+        return preprocessed_data
+
+    async def _lock_preprocessed_data(self, db: AsyncSession,
+                                      preprocessed_id: str) -> Optional[PreprocessedMapData]:
+        """
+        POI 목록 수정을 위해 전처리 데이터 행을 잠그고 최신 값으로 다시 읽기 (SELECT ... FOR UPDATE)
+        동시에 POI를 등록/삭제하는 요청이 서로의 변경을 덮어쓰지 않도록 커밋/롤백할 때까지 잠금 유지.
+        재전처리로 행이 바뀌었으면 None
+        """
         result = await db.execute(
-            select(PreprocessedMapData).where(PreprocessedMapData.map_id == map_id)
+            select(PreprocessedMapData)
+            .options(defer(PreprocessedMapData.walkable_grid), defer(PreprocessedMapData.graph_data))
+            .where(PreprocessedMapData.id == preprocessed_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
         )
         return result.scalar_one_or_none()
 
-    async def _load_grid_data(self, preprocessed_data: PreprocessedMapData) -> Optional[np.ndarray]:
-        """그리드 데이터 로드"""
+    def _evict_preprocessed(self, preprocessed_id: str):
+        """재전처리로 대체된 전처리 데이터의 그래프/인덱스 캐시 삭제"""
+        for cache in (self.hierarchies, self.stored_assets, self.landmarks, self.flow_fields, self.clearance_costs):
+            cache.pop(preprocessed_id, None)
+        for key in [key for key in self.profile_assets if key[0] == preprocessed_id]:
+            self.profile_assets.pop(key, None)
+        for key in [key for key in self.route_matrices if key[0] == preprocessed_id]:
+            self.route_matrices.pop(key, None)
+        with self.overlay_lock:
+            for key in [key for key in self.overlays if key[0][0] == preprocessed_id]:
+                del self.overlays[key]
+        with self.isochrone_lock:
+            for key in [key for key in self.isochrones if key[0][0] == preprocessed_id]:
+                del self.isochrones[key]
+        logger.info(f"재전처리된 지도의 이전 캐시 삭제: {preprocessed_id}")
+
+    async def _load_stored_assets(self, db: AsyncSession,
+                                  preprocessed_data: PreprocessedMapData) -> StoredMapAssets:
+        """
+        지도 배열 로드 (프로세스 내 캐시 -> 메모리 맵 저장소 순서)
+        저장소에 없으면(이전 버전에서 전처리한 지도 등) DB/파일 그리드에서 한 번 생성해 저장
+        """
+        stored = self.stored_assets.get(preprocessed_data.id)
+        if stored is not None:
+            return stored
+
+        stored = self.asset_store.load(preprocessed_data.map_id, preprocessed_data.id)
+        if stored is None:
+            grid = await self._load_grid_data(db, preprocessed_data)
+            if grid is None:
+                raise ValueError(f"그리드 데이터를 로드할 수 없습니다: {preprocessed_data.map_id}")
+            # 보조 인덱스와 프로필별 침식 그리드 생성은 CPU를 오래 쓰므로 이벤트 루프 밖에서 실행
+            stored = await asyncio.to_thread(
+                self.asset_store.write, preprocessed_data.map_id, preprocessed_data.id, grid
+            )
+
+        self.stored_assets[preprocessed_data.id] = stored
+        return stored
+
+    def _load_profile_assets(self, preprocessed_data: PreprocessedMapData, profile: str) -> StoredMapAssets:
+        """
+        접근성 프로필의 침식 그리드와 보조 인덱스 (전처리 시 저장된 것을 처음 요청할 때 메모리 맵으로 열기)
+
+        Raises:
+            ValueError: 지도에 해당 프로필이 없는 경우
+        """
+        key = (preprocessed_data.id, profile)
+        stored = self.profile_assets.get(key)
+        if stored is None:
+            stored = self.asset_store.load_profile(preprocessed_data.map_id, preprocessed_data.id, profile)
+            if stored is None:
+                available = [DEFAULT_PROFILE, *self.asset_store.available_profiles(
+                    preprocessed_data.map_id, preprocessed_data.id
+                )]
+                raise ValueError(f"지원하지 않는 프로필입니다: {profile} (지원: {', '.join(available)})")
+            self.profile_assets[key] = stored
+        return stored
+
+    async def _load_grid_data(self, db: AsyncSession,
+                              preprocessed_data: PreprocessedMapData) -> Optional[np.ndarray]:
+        """그리드 데이터 로드 (DB JSON 또는 grid.json - 메모리 맵 저장소를 만들 때만 사용)"""
         try:
+            await db.refresh(preprocessed_data, attribute_names=['walkable_grid'])
             if preprocessed_data.walkable_grid:
                 # DB에서 직접 로드
                 logger.info(f"Loading grid from database for map: {preprocessed_data.map_id}")
@@ -352,8 +850,134 @@ class PathfindingService:
             logger.error(f"그리드 데이터 로드 실패: {e}")
             return None
 
-    async def _save_pathfinding_request(self, db: AsyncSession, result: Dict[str, Any]):
-        """길찾기 요청 결과를 데이터베이스에 저장"""
+    async def _load_hierarchy(self, db: AsyncSession, preprocessed_data: PreprocessedMapData,
+                              grid: np.ndarray) -> Optional[HierarchicalGraph]:
+        """HPA* 추상 그래프 로드 (전처리 데이터별로 한 번만 복원)"""
+        if preprocessed_data.id in self.hierarchies:
+            return self.hierarchies[preprocessed_data.id]
+
+        hierarchy = None
+        try:
+            await db.refresh(preprocessed_data, attribute_names=['graph_data'])
+            hierarchy = HierarchicalGraph.from_dict(preprocessed_data.graph_data, grid)
+        except Exception as e:
+            logger.error(f"HPA* 추상 그래프 로드 실패: {e}")
+
+        self.hierarchies[preprocessed_data.id] = hierarchy
+        return hierarchy
+
+    def _default_algorithm(self, options: Dict[str, Any], landmarks: Optional[LandmarkTable]) -> str:
+        """
+        options.algorithm이 없을 때 지도에 준비된 전처리 데이터에 따라 탐색 엔진 선택
+        시간 예산이 없으면 최적 경로를 보장하는 엔진만 고른다 (HPA*는 명시적으로 지정할 때만)
+        """
+        if options.get('time_budget_ms'):
+            return 'ara'
+        if landmarks is not None:
+            return 'alt'
+        return 'astar'
+
+    def _load_landmarks(self, preprocessed_data: PreprocessedMapData,
+                        grid: np.ndarray) -> Optional[LandmarkTable]:
+        """
+        ALT 랜드마크 테이블 로드 (전처리 데이터별로 한 번만)
+        다익스트라 K번이 필요하므로 요청 중에는 생성하지 않고, 전처리 시 저장된 파일이 없으면 None
+        """
+        if preprocessed_data.id not in self.landmarks:
+            directory = landmarks_directory(self.storage_path / "processed" / preprocessed_data.map_id,
+                                            preprocessed_data.id)
+            try:
+                self.landmarks[preprocessed_data.id] = LandmarkTable.load(directory, grid)
+            except Exception as e:
+                logger.error(f"ALT 랜드마크 테이블 로드 실패: {e}")
+                self.landmarks[preprocessed_data.id] = None
+        return self.landmarks[preprocessed_data.id]
+
+    def _load_flow_fields(self, preprocessed_data: PreprocessedMapData,
+                          grid: np.ndarray) -> Dict[Tuple[int, int], FlowField]:
+        """
+        등록된 POI의 흐름장 로드 (전처리 데이터별로 한 번만)
+        전처리/POI 등록 시 저장된 파일만 사용하며, 파일이 없는 POI는 건너뜀
+        """
+        fields = self.flow_fields.get(preprocessed_data.id)
+        if fields is None:
+            fields = {}
+            directory = flow_fields_directory(self.storage_path / "processed" / preprocessed_data.map_id,
+                                              preprocessed_data.id)
+            for poi in preprocessed_data.poi_points or []:
+                try:
+                    field = FlowField.load(directory / f"{poi['id']}.npz", grid)
+                except Exception as e:
+                    logger.error(f"POI 흐름장 로드 실패: {poi.get('id')}: {e}")
+                    continue
+                if field is not None:
+                    fields[field.goal] = field
+            self.flow_fields[preprocessed_data.id] = fields
+        return fields
+
+    def _has_overlay(self, options: Dict[str, Any]) -> bool:
+        """회피/선호 영역 옵션이 있는지 확인"""
+        return bool(options.get('avoid_areas') or options.get('prefer_areas'))
+
+    def _has_route_costs(self, options: Dict[str, Any]) -> bool:
+        """균일 비용 그리드와 다른 탐색이 필요한 옵션(회피/선호 영역, 벽 간격 비용)이 있는지 확인"""
+        return self._has_overlay(options) or bool(options.get('prefer_clearance'))
+
+    def _clearance_cost_field(self, assets: RouteAssets) -> CostField:
+        """벽 간격 비용 배율 (전처리 데이터별로 한 번만 만들어 모든 요청이 공유)"""
+        cost_field = self.clearance_costs.get(assets.preprocessed_id)
+        if cost_field is None:
+            cost_field = assets.clearance.cost_field()
+            self.clearance_costs[assets.preprocessed_id] = cost_field
+        return cost_field
+
+    def _route_cost_field(self, assets: RouteAssets, overlay: Optional[CostOverlay],
+                          options: Dict[str, Any]) -> Optional[CostField]:
+        """가중치 A*에 쓸 셀 비용 배율 (오버레이 비용에는 벽 간격 비용이 이미 곱해져 있음)"""
+        if overlay is not None and overlay.costs is not None:
+            return overlay.costs
+        if options.get('prefer_clearance'):
+            return self._clearance_cost_field(assets)
+        return None
+
+    def _route_overlay(self, assets: RouteAssets, options: Dict[str, Any]) -> Optional[CostOverlay]:
+        """
+        회피/선호 영역 오버레이 (같은 지도·같은 영역 집합이면 래스터화 결과 재사용)
+
+        Raises:
+            ValueError: 영역 형식이 잘못된 경우
+        """
+        if not self._has_overlay(options):
+            return None
+
+        avoid_areas, prefer_areas = options.get('avoid_areas'), options.get('prefer_areas')
+        prefer_clearance = bool(options.get('prefer_clearance'))
+        key = (assets.asset_key, overlay_key(avoid_areas, prefer_areas), prefer_clearance)
+        with self.overlay_lock:
+            overlay = self.overlays.get(key)
+        if overlay is not None:
+            return overlay
+
+        overlay = CostOverlay.build(
+            assets.grid, avoid_areas, prefer_areas,
+            base_costs=assets.clearance.multipliers() if prefer_clearance else None
+        )
+        with self.overlay_lock:
+            while len(self.overlays) >= OVERLAY_CACHE_SIZE:
+                self.overlays.pop(next(iter(self.overlays)))
+            self.overlays[key] = overlay
+        return overlay
+
+    def _match_flow_field(self, assets: RouteAssets, end: Tuple[float, float]) -> Optional[FlowField]:
+        """종료점(보정 후 셀)이 등록된 POI의 목적지 셀과 같으면 그 흐름장"""
+        if not assets.flow_fields:
+            return None
+        return assets.flow_fields.get(goal_cell(assets.grid, end, assets.snap_index))
+
+    async def _save_pathfinding_request(self, db: AsyncSession, result: Dict[str, Any],
+                                        waypoints: Optional[List[Tuple[float, float]]] = None,
+                                        options: Optional[Dict[str, Any]] = None):
+        """길찾기 요청 결과를 데이터베이스에 저장 (다중 경로는 경유지와 함께 한 건으로 저장)"""
         try:
             request = PathfindingRequest(
                 id=result.get('path_id'),
@@ -362,6 +986,8 @@ class PathfindingService:
                 start_y=result['start'][1],
                 end_x=result['end'][0],
                 end_y=result['end'][1],
+                waypoints=waypoints,
+                options=options,
                 result_path=result.get('polyline'),
                 svg_path=result.get('svg_path'),
                 distance_pixels=result.get('distance_pixels'),
@@ -401,30 +1027,31 @@ class PathfindingService:
         score = 1.0 - (waypoint_count / 100) * 0.5 - (1 - reduction_rate) * 0.5
         return max(0.0, min(1.0, score))
 
-    async def _optimize_waypoint_order(self, db: AsyncSession, map_id: str,
-                                      points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    def _optimize_waypoint_order(self, assets: RouteAssets,
+                                 points: List[Tuple[float, float]],
+                                 return_to_start: bool = False,
+                                 fixed_end: bool = False,
+                                 time_budget_ms: Optional[float] = DEFAULT_TIME_BUDGET_MS
+                                 ) -> Tuple[List[Tuple[float, float]], Dict[str, Any]]:
         """
         TSP(Traveling Salesman Problem) 근사 알고리즘으로 경유지 순서 최적화
-        간단한 그리디 알고리즘 사용
-        """
-        if len(points) <= 3:
-            return points
-
-        optimized = [points[0]]  # 시작점
-        remaining = points[1:]
+        보행 거리 행렬(지점당 탐색 1번) 위에서 최근접 이웃 + 2-opt/Or-opt 지역 탐색
 
-        while remaining:
-            current = optimized[-1]
-            # 가장 가까운 점 찾기
-            nearest = min(remaining, key=lambda p: self._euclidean_distance(current, p))
-            optimized.append(nearest)
-            remaining.remove(nearest)
-
-        return optimized
+        Returns:
+            (재정렬된 지점 리스트 (시작점 고정, fixed_end면 마지막 지점도 고정),
+             최적화 통계 - 최근접 이웃 순서 대비 개선량, 보행 거리는 그리드 셀 단위)
+        """
+        distances, _, _, matrix_stats = self._route_matrix(
+            assets.asset_key, assets.grid, assets.snap_index, points
+        )
+        order, stats = TourOptimizer(distances, time_budget_ms).optimize(return_to_start, fixed_end)
+        stats['matrix_searches'] = matrix_stats['searches']
 
-    def _euclidean_distance(self, p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
-        """유클리드 거리 계산"""
-        return ((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2) ** 0.5
+        logger.info(
+            f"경유지 순서 최적화: {len(points)}개 지점, "
+            f"최근접 이웃 대비 {stats['improvement_percent']:.1f}% 단축"
+        )
+        return [points[i] for i in order], stats
 
     async def validate_and_adjust_point(
         self,
@@ -449,66 +1076,438 @@ class PathfindingService:
             if not preprocessed_data:
                 raise ValueError(f"전처리된 데이터를 찾을 수 없습니다: {map_id}")
 
-            grid = await self._load_grid_data(preprocessed_data)
-            if grid is None:
-                raise ValueError(f"그리드 데이터를 로드할 수 없습니다: {map_id}")
+            stored = await self._load_stored_assets(db, preprocessed_data)
 
-            # 정규화된 좌표를 그리드 좌표로 변환
-            height, width = grid.shape
-            from app.core.pathfinding.astar import Point
+            # 최근접 보행 가능 지점 인덱스로 보정 (배열 조회)
+            result = self._adjust_points(stored.grid, stored.snap_index, [point])[0]
+            if result['adjusted_point'] is None:
+                raise ValueError("주변에 보행 가능한 영역을 찾을 수 없습니다")
 
-            point_grid = Point(
-                int(point[0] * width),
-                int(point[1] * height)
-            )
+            if result['was_adjusted']:
+                logger.info(
+                    f"좌표 보정: {point} -> {result['adjusted_point']}, "
+                    f"거리: {result['adjustment_distance']:.1f}px"
+                )
+            return result
 
-            # 유효성 검사
-            is_valid = (
-                0 <= point_grid.x < width and
-                0 <= point_grid.y < height and
-                grid[point_grid.y, point_grid.x] == 1
-            )
+        except Exception as e:
+            logger.error(f"좌표 검증 실패: {e}")
+            raise
 
-            adjusted_point_grid = point_grid
-            was_adjusted = False
-            adjustment_distance = 0.0
+    async def validate_and_adjust_points(
+        self,
+        db: AsyncSession,
+        map_id: str,
+        points: List[Tuple[float, float]]
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 좌표를 한 번에 검증 및 보정
 
-            # 장애물 위치인 경우 가장 가까운 보행 가능 지점 찾기
-            if not is_valid:
-                # A* pathfinder의 _find_nearest_walkable_point 메서드 사용
-                adjusted_point_grid = self.astar._find_nearest_walkable_point(
-                    grid, point_grid
-                )
+        Args:
+            db: 데이터베이스 세션
+            map_id: 지도 ID
+            points: 검증할 좌표 리스트 (정규화된 0-1 범위)
 
-                if adjusted_point_grid is None:
-                    raise ValueError("주변에 보행 가능한 영역을 찾을 수 없습니다")
+        Returns:
+            좌표별 검증 결과 딕셔너리 리스트 (보정할 지점을 찾지 못하면 adjusted_point는 None)
+        """
+        try:
+            preprocessed_data = await self._get_preprocessed_data(db, map_id)
+            if not preprocessed_data:
+                raise ValueError(f"전처리된 데이터를 찾을 수 없습니다: {map_id}")
 
-                was_adjusted = True
-                # 보정 거리 계산 (픽셀 단위)
-                adjustment_distance = math.sqrt(
-                    (adjusted_point_grid.x - point_grid.x) ** 2 +
-                    (adjusted_point_grid.y - point_grid.y) ** 2
-                )
+            stored = await self._load_stored_assets(db, preprocessed_data)
+            return self._adjust_points(stored.grid, stored.snap_index, points)
 
-                logger.info(
-                    f"좌표 보정: {point} -> ({adjusted_point_grid.x}/{width}, {adjusted_point_grid.y}/{height}), "
-                    f"거리: {adjustment_distance:.1f}px"
-                )
+        except Exception as e:
+            logger.error(f"좌표 일괄 검증 실패: {e}")
+            raise
+
+    async def compute_route_matrix(self, db: AsyncSession, map_id: str,
+                                   points: List[Tuple[float, float]],
+                                   return_paths: bool = False) -> Dict[str, Any]:
+        """
+        다대다 보행 거리 행렬 계산
+
+        Args:
+            db: 데이터베이스 세션
+            map_id: 지도 ID
+            points: 지점 리스트 (정규화된 0-1 범위)
+            return_paths: True면 지점 쌍별 경로(정규화된 좌표)도 반환
+
+        Returns:
+            거리(픽셀/미터)·예상 시간 행렬 딕셔너리 (도달 불가 쌍은 None)
+        """
+        start_time = time.time()
 
-            # 그리드 좌표를 정규화된 좌표로 변환
-            adjusted_point = (
-                adjusted_point_grid.x / width,
-                adjusted_point_grid.y / height
+        assets = await self._load_route_assets(db, map_id)
+        # 지점마다 전체 지도 Dijkstra(첫 요청은 이동 그래프 생성 포함)라 이벤트 루프 밖에서 실행
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, self._build_route_matrix, assets, points, return_paths)
+        result['processing_time'] = time.time() - start_time
+        return result
+
+    def _build_route_matrix(self, assets: RouteAssets, points: List[Tuple[float, float]],
+                            return_paths: bool) -> Dict[str, Any]:
+        """보행 거리 행렬 결과 딕셔너리 생성 (DB 접근 없음 - 워커 스레드에서 실행)"""
+        grid = assets.grid
+        distances, cell_paths, cells, stats = self._route_matrix(
+            assets.asset_key, grid, assets.snap_index, points, return_paths
+        )
+
+        height, width = grid.shape
+        meters = distances * assets.scale_meters_per_pixel
+        reachable = np.isfinite(distances)
+
+        def to_rows(matrix: np.ndarray) -> List[List[Optional[float]]]:
+            return [
+                [value if ok else None for value, ok in zip(row, ok_row)]
+                for row, ok_row in zip(matrix.tolist(), reachable.tolist())
+            ]
+
+        result = {
+            'success': True,
+            'map_id': assets.map_id,
+            'points': points,
+            'snapped_points': [
+                (cell[0] / width, cell[1] / height) if cell is not None else None for cell in cells
+            ],
+            'distance_matrix_pixels': to_rows(distances),
+            'distance_matrix_meters': to_rows(meters),
+            'duration_matrix_seconds': to_rows(meters / WALKING_SPEED_MPS),
+            'unreachable_pairs': int((~reachable).sum()),
+            'search_stats': stats
+        }
+
+        if return_paths:
+            result['paths'] = [
+                [self._normalize_cell_path(grid, path) if path is not None else None for path in row]
+                for row in cell_paths
+            ]
+        return result
+
+    async def compute_isochrone(self, db: AsyncSession, map_id: str, start: Tuple[float, float],
+                                bands_seconds: List[float]) -> Dict[str, Any]:
+        """
+        출발지에서 시간 구간별 도보 도달 가능 영역 계산
+
+        Args:
+            db: 데이터베이스 세션
+            map_id: 지도 ID
+            start: 출발 좌표 (정규화된 0-1 범위)
+            bands_seconds: 시간 구간 (초)
+
+        Returns:
+            구간별 윤곽선 다각형(정규화된 좌표)과 면적 딕셔너리
+        """
+        start_time = time.time()
+        assets = await self._load_route_assets(db, map_id)
+
+        start_cell = goal_cell(assets.grid, start, assets.snap_index)
+        if start_cell is None:
+            raise ValueError("출발지 주변에 보행 가능한 영역을 찾을 수 없습니다")
+
+        bands = tuple(sorted(set(float(band) for band in bands_seconds)))
+        cache_key = (assets.asset_key, start_cell, bands)
+        with self.isochrone_lock:
+            cached = self.isochrones.pop(cache_key, None)
+            if cached is not None:
+                # 최근 사용 순서 갱신 (딕셔너리 끝이 가장 최근)
+                self.isochrones[cache_key] = cached
+        if cached is not None:
+            return {**cached, 'start': start, 'cached': True, 'processing_time': time.time() - start_time}
+
+        band_results, stats = await self._run_search(self._solve_isochrone, assets, start_cell, list(bands))
+
+        height, width = assets.grid.shape
+        result = {
+            'success': True,
+            'map_id': map_id,
+            'start': start,
+            'snapped_start': (start_cell[0] / width, start_cell[1] / height),
+            'bands': band_results,
+            'search_stats': stats,
+            'cached': False
+        }
+        with self.isochrone_lock:
+            while len(self.isochrones) >= ISOCHRONE_CACHE_SIZE:
+                self.isochrones.pop(next(iter(self.isochrones)))
+            self.isochrones[cache_key] = result
+        return {**result, 'processing_time': time.time() - start_time}
+
+    def _solve_isochrone(self, assets: RouteAssets, start_cell: Tuple[int, int],
+                         bands: List[float]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """도달 가능 영역 계산 (DB 접근 없음 - 워커에서 실행, 이동 그래프는 거리 행렬/대체 경로 엔진과 공유)"""
+        engine = IsochroneEngine(assets.grid, self._route_matrix_engine(assets.asset_key, assets.grid).graph)
+        return engine.compute(start_cell, bands, assets.scale_meters_per_pixel)
+
+    async def find_nearest_pois(self, db: AsyncSession, map_id: str, start: Tuple[float, float],
+                                k: int = 3, category: Optional[str] = None,
+                                include_entrances: bool = False,
+                                options: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        출발지에서 보행 거리가 가장 가까운 POI k개와 각 경로 찾기
+
+        후보마다 경로를 따로 탐색하지 않고, 출발지에서 다중 목적지 Dijkstra를 한 번 실행해
+        k개의 후보 셀이 확정되면 종료한다. 출발지와 다른 연결 영역의 후보는 탐색 전에 제외한다.
+
+        Args:
+            db: 데이터베이스 세션
+            map_id: 지도 ID
+            start: 출발 좌표 (정규화된 0-1 범위)
+            k: 찾을 POI 수
+            category: POI 분류 (없으면 모든 POI)
+            include_entrances: 전처리에서 감지한 출입구(entrance_points)도 후보에 포함
+            options: 경로 최적화 옵션
+
+        Returns:
+            가까운 순서의 POI와 경로 정보 딕셔너리
+        """
+        start_time = time.time()
+        options = options or {}
+
+        preprocessed_data = await self._get_preprocessed_data(db, map_id)
+        if not preprocessed_data:
+            raise ValueError(f"전처리된 데이터를 찾을 수 없습니다: {map_id}")
+
+        candidates = [
+            poi for poi in preprocessed_data.poi_points or []
+            if category is None or poi.get('category') == category
+        ]
+        if include_entrances:
+            candidates += [
+                {
+                    'id': None,
+                    'name': f"출입구 ({entrance.get('direction')})",
+                    'category': ENTRANCE_CATEGORY,
+                    'position': entrance['position']
+                }
+                for entrance in preprocessed_data.entrance_points or []
+            ]
+        if not candidates:
+            raise ValueError("조건에 맞는 POI가 없습니다")
+
+        assets = await self._load_route_assets(db, map_id, options.get('profile'))
+        start_cell = goal_cell(assets.grid, start, assets.snap_index)
+        if start_cell is None:
+            raise ValueError("출발지 주변에 보행 가능한 영역을 찾을 수 없습니다")
+
+        result = await self._run_search(self._solve_nearest, assets, start, start_cell, candidates, k, options)
+        result['processing_time'] = time.time() - start_time
+        return result
+
+    def _solve_nearest(self, assets: RouteAssets, start: Tuple[float, float], start_cell: Tuple[int, int],
+                       candidates: List[Dict[str, Any]], k: int, options: Dict[str, Any]) -> Dict[str, Any]:
+        """다중 목적지 탐색 + 경로별 최적화 (DB 접근 없음 - 워커 스레드에서 실행)"""
+        grid = assets.grid
+
+        # 보정할 수 없거나 출발지와 다른 연결 영역에 있는 후보는 탐색 대상에서 제외 ((-1, -1)은 탐색기가 무시)
+        goals = []
+        for poi in candidates:
+            cell = goal_cell(grid, poi['position'], assets.snap_index)
+            if cell is None or not assets.components.connected(start_cell, cell):
+                cell = (-1, -1)
+            goals.append(cell)
+
+        search_grid = SearchGrid(grid, diagonal_movement=self.astar.diagonal_movement)
+        found, search_stats = NearestGoalSearch(search_grid).search(start_cell, goals, k)
+        search_stats.extra['candidates'] = len(candidates)
+
+        height, width = grid.shape
+        base = {
+            'map_id': assets.map_id,
+            'start': start,
+            'snapped_start': (start_cell[0] / width, start_cell[1] / height),
+            'search_stats': search_stats.to_dict()
+        }
+        if not found:
+            return {**base, 'success': False, 'error': '도달할 수 있는 POI가 없습니다', 'results': []}
+
+        results = []
+        for rank, (i, cost, cells) in enumerate(found, start=1):
+            poi = candidates[i]
+            route = self._build_route_result(
+                assets, start, tuple(poi['position']), self._normalize_cell_path(grid, cells), options
             )
+            route.update(rank=rank, poi=poi, cost_pixels=cost)
+            results.append(route)
 
-            return {
-                'is_valid': is_valid,
-                'original_point': point,
-                'adjusted_point': adjusted_point,
-                'was_adjusted': was_adjusted,
-                'adjustment_distance': adjustment_distance
-            }
+        return {**base, 'success': True, 'results': results, 'total_results': len(results)}
 
-        except Exception as e:
-            logger.error(f"좌표 검증 실패: {e}")
-            raise
\ No newline at end of file
+    def _route_matrix(self, asset_key: Tuple[str, str], grid: np.ndarray, snap_index: SnapIndex,
+                      points: List[Tuple[float, float]], return_paths: bool = False):
+        """
+        정규화된 지점들을 보정해 보행 거리 행렬 계산
+
+        Returns:
+            (N x N 비용 행렬 (그리드 셀 단위, 도달 불가 inf), 셀 경로 행렬 또는 None,
+             보정된 셀 리스트 (보정 실패 시 None), 탐색 통계)
+        """
+        height, width = grid.shape
+        normalized = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        xs = (normalized[:, 0] * width).astype(np.int64)
+        ys = (normalized[:, 1] * height).astype(np.int64)
+        nx, ny, _, found = snap_index.snap_many(xs, ys)
+        cells = [(x, y) if ok else None for x, y, ok in zip(nx.tolist(), ny.tolist(), found.tolist())]
+
+        # 보행 가능한 지점을 찾지 못한 지점은 모든 쌍이 도달 불가
+        valid = [i for i, cell in enumerate(cells) if cell is not None]
+        engine = self._route_matrix_engine(asset_key, grid)
+        sub_distances, sub_paths, stats = engine.compute([cells[i] for i in valid], return_paths)
+
+        count = len(points)
+        distances = np.full((count, count), np.inf)
+        distances[np.ix_(valid, valid)] = sub_distances
+        paths = None
+        if return_paths:
+            paths = [[None] * count for _ in range(count)]
+            for a, i in enumerate(valid):
+                for b, j in enumerate(valid):
+                    paths[i][j] = sub_paths[a][b]
+        return distances, paths, cells, stats
+
+    def _route_matrix_engine(self, asset_key: Tuple[str, str], grid: np.ndarray) -> RouteMatrix:
+        """보행 거리 행렬 엔진 (이동 그래프를 전처리 데이터/프로필별로 한 번만 생성 - 대체 경로 탐색과 공유)"""
+        engine = self.route_matrices.get(asset_key)
+        if engine is None:
+            engine = self.route_matrices[asset_key] = RouteMatrix(grid)
+        return engine
+
+    def _normalize_cell_path(self, grid: np.ndarray, path: List[Tuple[int, int]]) -> List[Tuple[float, float]]:
+        """셀 경로를 스무딩(가시선 기준)한 뒤 정규화된 좌표로 변환"""
+        height, width = grid.shape
+        points = [Point(x, y) for x, y in path]
+        if self.astar.smooth_path and len(points) > 2:
+            points = self.astar._smooth_path(grid, points)
+        return [(p.x / width, p.y / height) for p in points]
+
+    async def list_pois(self, db: AsyncSession, map_id: str) -> List[Dict[str, Any]]:
+        """등록된 POI 목록 조회"""
+        preprocessed_data = await self._get_preprocessed_data(db, map_id)
+        if not preprocessed_data:
+            raise ValueError(f"전처리된 데이터를 찾을 수 없습니다: {map_id}")
+        return list(preprocessed_data.poi_points or [])
+
+    async def register_poi(
+        self,
+        db: AsyncSession,
+        map_id: str,
+        name: str,
+        position: Tuple[float, float],
+        category: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        POI 등록 및 흐름장 생성
+
+        목적지 셀에서 역방향 Dijkstra를 한 번 실행해 흐름장을 저장하고,
+        이후 이 POI가 종료점인 길찾기는 탐색 없이 흐름장을 따라간다.
+
+        Args:
+            db: 데이터베이스 세션
+            map_id: 지도 ID
+            name: POI 이름
+            position: POI 좌표 (정규화된 0-1 범위)
+            category: 분류 (상점, 출구, 화장실 등)
+
+        Returns:
+            등록된 POI 딕셔너리
+        """
+        preprocessed_data = await self._get_preprocessed_data(db, map_id)
+        if not preprocessed_data:
+            raise ValueError(f"전처리된 데이터를 찾을 수 없습니다: {map_id}")
+
+        stored = await self._load_stored_assets(db, preprocessed_data)
+        grid = stored.grid
+
+        goal = goal_cell(grid, position, stored.snap_index)
+        if goal is None:
+            raise ValueError("주변에 보행 가능한 영역을 찾을 수 없습니다")
+
+        started = time.time()
+        poi = {
+            'id': str(uuid.uuid4()),
+            'name': name,
+            'category': category,
+            'position': [float(position[0]), float(position[1])]
+        }
+        # 전체 그리드 역방향 Dijkstra라 이벤트 루프 밖에서 생성
+        loop = asyncio.get_running_loop()
+        field = await loop.run_in_executor(self.executor, FlowField.build, grid, goal, poi['id'])
+        directory = flow_fields_directory(self.storage_path / "processed" / map_id, preprocessed_data.id)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{poi['id']}.npz"
+        # 커밋 직후 다른 워커가 POI 목록을 읽어도 파일이 있도록 먼저 저장하고, 커밋에 실패하면 삭제
+        field.save(path)
+
+        try:
+            locked = await self._lock_preprocessed_data(db, preprocessed_data.id)
+            if locked is None:
+                raise ValueError(f"전처리된 데이터가 다시 생성되었습니다: {map_id}")
+            # JSON 컬럼 변경 감지를 위해 새 리스트로 교체
+            locked.poi_points = [*(locked.poi_points or []), poi]
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            path.unlink(missing_ok=True)
+            raise
+
+        fields = self.flow_fields.get(preprocessed_data.id)
+        if fields is not None:
+            fields[field.goal] = field
+
+        logger.info(f"POI 등록: {poi['name']} ({poi['id']}), 흐름장 생성 {time.time() - started:.2f}초")
+        return poi
+
+    async def delete_poi(self, db: AsyncSession, map_id: str, poi_id: str) -> bool:
+        """POI와 흐름장 삭제. 해당 POI가 없으면 False"""
+        preprocessed_data = await self._get_preprocessed_data(db, map_id)
+        if not preprocessed_data:
+            raise ValueError(f"전처리된 데이터를 찾을 수 없습니다: {map_id}")
+
+        locked = await self._lock_preprocessed_data(db, preprocessed_data.id)
+        pois = (locked.poi_points or []) if locked is not None else []
+        remaining = [poi for poi in pois if poi.get('id') != poi_id]
+        if len(remaining) == len(pois):
+            await db.rollback()
+            return False
+
+        locked.poi_points = remaining
+        await db.commit()
+
+        path = flow_fields_directory(self.storage_path / "processed" / map_id, preprocessed_data.id) / f"{poi_id}.npz"
+        path.unlink(missing_ok=True)
+        # 같은 셀을 목적지로 하는 다른 POI가 있을 수 있으므로 다음 요청에서 다시 로드
+        self.flow_fields.pop(preprocessed_data.id, None)
+        return True
+
+    def _adjust_points(self, grid: np.ndarray, snap_index: SnapIndex,
+                       points: List[Tuple[float, float]]) -> List[Dict[str, Any]]:
+        """정규화된 좌표들을 그리드 좌표로 변환해 최근접 지점 인덱스로 한 번에 보정"""
+        height, width = grid.shape
+        normalized = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        xs = (normalized[:, 0] * width).astype(np.int64).tolist()
+        ys = (normalized[:, 1] * height).astype(np.int64).tolist()
+
+        nx, ny, distances, found = snap_index.snap_many(xs, ys)
+        # 보행 가능한 셀의 최근접 셀은 자기 자신
+        is_valid = (distances == 0) & found
+        nx, ny, distances = nx.tolist(), ny.tolist(), distances.tolist()
+
+        results = []
+        for i, point in enumerate(points):
+            valid = bool(is_valid[i])
+            if valid:
+                adjusted_point, distance = (xs[i] / width, ys[i] / height), 0.0
+            elif found[i]:
+                adjusted_point, distance = (nx[i] / width, ny[i] / height), distances[i]
+            else:
+                adjusted_point, distance = None, None
+
+            results.append({
+                'is_valid': valid,
+                'original_point': tuple(point),
+                'adjusted_point': adjusted_point,
+                'was_adjusted': not valid and adjusted_point is not None,
+                'adjustment_distance': distance
+            })
+        return results
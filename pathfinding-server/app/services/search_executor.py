@@ -0,0 +1,357 @@
+"""
+경로 탐색 실행기
+CPU를 많이 쓰는 경로 탐색을 이벤트 루프 밖의 프로세스 풀에서 실행한다.
+워커는 지도 배열 저장소(asset_store)와 ALT 랜드마크 테이블을 경로로 찾아 메모리 맵으로 열기 때문에
+호출마다 그리드를 피클링하지 않고, 서버 워커/탐색 워커 모두 OS 페이지 캐시의 한 벌을 공유한다.
+DB에만 있는 HPA* 추상 그래프만 공유 메모리(multiprocessing.shared_memory)로 전달한다.
+"""
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import signal
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Dict, Any, List, Tuple, Optional
+
+import numpy as np
+
+from app.core.pathfinding.profiles import DEFAULT_PROFILE
+
+logger = logging.getLogger(__name__)
+
+# 요청 프로세스가 HPA* 추상 그래프를 공유 메모리에 올려 두는 (지도, 프로필) 수 (오래 쓰지 않은 것부터 해제)
+PUBLISHED_CACHE_SIZE = 16
+
+# 실행 중인 탐색을 중단시키는 신호 (POSIX 전용 - 없으면 대기 중인 요청만 취소)
+_CANCEL_SIGNAL = getattr(signal, 'SIGUSR1', None)
+
+# 제어 테이블 열: 요청 슬롯별 취소 플래그와 실행 중인 워커 PID
+_CANCELLED = 0
+_WORKER_PID = 1
+
+
+class SearchQueueFullError(RuntimeError):
+    """실행 중이거나 대기 중인 탐색 요청 수가 한도에 도달"""
+
+
+class SearchCancelledError(Exception):
+    """워커에서 실행 중인 탐색이 취소됨 (워커 내부에서만 사용)"""
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """공유 메모리에 올린 배열의 위치 정보 (워커로 전달되는 부분)"""
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+    @classmethod
+    def create(cls, array: np.ndarray) -> Tuple['SharedArray', SharedMemory]:
+        """배열을 새 공유 메모리 블록에 복사"""
+        array = np.ascontiguousarray(array)
+        shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        return cls(shm.name, tuple(array.shape), array.dtype.str), shm
+
+    def attach(self) -> Tuple[SharedMemory, np.ndarray]:
+        """기존 공유 메모리 블록에 붙어 복사 없이 배열로 사용"""
+        shm = SharedMemory(name=self.name)
+        return shm, np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=shm.buf)
+
+
+@dataclass
+class SharedRouteAssets:
+    """워커로 전달하는 RouteAssets 위치 정보 (워커에서 저장된 파일을 메모리 맵으로 열어 RouteAssets로 복원)"""
+    key: str  # 전처리 데이터 ID
+    map_id: str
+    scale_meters_per_pixel: float
+    has_landmarks: bool  # 요청 프로세스가 ALT 랜드마크 테이블을 쓰면 워커도 저장된 테이블을 엶
+    hierarchy: Optional[SharedArray] = None  # HPA* 추상 그래프 JSON
+    profile: str = DEFAULT_PROFILE  # 접근성 프로필 (프로필마다 그리드가 달라 따로 복원)
+
+
+# ===== 워커 프로세스 =====
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _initialize_worker(control: SharedArray, storage_path: str):
+    """워커 시작 시 제어 테이블에 붙고 취소 신호 처리기 등록"""
+    shm, table = control.attach()
+    _worker_state.update(control=(shm, table), assets={}, slot=None, storage_path=storage_path)
+    if _CANCEL_SIGNAL is not None:
+        signal.signal(_CANCEL_SIGNAL, _on_cancel_signal)
+
+
+def _on_cancel_signal(signum, frame):
+    """현재 실행 중인 요청이 취소 표시된 경우에만 탐색 루프를 중단"""
+    slot = _worker_state.get('slot')
+    if slot is not None and _worker_state['control'][1][slot, _CANCELLED]:
+        raise SearchCancelledError()
+
+
+def _attach_assets(shared: SharedRouteAssets):
+    """
+    지도 배열 저장소와 랜드마크 테이블을 메모리 맵으로 열어 RouteAssets로 복원 (워커별로 지도당 한 번)
+
+    Raises:
+        ValueError: 저장소에 해당 전처리 데이터/프로필이 없는 경우
+    """
+    from app.services.pathfinding_service import RouteAssets
+    from app.core.pathfinding.asset_store import MapAssetStore
+    from app.core.pathfinding.hpa import HierarchicalGraph
+    from app.core.pathfinding.alt import LandmarkTable, landmarks_directory
+
+    attached = _worker_state['assets']
+    attach_key = (shared.map_id, shared.profile)
+    cached = attached.get(attach_key)
+    if cached is not None and cached[0] == shared.key:
+        return cached[1]
+    if cached is not None:
+        # 재전처리된 지도 - 이전 데이터로 만든 캐시 삭제 (메모리 맵은 참조가 사라지면 닫힘)
+        _worker_service()._evict_preprocessed(cached[0])
+
+    storage_path = Path(_worker_state['storage_path'])
+    store = MapAssetStore(storage_path)
+    stored = store.load(shared.map_id, shared.key)
+    profiled = stored if shared.profile == DEFAULT_PROFILE else store.load_profile(
+        shared.map_id, shared.key, shared.profile
+    )
+    if stored is None or profiled is None:
+        raise ValueError(f"지도 배열 저장소를 열 수 없습니다: {shared.map_id} ({shared.key}, {shared.profile})")
+
+    landmarks = None
+    if shared.has_landmarks:
+        landmarks = LandmarkTable.load(
+            landmarks_directory(storage_path / "processed" / shared.map_id, shared.key), stored.grid
+        )
+
+    hierarchy = None
+    if shared.hierarchy is not None:
+        try:
+            shm, view = shared.hierarchy.attach()
+        except FileNotFoundError:
+            # 요청 프로세스가 오래 쓰지 않은 지도로 보고 이미 해제함 - HPA* 없이 처리
+            logger.warning(f"HPA* 추상 그래프 공유 메모리가 해제되었습니다: {shared.map_id}")
+        else:
+            try:
+                hierarchy = HierarchicalGraph.from_dict(json.loads(view.tobytes()), stored.grid)
+            finally:
+                del view
+                shm.close()
+
+    assets = RouteAssets(
+        map_id=shared.map_id,
+        scale_meters_per_pixel=shared.scale_meters_per_pixel,
+        preprocessed_id=shared.key,
+        grid=profiled.grid,
+        hierarchy=hierarchy,
+        landmarks=landmarks,
+        components=profiled.components,
+        snap_index=profiled.snap_index,
+        clearance=stored.clearance,
+        flow_fields={},  # 흐름장 경로는 탐색이 없어 요청 프로세스에서 바로 처리
+        profile=shared.profile
+    )
+    attached[attach_key] = (shared.key, assets)
+    return assets
+
+
+def _worker_service():
+    service = _worker_state.get('service')
+    if service is None:
+        from app.services.pathfinding_service import PathfindingService
+        service = _worker_state['service'] = PathfindingService(_worker_state['storage_path'])
+    return service
+
+
+def _run_in_worker(shared: SharedRouteAssets, slot: int, method: str, *args) -> Any:
+    """
+    워커에서 PathfindingService의 탐색 메서드 실행 (첫 인자로 복원한 RouteAssets 전달)
+
+    Raises:
+        SearchCancelledError: 대기 중이거나 실행 중에 취소된 요청
+    """
+    table = _worker_state['control'][1]
+    _worker_state['slot'] = slot
+    try:
+        table[slot, _WORKER_PID] = os.getpid()
+        # 대기열에 있는 동안 취소된 요청
+        if table[slot, _CANCELLED]:
+            raise SearchCancelledError()
+        return getattr(_worker_service(), method)(_attach_assets(shared), *args)
+    finally:
+        _worker_state['slot'] = None
+        table[slot, _WORKER_PID] = 0
+
+
+def _solve_in_worker(shared: SharedRouteAssets, slot: int, start: Tuple[float, float],
+                     end: Tuple[float, float], options: Dict[str, Any]) -> Dict[str, Any]:
+    """워커에서 한 구간의 경로 탐색 + 최적화 (PathfindingService._solve_route)"""
+    try:
+        return _run_in_worker(shared, slot, '_solve_route', start, end, options)
+    except SearchCancelledError:
+        return {
+            'success': False,
+            'cancelled': True,
+            'error': '탐색이 취소되었습니다',
+            'start': start,
+            'end': end,
+            'map_id': shared.map_id
+        }
+
+
+# ===== 요청 프로세스 =====
+
+class SearchExecutor:
+    """
+    프로세스 풀 탐색 실행기
+
+    - 워커는 지도 데이터를 저장소 경로로 찾아 메모리 맵으로 열고, HPA* 추상 그래프만
+      전처리 데이터 ID별로 공유 메모리에 한 번 올림 (publish, 최근 PUBLISHED_CACHE_SIZE개 지도/프로필만 유지)
+    - 동시에 실행/대기할 수 있는 요청은 queue_depth개로 제한하고, 넘치면 SearchQueueFullError
+    - 요청을 기다리던 코루틴이 취소되면 대기 중인 작업은 풀에서 빼고,
+      이미 실행 중인 작업은 취소 플래그를 세운 뒤 워커에 신호를 보내 탐색 루프를 중단시킨다
+    """
+
+    def __init__(self, max_workers: int = 4, queue_depth: int = 32, storage_path: str = "./storage"):
+        self.max_workers = max_workers
+        self.queue_depth = queue_depth
+        self.storage_path = storage_path
+
+        self._control, self._control_shm = SharedArray.create(np.zeros((queue_depth, 2), dtype=np.int64))
+        self._table = np.ndarray((queue_depth, 2), dtype=np.int64, buffer=self._control_shm.buf)
+        self._free_slots = list(range(queue_depth))
+        # (지도 ID, 접근성 프로필) -> 공유 데이터 (최근 사용 순서)
+        self._published: Dict[Tuple[str, str], Tuple[SharedRouteAssets, List[SharedMemory]]] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pending(self) -> int:
+        """실행 중이거나 대기 중인 요청 수"""
+        return self.queue_depth - len(self._free_slots)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # 요청 프로세스의 스레드/이벤트 루프 상태를 물려받지 않도록 spawn으로 워커 생성
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_initialize_worker,
+                initargs=(self._control, self.storage_path)
+            )
+        return self._pool
+
+    def publish(self, assets) -> SharedRouteAssets:
+        """
+        RouteAssets의 위치 정보를 만들고 HPA* 추상 그래프를 공유 메모리에 올림 (같은 전처리 데이터와 프로필은 한 번만)
+        그리드와 보조 인덱스는 서비스와 같은 지도 배열 저장소에 있어 워커가 직접 연다
+        """
+        publish_key = (assets.map_id, assets.profile)
+        published = self._published.pop(publish_key, None)
+        if published is not None and published[0].key == assets.preprocessed_id:
+            self._published[publish_key] = published
+            return published[0]
+        if published is not None:
+            self._release(published)
+
+        hierarchy, segments = None, []
+        if assets.hierarchy is not None:
+            encoded = json.dumps(assets.hierarchy.to_dict()).encode('utf-8')
+            hierarchy, shm = SharedArray.create(np.frombuffer(encoded, dtype=np.uint8))
+            segments.append(shm)
+            logger.info(f"HPA* 추상 그래프 공유 메모리 등록: {assets.map_id} ({shm.size / 2 ** 20:.1f}MB)")
+
+        shared = SharedRouteAssets(
+            key=assets.preprocessed_id,
+            map_id=assets.map_id,
+            scale_meters_per_pixel=assets.scale_meters_per_pixel,
+            has_landmarks=assets.landmarks is not None,
+            hierarchy=hierarchy,
+            profile=assets.profile
+        )
+        while len(self._published) >= PUBLISHED_CACHE_SIZE:
+            self._release(self._published.pop(next(iter(self._published))))
+        self._published[publish_key] = (shared, segments)
+        return shared
+
+    @staticmethod
+    def _release(published: Tuple[SharedRouteAssets, List[SharedMemory]]):
+        """공유 메모리 해제 (이미 붙은 워커의 매핑은 닫을 때까지 유효)"""
+        for shm in published[1]:
+            shm.close()
+            shm.unlink()
+
+    async def solve_route(self, assets, start: Tuple[float, float], end: Tuple[float, float],
+                          options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        워커 프로세스에서 PathfindingService._solve_route 실행
+
+        Raises:
+            SearchQueueFullError: 실행/대기 중인 요청이 queue_depth개에 도달
+        """
+        return await self._submit(assets, _solve_in_worker, start, end, options)
+
+    async def run(self, assets, method: str, *args) -> Any:
+        """
+        워커 프로세스에서 PathfindingService의 탐색 메서드(method(assets, *args)) 실행
+        (공유 출발지 최단 경로 트리, 대체 경로 등 - 인자와 반환값은 피클링 가능해야 함)
+
+        Raises:
+            SearchQueueFullError: 실행/대기 중인 요청이 queue_depth개에 도달
+        """
+        return await self._submit(assets, _run_in_worker, method, *args)
+
+    async def _submit(self, assets, function, *args) -> Any:
+        """요청 슬롯을 잡고 지도 데이터를 공유한 뒤 function(shared, slot, *args)을 풀에 제출"""
+        if not self._free_slots:
+            raise SearchQueueFullError(f"탐색 대기열이 가득 찼습니다 (최대 {self.queue_depth}개)")
+
+        slot = self._free_slots.pop()
+        self._table[slot] = 0
+        loop = asyncio.get_running_loop()
+        future = None
+        try:
+            shared = self.publish(assets)
+            future = self._get_pool().submit(function, shared, slot, *args)
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if future is not None:
+                self._cancel(slot, future)
+            raise
+        finally:
+            # 실행 중에 취소된 작업은 워커가 슬롯을 놓을 때까지 슬롯을 반납하지 않음
+            if future is None or future.done():
+                self._free_slots.append(slot)
+            else:
+                future.add_done_callback(
+                    lambda _: loop.call_soon_threadsafe(self._free_slots.append, slot)
+                )
+
+    def _cancel(self, slot: int, future: Future):
+        """대기 중이면 풀에서 제거, 실행 중이면 취소 플래그 + 워커 신호"""
+        if future.cancel():
+            return
+        self._table[slot, _CANCELLED] = 1
+        pid = int(self._table[slot, _WORKER_PID])
+        if pid and _CANCEL_SIGNAL is not None:
+            try:
+                os.kill(pid, _CANCEL_SIGNAL)
+            except ProcessLookupError:
+                pass
+        logger.info(f"실행 중인 탐색 취소 요청 (slot={slot}, pid={pid})")
+
+    def shutdown(self):
+        """프로세스 풀 종료와 공유 메모리 해제"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        for published in self._published.values():
+            self._release(published)
+        self._published.clear()
+        self._control_shm.close()
+        self._control_shm.unlink()
@@ -0,0 +1,1145 @@
+"""
+길찾기 엔진 벤치마크 스크립트
+합성 쇼핑몰 그리드(또는 저장된 grid.json)에서 탐색 엔진 성능을 비교
+
+사용법:
+    python benchmark_pathfinding.py astar
+    python benchmark_pathfinding.py engines
+    python benchmark_pathfinding.py ara
+    python benchmark_pathfinding.py latency
+    python benchmark_pathfinding.py hpa
+    python benchmark_pathfinding.py snap
+    python benchmark_pathfinding.py alt
+    python benchmark_pathfinding.py flowfield
+    python benchmark_pathfinding.py matrix
+    python benchmark_pathfinding.py tour
+    python benchmark_pathfinding.py executor
+    python benchmark_pathfinding.py assets
+    python benchmark_pathfinding.py alternatives
+    python benchmark_pathfinding.py batch
+    python benchmark_pathfinding.py isochrone
+    python benchmark_pathfinding.py nearest
+    python benchmark_pathfinding.py rdp
+    python benchmark_pathfinding.py smoothing
+    python benchmark_pathfinding.py wire
+    python benchmark_pathfinding.py overlay
+    python benchmark_pathfinding.py clearance
+    python benchmark_pathfinding.py profiles
+    python benchmark_pathfinding.py astar --grid storage/processed/<map_id>/grid.json
+"""
+import argparse
+import asyncio
+import heapq
+import json
+import math
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from scipy import ndimage
+
+from app.core.pathfinding.astar import AStarPathfinder, SEARCH_ALGORITHMS, ANY_ANGLE_ALGORITHMS, Point
+from app.core.pathfinding.grid import SearchGrid
+from app.core.pathfinding.hpa import HierarchicalGraph
+from app.core.pathfinding.snapping import SnapIndex
+from app.core.pathfinding.alt import LandmarkTable
+from app.core.pathfinding.flowfield import FlowField
+from app.core.pathfinding.matrix import RouteMatrix
+from app.core.pathfinding.tour import TourOptimizer
+from app.core.pathfinding.components import ComponentIndex
+from app.core.pathfinding.asset_store import MapAssetStore
+from app.core.pathfinding.alternatives import AlternativeRouteFinder
+from app.core.pathfinding.isochrone import IsochroneEngine
+from app.core.pathfinding.nearest import NearestGoalSearch
+from app.core.pathfinding.encoding import encode_route, msgpack
+from app.core.pathfinding.optimizer import PathOptimizer
+from app.core.pathfinding.overlay import CostOverlay, overlay_key
+from app.core.pathfinding.clearance import ClearanceField
+from app.core.pathfinding.profiles import ROUTING_PROFILES, erode_grid
+from app.services.pathfinding_service import PathfindingService, RouteAssets
+from app.services.search_executor import SearchExecutor
+
+
+def make_mall_grid(width: int = 400, height: int = 300, seed: int = 7) -> np.ndarray:
+    """
+    쇼핑몰 형태의 합성 그리드 생성
+    넓은 복도 사이에 출입구가 있는 매장 블록과 긴 벽을 배치
+    """
+    rng = random.Random(seed)
+    grid = np.ones((height, width), dtype=np.uint8)
+
+    # 외벽
+    grid[0, :] = grid[-1, :] = 0
+    grid[:, 0] = grid[:, -1] = 0
+
+    # 매장 블록 (벽 두께 2, 출입구 1개씩 / 일부는 출입구 없는 관리 구역)
+    for top in range(12, height - 40, 48):
+        for left in range(12, width - 40, 56):
+            w = rng.randint(28, 40)
+            h = rng.randint(22, 32)
+            grid[top:top + h, left:left + w] = 0
+            grid[top + 2:top + h - 2, left + 2:left + w - 2] = 1
+            if rng.random() < 0.85:
+                door = left + rng.randint(4, w - 8)
+                grid[top + h - 2:top + h, door:door + 4] = 1
+
+    # 매장 열 사이 복도를 가로막는 긴 칸막이 벽 (복도 행 하나에만 통로)
+    corridor_rows = list(range(46, height - 8, 48))
+    for x in range(116, width - 8, 112):
+        gap = rng.choice(corridor_rows)
+        grid[1:height - 1, x:x + 2] = 0
+        grid[gap:gap + 8, x:x + 2] = 1
+
+    return grid
+
+
+def load_grid(path: Optional[str]) -> np.ndarray:
+    if path is None:
+        return make_mall_grid()
+    with open(path, 'r') as f:
+        return np.array(json.load(f))
+
+
+def sample_queries(grid: np.ndarray, count: int, seed: int = 0,
+                   min_distance: float = 0.5) -> List[Tuple[Tuple[float, float], Tuple[float, float]]]:
+    """
+    가장 큰 연결 영역 안에서 멀리 떨어진 (정규화된) 시작/종료 쌍 샘플링
+    """
+    rng = random.Random(seed)
+    labels, count_labels = ndimage.label(grid == 1, structure=np.ones((3, 3)))
+    sizes = np.bincount(labels.ravel())
+    sizes[0] = 0
+    ys, xs = np.nonzero(labels == sizes.argmax())
+    height, width = grid.shape
+
+    queries = []
+    while len(queries) < count:
+        i, j = rng.randrange(len(xs)), rng.randrange(len(xs))
+        start = ((xs[i] + 0.5) / width, (ys[i] + 0.5) / height)
+        end = ((xs[j] + 0.5) / width, (ys[j] + 0.5) / height)
+        if math.dist(start, end) >= min_distance:
+            queries.append((start, end))
+    return queries
+
+
+# ===== 기존 구현 (Point/Node 데이터클래스 기반 A*) - 비교 기준 =====
+@dataclass
+class _LegacyPoint:
+    x: int
+    y: int
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def __eq__(self, other):
+        return self.x == other.x and self.y == other.y
+
+
+@dataclass
+class _LegacyNode:
+    point: _LegacyPoint
+    g_cost: float
+    h_cost: float
+
+    @property
+    def f_cost(self) -> float:
+        return self.g_cost + self.h_cost
+
+    def __lt__(self, other):
+        return self.f_cost < other.f_cost
+
+
+def legacy_astar(grid: np.ndarray, start: Tuple[int, int], end: Tuple[int, int]) -> Tuple[Optional[float], int]:
+    """기존 _astar_search 구현 재현. Returns: (경로 비용, 확장 노드 수)"""
+    height, width = grid.shape
+    diagonal = math.sqrt(2)
+    directions = [(0, -1, 1.0), (0, 1, 1.0), (-1, 0, 1.0), (1, 0, 1.0),
+                  (-1, -1, diagonal), (1, -1, diagonal), (-1, 1, diagonal), (1, 1, diagonal)]
+
+    def walkable(x, y):
+        return 0 <= x < width and 0 <= y < height and grid[y, x] == 1
+
+    start_p, end_p = _LegacyPoint(*start), _LegacyPoint(*end)
+    open_set = [_LegacyNode(start_p, 0, math.dist(start, end))]
+    closed: Set[_LegacyPoint] = set()
+    g_costs: Dict[_LegacyPoint, float] = {start_p: 0}
+    expansions = 0
+
+    while open_set:
+        current = heapq.heappop(open_set).point
+        if current == end_p:
+            return g_costs[current], expansions
+        if current in closed:
+            continue
+        closed.add(current)
+        expansions += 1
+
+        for dx, dy, cost in directions:
+            neighbor = _LegacyPoint(current.x + dx, current.y + dy)
+            if not walkable(neighbor.x, neighbor.y) or neighbor in closed:
+                continue
+            if dx and dy and not (walkable(current.x + dx, current.y) and walkable(current.x, current.y + dy)):
+                continue
+            tentative = g_costs[current] + cost
+            if neighbor not in g_costs or tentative < g_costs[neighbor]:
+                g_costs[neighbor] = tentative
+                h = math.sqrt((neighbor.x - end_p.x) ** 2 + (neighbor.y - end_p.y) ** 2)
+                heapq.heappush(open_set, _LegacyNode(neighbor, tentative, h))
+
+    return None, expansions
+
+
+def legacy_reduce_waypoints(path: List[Tuple[float, float]], tolerance: float = 0.001) -> List[Tuple[float, float]]:
+    """기존 PathOptimizer.reduce_waypoints 구현 재현 (재귀 + 리스트 분할 + 점별 거리 계산)"""
+    if len(path) <= 2:
+        return path
+
+    (x1, y1), (x2, y2) = path[0], path[-1]
+    length_sq = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 2
+    max_dist, max_idx = 0, 0
+    for i in range(1, len(path) - 1):
+        x0, y0 = path[i]
+        if length_sq == 0:
+            dist = math.sqrt((x0 - x1) ** 2 + (y0 - y1) ** 2)
+        else:
+            t = max(0, min(1, ((x0 - x1) * (x2 - x1) + (y0 - y1) * (y2 - y1)) / length_sq))
+            dist = math.sqrt((x0 - (x1 + t * (x2 - x1))) ** 2 + (y0 - (y1 + t * (y2 - y1))) ** 2)
+        if dist > max_dist:
+            max_dist, max_idx = dist, i
+
+    if max_dist > tolerance:
+        return (legacy_reduce_waypoints(path[:max_idx + 1], tolerance)[:-1]
+                + legacy_reduce_waypoints(path[max_idx:], tolerance))
+    return [path[0], path[-1]]
+
+
+def legacy_smooth_path(path: List[Tuple[float, float]], num_points: int = 20) -> List[Tuple[float, float]]:
+    """기존 PathOptimizer.smooth_path 구현 재현 ('medium': 웨이포인트 수 x 20개 균일 샘플, 충돌 검사 없음)"""
+    from scipy import interpolate
+
+    xs, ys = [p[0] for p in path], [p[1] for p in path]
+    if len(path) >= 4:
+        tck, _ = interpolate.splprep([xs, ys], s=0, k=3)
+        smooth = interpolate.splev(np.linspace(0, 1, num_points * len(path)), tck)
+    else:
+        t = np.linspace(0, 1, len(path))
+        t_new = np.linspace(0, 1, num_points * len(path))
+        smooth = (np.interp(t_new, t, xs), np.interp(t_new, t, ys))
+    return list(zip(smooth[0].tolist(), smooth[1].tolist()))
+
+
+def legacy_svg_path(path: List[Tuple[float, float]]) -> str:
+    """기존 PathOptimizer.create_svg_path 구현 재현 (점마다 f-string 포맷 후 join)"""
+    commands = [f"M {path[0][0]:.4f},{path[0][1]:.4f}"]
+    if len(path) > 2:
+        for i in range(1, len(path) - 1, 2):
+            commands.append(f"Q {path[i][0]:.4f},{path[i][1]:.4f} {path[i + 1][0]:.4f},{path[i + 1][1]:.4f}")
+        if len(path) % 2 == 0:
+            commands.append(f"L {path[-1][0]:.4f},{path[-1][1]:.4f}")
+    else:
+        commands.append(f"L {path[1][0]:.4f},{path[1][1]:.4f}")
+    return " ".join(commands)
+
+
+def _to_cell(grid: np.ndarray, point: Tuple[float, float]) -> Tuple[int, int]:
+    height, width = grid.shape
+    return int(point[0] * width), int(point[1] * height)
+
+
+def bench_astar(grid: np.ndarray, queries) -> None:
+    """기존 구현 대비 배열 기반 A*의 초당 확장 노드 수 비교"""
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    search_grid = SearchGrid(grid)
+
+    legacy_expansions, legacy_time = 0, 0.0
+    new_expansions, new_time = 0, 0.0
+
+    for start, end in queries:
+        s, e = _to_cell(grid, start), _to_cell(grid, end)
+
+        t0 = time.perf_counter()
+        legacy_cost, expansions = legacy_astar(grid, s, e)
+        legacy_time += time.perf_counter() - t0
+        legacy_expansions += expansions
+
+        path, stats = pathfinder._astar_search(search_grid, search_grid.index(*s), search_grid.index(*e))
+        new_time += stats.elapsed
+        new_expansions += stats.expansions
+
+        if legacy_cost is not None and abs(legacy_cost - stats.path_cost) > 1e-6:
+            print(f"  ! 비용 불일치: {legacy_cost:.3f} vs {stats.path_cost:.3f}")
+
+    _print_engine_table([('legacy', legacy_expansions, legacy_time),
+                         ('astar', new_expansions, new_time)], len(queries))
+    print(f"speedup: {legacy_time / new_time:.2f}x")
+
+
+def _print_engine_table(rows, query_count: int) -> None:
+    print(f"{'engine':<16}{'expansions':>12}{'time(s)':>10}{'exp/s':>12}{'ms/query':>10}")
+    for name, expansions, elapsed in rows:
+        print(f"{name:<16}{expansions:>12}{elapsed:>10.3f}"
+              f"{expansions / elapsed:>12.0f}{elapsed / query_count * 1000:>10.2f}")
+
+
+def bench_engines(grid: np.ndarray, queries) -> None:
+    """
+    탐색 엔진별 확장 노드 수/탐색 시간 비교 (A* 대비 경로 비용 동일성 검증 포함)
+    양방향 탐색은 방향별 확장 노드 수도 출력
+    any-angle 엔진은 A*보다 길지 않은지만 검증, HPA*(근사)는 비용 검증 생략
+    """
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    search_grid = SearchGrid(grid)
+    hierarchy = HierarchicalGraph.build(grid)
+    landmarks = LandmarkTable.build(grid)
+    totals = {name: [0, 0.0] for name in SEARCH_ALGORITHMS}
+    directional = [0, 0]
+
+    for start, end in queries:
+        s = search_grid.index(*_to_cell(grid, start))
+        e = search_grid.index(*_to_cell(grid, end))
+        reference = None
+
+        for i, name in enumerate(SEARCH_ALGORITHMS):
+            _, stats = pathfinder._run_engine(name, search_grid, s, e,
+                                              hierarchy=hierarchy, landmarks=landmarks)
+            totals[name][0] += stats.expansions
+            totals[name][1] += stats.elapsed
+
+            if 'forward_expansions' in stats.extra:
+                directional[0] += stats.extra['forward_expansions']
+                directional[1] += stats.extra['backward_expansions']
+
+            if i == 0:
+                reference = stats.path_cost
+            elif name == 'hpa':
+                continue
+            elif name in ANY_ANGLE_ALGORITHMS:
+                if (reference is None) != (stats.path_cost is None) or (
+                        reference is not None and stats.path_cost > reference + 1e-6):
+                    print(f"  ! {name} 비용이 A*보다 큼: {reference} vs {stats.path_cost}")
+            elif reference != stats.path_cost and (
+                    reference is None or stats.path_cost is None or abs(reference - stats.path_cost) > 1e-6):
+                print(f"  ! {name} 비용 불일치: {reference} vs {stats.path_cost}")
+
+    _print_engine_table([(name, *totals[name]) for name in totals], len(queries))
+    print(f"bidirectional expansions: forward={directional[0]}, backward={directional[1]}")
+
+
+def bench_ara(grid: np.ndarray, queries, budgets=(10, 25, 50)) -> None:
+    """ARA* 시간 예산별 지연 시간 분포와 달성한 준최적 한계 / 실제 비용 비율"""
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    search_grid = SearchGrid(grid)
+    cells = [(search_grid.index(*_to_cell(grid, a)), search_grid.index(*_to_cell(grid, b))) for a, b in queries]
+    optimal = [pathfinder._astar_search(search_grid, s, e)[1] for s, e in cells]
+    astar_ms = [stats.elapsed * 1000 for stats in optimal]
+    print(f"astar           p50={np.percentile(astar_ms, 50):7.1f}ms  p99={np.percentile(astar_ms, 99):7.1f}ms")
+
+    for budget in budgets:
+        latencies, bounds, ratios, failures = [], [], [], 0
+        for (s, e), reference in zip(cells, optimal):
+            t0 = time.perf_counter()
+            path, stats = pathfinder._run_engine('ara', search_grid, s, e, time_budget_ms=budget)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            if path is None:
+                failures += 1
+                continue
+            bounds.append(stats.extra['suboptimality_bound'])
+            ratios.append(stats.path_cost / reference.path_cost)
+        print(f"ara {budget:>4}ms     p50={np.percentile(latencies, 50):7.1f}ms  p99={np.percentile(latencies, 99):7.1f}ms"
+              f"  bound(mean)={np.mean(bounds):.3f}  cost/optimal(mean)={np.mean(ratios):.3f}"
+              f"  no-path={failures}/{len(cells)}")
+
+
+def bench_latency(grid: np.ndarray, queries) -> None:
+    """
+    경로 응답 전체 지연 시간 비교 (탐색 + 후처리)
+    기존 파이프라인: A* -> 가시선 스무딩(_smooth_path) -> 웨이포인트 감소(RDP) -> 스플라인
+    any-angle 파이프라인: Lazy Theta* -> 스플라인 (스무딩/RDP 생략)
+    """
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=True)
+    optimizer = PathOptimizer()
+    height, width = grid.shape
+    scale = max(width, height)
+
+    pipelines = [('astar+smooth+rdp', 'astar'), ('lazy_theta', 'lazy_theta')]
+    print(f"{'pipeline':<18}{'search(ms)':>11}{'post(ms)':>10}{'total p50':>11}{'total p99':>11}"
+          f"{'waypoints':>11}{'length':>10}")
+
+    for label, algorithm in pipelines:
+        search_ms, post_ms, totals, waypoints, lengths = [], [], [], [], []
+        for start, end in queries:
+            t0 = time.perf_counter()
+            path, _ = pathfinder.search(grid, start, end, algorithm)
+            t1 = time.perf_counter()
+            optimized = optimizer.optimize_path(
+                path, {}, reduce_waypoints=algorithm not in ANY_ANGLE_ALGORITHMS, grid=grid
+            )
+            t2 = time.perf_counter()
+
+            search_ms.append((t1 - t0) * 1000)
+            post_ms.append((t2 - t1) * 1000)
+            totals.append((t2 - t0) * 1000)
+            waypoints.append(len(optimized['optimized_path']))
+            lengths.append(optimizer.calculate_distance(optimized['optimized_path']) * scale)
+
+        print(f"{label:<18}{np.mean(search_ms):>11.2f}{np.mean(post_ms):>10.2f}"
+              f"{np.percentile(totals, 50):>11.2f}{np.percentile(totals, 99):>11.2f}"
+              f"{np.mean(waypoints):>11.1f}{np.mean(lengths):>10.1f}")
+
+
+def bench_hpa(grid: np.ndarray, queries, scales=(1, 2, 4)) -> None:
+    """
+    지도 크기별 A* / HPA* 탐색 시간 비교
+    --grid를 지정하지 않으면 합성 쇼핑몰 그리드를 scales 배율로 키워서 측정
+    """
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    height, width = grid.shape
+    grids = [grid] if width != 400 or height != 300 else [make_mall_grid(400 * k, 300 * k) for k in scales]
+
+    print(f"{'grid':<11}{'build(s)':>9}{'nodes':>8}{'edges':>8}"
+          f"{'astar p50':>11}{'hpa p50':>10}{'hpa p99':>10}{'cost ratio':>12}")
+    for current in grids:
+        t0 = time.perf_counter()
+        hierarchy = HierarchicalGraph.build(current)
+        build_time = time.perf_counter() - t0
+
+        search_grid = SearchGrid(current)
+        astar_ms, hpa_ms, ratios = [], [], []
+        for start, end in sample_queries(current, len(queries)):
+            s = search_grid.index(*_to_cell(current, start))
+            e = search_grid.index(*_to_cell(current, end))
+            _, reference = pathfinder._astar_search(search_grid, s, e)
+            _, stats = pathfinder._run_engine('hpa', search_grid, s, e, hierarchy=hierarchy)
+            astar_ms.append(reference.elapsed * 1000)
+            hpa_ms.append(stats.elapsed * 1000)
+            ratios.append(stats.path_cost / reference.path_cost)
+
+        print(f"{current.shape[1]}x{current.shape[0]:<6}{build_time:>9.2f}{len(hierarchy.nodes):>8}"
+              f"{len(hierarchy.edges):>8}{np.percentile(astar_ms, 50):>9.1f}ms"
+              f"{np.percentile(hpa_ms, 50):>8.1f}ms{np.percentile(hpa_ms, 99):>8.1f}ms{np.mean(ratios):>12.3f}")
+
+
+def bench_snap(grid: np.ndarray, queries, count: int = 2000, batch: int = 100000) -> None:
+    """
+    장애물 위 좌표 보정: BFS(_find_nearest_walkable_point) vs 거리 변환 인덱스
+    장애물 깊이(가장 가까운 보행 가능 셀까지 거리)별로 측정하고, 일괄 보정 처리량도 출력
+    """
+    pathfinder = AStarPathfinder()
+    t0 = time.perf_counter()
+    snap_index = SnapIndex.build(grid)
+    print(f"index build: {(time.perf_counter() - t0) * 1000:.1f}ms")
+
+    depth = ndimage.distance_transform_edt(grid != 1)
+    rng = np.random.default_rng(0)
+    print(f"{'depth':<10}{'cells':>8}{'bfs(us)':>10}{'index(us)':>11}")
+    for low, high in ((0, 2), (2, 5), (5, 15), (15, 50)):
+        ys, xs = np.nonzero((depth > low) & (depth <= high))
+        if len(xs) == 0:
+            continue
+        picks = rng.integers(len(xs), size=min(count, len(xs)))
+        bfs_time = index_time = 0.0
+        for k in picks:
+            x, y = int(xs[k]), int(ys[k])
+            t0 = time.perf_counter()
+            pathfinder._find_nearest_walkable_point(grid, Point(x, y))
+            t1 = time.perf_counter()
+            snap_index.snap(x, y)
+            index_time += time.perf_counter() - t1
+            bfs_time += t1 - t0
+        print(f"({low},{high}]{'':<5}{len(xs):>8}{bfs_time / len(picks) * 1e6:>10.1f}"
+              f"{index_time / len(picks) * 1e6:>11.2f}")
+
+    height, width = grid.shape
+    xs = rng.integers(0, width, size=batch)
+    ys = rng.integers(0, height, size=batch)
+    t0 = time.perf_counter()
+    snap_index.snap_many(xs, ys)
+    print(f"snap_many: {batch} points in {(time.perf_counter() - t0) * 1000:.1f}ms")
+
+
+def bench_alt(grid: np.ndarray, queries, landmark_counts=(4, 8, 16)) -> None:
+    """
+    ALT(랜드마크 휴리스틱) vs A*(옥타일 휴리스틱): 확장 노드 수, 지연 시간, 테이블 크기
+    경로 비용이 A*와 같은지(최적성)도 검증
+    """
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    search_grid = SearchGrid(grid)
+    cells = [(search_grid.index(*_to_cell(grid, a)), search_grid.index(*_to_cell(grid, b))) for a, b in queries]
+    reference = [pathfinder._astar_search(search_grid, s, e)[1] for s, e in cells]
+
+    print(f"{'engine':<10}{'build(s)':>9}{'table(MB)':>10}{'expansions':>12}"
+          f"{'p50(ms)':>9}{'p99(ms)':>9}{'h(ms)':>7}")
+    astar_ms = [stats.elapsed * 1000 for stats in reference]
+    print(f"{'astar':<10}{'':>9}{'':>10}{sum(s.expansions for s in reference):>12}"
+          f"{np.percentile(astar_ms, 50):>9.1f}{np.percentile(astar_ms, 99):>9.1f}{'':>7}")
+
+    for count in landmark_counts:
+        t0 = time.perf_counter()
+        table = LandmarkTable.build(grid, count)
+        build_time = time.perf_counter() - t0
+
+        expansions, latencies, heuristic_ms = 0, [], []
+        for (s, e), expected in zip(cells, reference):
+            _, stats = pathfinder._run_engine('alt', search_grid, s, e, landmarks=table)
+            expansions += stats.expansions
+            latencies.append(stats.elapsed * 1000)
+            heuristic_ms.append(stats.extra['heuristic_elapsed'] * 1000)
+            if abs(stats.path_cost - expected.path_cost) > 1e-3:
+                print(f"  ! 비용 불일치: {expected.path_cost:.4f} vs {stats.path_cost:.4f}")
+
+        print(f"{'alt-' + str(count):<10}{build_time:>9.2f}{table.distances.nbytes / 2 ** 20:>10.1f}"
+              f"{expansions:>12}{np.percentile(latencies, 50):>9.1f}{np.percentile(latencies, 99):>9.1f}"
+              f"{np.mean(heuristic_ms):>7.1f}")
+
+
+def bench_flowfield(grid: np.ndarray, queries, poi_count: int = 5) -> None:
+    """
+    POI 흐름장: 생성 시간/크기, 쿼리의 출발점에서 POI까지 A* vs 흐름장 추적 지연 시간
+    경로 비용이 A*와 같은지도 검증
+    """
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    search_grid = SearchGrid(grid)
+    starts = [search_grid.index(*_to_cell(grid, a)) for a, _ in queries]
+    goals = [_to_cell(grid, b) for _, b in queries[:poi_count]]
+
+    t0 = time.perf_counter()
+    fields = [FlowField.build(grid, goal) for goal in goals]
+    build_time = (time.perf_counter() - t0) / len(fields)
+    size = fields[0].distances.nbytes + fields[0].directions.nbytes
+    print(f"POI {len(fields)}개, 흐름장 생성 {build_time * 1000:.1f}ms/POI, {size / 2 ** 20:.2f}MB/POI")
+
+    astar_ms, field_ms = [], []
+    for field in fields:
+        goal = search_grid.index(*field.goal)
+        for start in starts:
+            _, expected = pathfinder._astar_search(search_grid, start, goal)
+            _, stats = pathfinder._run_engine('flow_field', search_grid, start, goal, flow_field=field)
+            astar_ms.append(expected.elapsed * 1000)
+            field_ms.append(stats.elapsed * 1000)
+            if abs(stats.path_cost - expected.path_cost) > 1e-3:
+                print(f"  ! 비용 불일치: {expected.path_cost:.4f} vs {stats.path_cost:.4f}")
+
+    print(f"{'engine':<12}{'p50(ms)':>9}{'p99(ms)':>9}")
+    for name, samples in (('astar', astar_ms), ('flow_field', field_ms)):
+        print(f"{name:<12}{np.percentile(samples, 50):>9.2f}{np.percentile(samples, 99):>9.2f}")
+
+
+def bench_matrix(grid: np.ndarray, queries, sizes=(5, 10, 20)) -> None:
+    """
+    N x N 보행 거리 행렬: 쌍별 A* N(N-1)번 vs 출발지별 Dijkstra N번
+    행렬 값이 A* 비용과 같은지도 검증
+    """
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    search_grid = SearchGrid(grid)
+    t0 = time.perf_counter()
+    engine = RouteMatrix(grid)
+    print(f"movement graph build: {(time.perf_counter() - t0) * 1000:.1f}ms")
+
+    cells = [_to_cell(grid, p) for query in queries for p in query]
+    print(f"{'points':<8}{'astar(ms)':>11}{'matrix(ms)':>12}{'searches':>10}")
+    for size in sizes:
+        if size > len(cells):
+            break
+        subset = cells[:size]
+        distances, _, stats = engine.compute(subset)
+
+        t0 = time.perf_counter()
+        for i, a in enumerate(subset):
+            for j, b in enumerate(subset):
+                if i == j:
+                    continue
+                _, expected = pathfinder._astar_search(search_grid, search_grid.index(*a), search_grid.index(*b))
+                if expected.path_cost is not None and abs(expected.path_cost - distances[i, j]) > 1e-6:
+                    print(f"  ! 비용 불일치: {expected.path_cost:.4f} vs {distances[i, j]:.4f}")
+        astar_time = time.perf_counter() - t0
+
+        print(f"{size:<8}{astar_time * 1000:>11.1f}{stats['elapsed'] * 1000:>12.1f}{stats['searches']:>10}")
+
+
+def _legacy_greedy_order(points: List[Tuple[float, float]]) -> List[int]:
+    """기존 _optimize_waypoint_order: 직선 거리 기준 최근접 이웃"""
+    order = [0]
+    remaining = list(range(1, len(points)))
+    while remaining:
+        current = points[order[-1]]
+        nearest = min(remaining, key=lambda i: math.dist(current, points[i]))
+        order.append(nearest)
+        remaining.remove(nearest)
+    return order
+
+
+def bench_tour(grid: np.ndarray, queries, sizes=(10, 15, 30), trials: int = 5) -> None:
+    """
+    경유지 순서 최적화: 직선 거리 그리디(기존) vs 보행 거리 최근접 이웃 vs + 2-opt/Or-opt
+    투어 길이는 모두 보행 거리(그리드 셀)로 비교, 출발지 복귀 없음
+    """
+    labels = ComponentIndex.build(grid).labels
+    sizes_by_label = np.bincount(labels.ravel())
+    sizes_by_label[0] = 0
+    ys, xs = np.nonzero(labels == sizes_by_label.argmax())
+    height, width = grid.shape
+    engine = RouteMatrix(grid)
+    rng = np.random.default_rng(0)
+
+    print(f"{'stops':<7}{'euclid':>10}{'nn':>10}{'2opt+or':>10}{'vs euclid':>11}{'vs nn':>8}{'opt(ms)':>9}")
+    for size in sizes:
+        totals = np.zeros(3)
+        elapsed = 0.0
+        for _ in range(trials):
+            picks = rng.choice(len(xs), size=size, replace=False)
+            cells = [(int(xs[i]), int(ys[i])) for i in picks]
+            points = [((x + 0.5) / width, (y + 0.5) / height) for x, y in cells]
+            distances, _, _ = engine.compute(cells)
+
+            legacy = _legacy_greedy_order(points)
+            _, stats = TourOptimizer(distances).optimize()
+            totals += (sum(distances[a, b] for a, b in zip(legacy, legacy[1:])),
+                       stats['greedy_length'], stats['optimized_length'])
+            elapsed += stats['elapsed']
+
+        euclid, nn, optimized = totals / trials
+        print(f"{size:<7}{euclid:>10.1f}{nn:>10.1f}{optimized:>10.1f}"
+              f"{(1 - optimized / euclid) * 100:>10.1f}%{(1 - optimized / nn) * 100:>7.1f}%"
+              f"{elapsed / trials * 1000:>9.1f}")
+
+
+def bench_executor(grid: np.ndarray, queries, workers: int = 2) -> None:
+    """
+    동시 경로 요청 처리 중 이벤트 루프 지연 비교: 스레드 풀 vs 프로세스 풀(메모리 맵 저장소)
+    5ms 주기로 깨어나는 코루틴의 지연(계획보다 늦게 깨어난 시간)을 측정
+    """
+    options = {'algorithm': 'astar'}
+
+    async def ticker(stop: asyncio.Event, lags: List[float]):
+        while not stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append((time.perf_counter() - started - 0.005) * 1000)
+
+    async def run(service: PathfindingService):
+        # 워커 기동/지도 공유 비용은 제외
+        await service._run_solver(assets, *queries[0], options)
+        stop, lags = asyncio.Event(), []
+        task = asyncio.create_task(ticker(stop, lags))
+        started = time.perf_counter()
+        await asyncio.gather(*(service._run_solver(assets, start, end, options) for start, end in queries))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await task
+        return elapsed, lags
+
+    print(f"{'executor':<10}{'routes/s':>10}{'lag p50(ms)':>13}{'lag p99(ms)':>13}{'lag max(ms)':>13}")
+    with tempfile.TemporaryDirectory() as directory:
+        # 워커는 지도 배열 저장소에서 지도 데이터를 열기 때문에 저장소에 먼저 저장
+        stored = MapAssetStore(directory, {}).write('bench', 'bench', grid)
+        assets = RouteAssets(
+            map_id='bench', scale_meters_per_pixel=1.0, preprocessed_id='bench', grid=stored.grid,
+            hierarchy=None, landmarks=None, components=stored.components,
+            snap_index=stored.snap_index, clearance=stored.clearance, flow_fields={}
+        )
+        executor = SearchExecutor(max_workers=workers, queue_depth=len(queries) + 1, storage_path=directory)
+        try:
+            for label, service in (('thread', PathfindingService(directory, max_workers=workers)),
+                                   ('process', PathfindingService(directory, search_executor=executor))):
+                elapsed, lags = asyncio.run(run(service))
+                print(f"{label:<10}{len(queries) / elapsed:>10.1f}{np.percentile(lags, 50):>13.2f}"
+                      f"{np.percentile(lags, 99):>13.2f}{max(lags):>13.2f}")
+        finally:
+            executor.shutdown()
+
+
+def bench_assets(grid: np.ndarray, queries, repeats: int = 5) -> None:
+    """
+    콜드 워커의 지도 데이터 준비 시간: DB 그리드 JSON 디코딩 + 인덱스 생성 vs 메모리 맵 저장소 열기
+    (메모리 맵은 처음 접근한 페이지만 읽으므로 첫 탐색까지 포함해 비교)
+    """
+    encoded = json.dumps(grid.tolist())
+    start, end = queries[0]
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=True)
+
+    def from_json():
+        decoded = np.array(json.loads(encoded))
+        return decoded, ComponentIndex.build(decoded), SnapIndex.build(decoded)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = MapAssetStore(directory)
+        store.write('bench', 'bench', grid)
+
+        def from_store():
+            stored = store.load('bench', 'bench')
+            return stored.grid, stored.components, stored.snap_index
+
+        print(f"{'source':<8}{'load(ms)':>10}{'+search(ms)':>13}{'private MB':>12}")
+        for label, load in (('json', from_json), ('mmap', from_store)):
+            load_ms, total_ms = [], []
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                loaded_grid, components, snap_index = load()
+                t1 = time.perf_counter()
+                pathfinder.search(loaded_grid, start, end, 'astar', components=components, snap_index=snap_index)
+                load_ms.append((t1 - t0) * 1000)
+                total_ms.append((time.perf_counter() - t0) * 1000)
+            # 프로세스마다 따로 갖는 배열 메모리 (메모리 맵은 페이지 캐시를 공유)
+            private = sum(a.nbytes for a in (loaded_grid, components.labels, snap_index.nearest_x,
+                                             snap_index.nearest_y) if not isinstance(a, np.memmap))
+            print(f"{label:<8}{np.median(load_ms):>10.2f}{np.median(total_ms):>13.2f}{private / 2 ** 20:>12.2f}")
+
+
+def bench_alternatives(grid: np.ndarray, queries, max_alternatives: int = 3) -> None:
+    """
+    대체 경로: 기존 방식(대각선 이동 끄기 + 스무딩 변경으로 전체 파이프라인 재실행) vs plateau 방식
+    서로 다른 경로 수는 최적 경로와 셀 경로가 다른 경로 수
+    """
+    height, width = grid.shape
+    components = ComponentIndex.build(grid)
+    snap_index = SnapIndex.build(grid)
+    finder = AlternativeRouteFinder(grid)
+    legacy = AStarPathfinder(diagonal_movement=True, smooth_path=True)
+    legacy_orthogonal = AStarPathfinder(diagonal_movement=False, smooth_path=True)
+
+    print(f"{'method':<10}{'p50(ms)':>9}{'searches':>10}{'distinct':>10}{'stretch':>9}{'overlap':>9}")
+    legacy_ms, legacy_distinct = [], []
+    plateau_ms, plateau_distinct, stretches, overlaps = [], [], [], []
+    for start, end in queries:
+        t0 = time.perf_counter()
+        main, _ = legacy.search(grid, start, end, 'astar', components, snap_index)
+        orthogonal, _ = legacy_orthogonal.search(grid, start, end, 'astar', components, snap_index)
+        # 스무딩 레벨만 다른 경로는 탐색 결과가 같음
+        smooth, _ = legacy.search(grid, start, end, 'astar', components, snap_index)
+        legacy_ms.append((time.perf_counter() - t0) * 1000)
+        legacy_distinct.append(sum(path is not None and path != main for path in (orthogonal, smooth)))
+
+        a = snap_index.snap(int(start[0] * width), int(start[1] * height))
+        b = snap_index.snap(int(end[0] * width), int(end[1] * height))
+        t0 = time.perf_counter()
+        routes, _ = finder.find(a, b, max_alternatives)
+        plateau_ms.append((time.perf_counter() - t0) * 1000)
+        plateau_distinct.append(len(routes) - 1)
+        stretches.extend(route['stretch'] for route in routes[1:])
+        overlaps.extend(route['overlap'] for route in routes[1:])
+
+    print(f"{'legacy':<10}{np.median(legacy_ms):>9.1f}{3:>10}{np.mean(legacy_distinct):>10.2f}{'-':>9}{'-':>9}")
+    print(f"{'plateau':<10}{np.median(plateau_ms):>9.1f}{2:>10}{np.mean(plateau_distinct):>10.2f}"
+          f"{np.mean(stretches) if stretches else 0:>9.3f}{np.mean(overlaps) if overlaps else 0:>9.2f}")
+
+
+def bench_batch(grid: np.ndarray, queries, targets_per_source=(1, 5, 20)) -> None:
+    """
+    배치 길찾기: 쌍마다 A* vs 출발지별 최단 경로 트리 하나 (RouteMatrix.paths_from)
+    출발지마다 목적지 N개를 붙인 쌍 묶음으로 비교 (쌍당 처리 시간, 경로 비용 일치 여부)
+    """
+    height, width = grid.shape
+    components = ComponentIndex.build(grid)
+    snap_index = SnapIndex.build(grid)
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    engine = RouteMatrix(grid)
+    sources = [start for start, _ in queries[:5]]
+    ends = [end for _, end in queries]
+
+    def cell(point):
+        return snap_index.snap(int(point[0] * width), int(point[1] * height))
+
+    print(f"{'targets/src':<12}{'astar ms/pair':>15}{'tree ms/pair':>14}{'cost match':>12}")
+    for count in targets_per_source:
+        astar_ms, tree_ms, matched, total = 0.0, 0.0, 0, 0
+        for source in sources:
+            targets = ends[:count]
+            t0 = time.perf_counter()
+            reference = [pathfinder.search(grid, source, end, 'astar', components, snap_index)[1]
+                         for end in targets]
+            astar_ms += (time.perf_counter() - t0) * 1000
+
+            t0 = time.perf_counter()
+            costs, _ = engine.paths_from(cell(source), [cell(end) for end in targets])
+            tree_ms += (time.perf_counter() - t0) * 1000
+
+            for stats, cost in zip(reference, costs.tolist()):
+                total += 1
+                matched += stats is not None and stats.path_cost is not None and abs(stats.path_cost - cost) < 1e-6
+        pairs = len(sources) * count
+        print(f"{count:<12}{astar_ms / pairs:>15.2f}{tree_ms / pairs:>14.2f}{matched:>7}/{total}")
+
+
+def bench_isochrone(grid: np.ndarray, queries, bands_minutes=(0.5, 1, 2), meters_per_cell: float = 0.5) -> None:
+    """
+    도달 가능 영역: 시간 구간별 Dijkstra 상한 + 윤곽선 생성 시간 (출발지별 한 번의 탐색)
+    """
+    engine = IsochroneEngine(grid)
+    snap_index = SnapIndex.build(grid)
+    height, width = grid.shape
+    starts = [snap_index.snap(int(start[0] * width), int(start[1] * height)) for start, _ in queries]
+
+    print(f"{'max band(min)':<15}{'search(ms)':>11}{'total(ms)':>11}{'reached':>10}{'polygons':>10}")
+    for i in range(1, len(bands_minutes) + 1):
+        bands = [band * 60 for band in bands_minutes[:i]]
+        search_ms, total_ms, reached, polygons = [], [], [], []
+        for start in starts:
+            results, stats = engine.compute(start, bands, meters_per_cell)
+            search_ms.append(stats['search_elapsed'] * 1000)
+            total_ms.append(stats['elapsed'] * 1000)
+            reached.append(stats['reached_cells'])
+            polygons.append(sum(len(band['polygons']) for band in results))
+        print(f"{bands_minutes[i - 1]:<15}{np.median(search_ms):>11.2f}{np.median(total_ms):>11.2f}"
+              f"{np.mean(reached):>10.0f}{np.mean(polygons):>10.1f}")
+
+
+def bench_nearest(grid: np.ndarray, queries, poi_counts=(10, 50, 200), k: int = 3) -> None:
+    """
+    가장 가까운 POI k개: 후보마다 A*를 실행해 정렬 vs 다중 목적지 탐색 한 번
+    두 방식의 상위 k개 비용이 같은지도 검증
+    """
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    search_grid = SearchGrid(grid)
+    engine = NearestGoalSearch(search_grid)
+    starts = [_to_cell(grid, a) for a, _ in queries]
+    pool = [_to_cell(grid, end) for _, end in sample_queries(grid, max(poi_counts), seed=1, min_distance=0)]
+
+    print(f"{'POIs':<8}{'per-POI A*(ms)':>16}{'multi-goal(ms)':>16}{'expanded A*':>13}{'expanded MG':>13}")
+    for count in poi_counts:
+        goals = pool[:count]
+        astar_ms, nearest_ms, astar_expanded, nearest_expanded = [], [], [], []
+        for start in starts:
+            t0 = time.perf_counter()
+            costs, expanded = [], 0
+            for goal in goals:
+                _, stats = pathfinder._astar_search(search_grid, search_grid.index(*start), search_grid.index(*goal))
+                costs.append(stats.path_cost if stats.path_cost is not None else math.inf)
+                expanded += stats.expansions
+            expected = sorted(costs)[:k]
+            astar_ms.append((time.perf_counter() - t0) * 1000)
+            astar_expanded.append(expanded)
+
+            results, stats = engine.search(start, goals, k)
+            nearest_ms.append(stats.elapsed * 1000)
+            nearest_expanded.append(stats.expansions)
+            if any(abs(cost - want) > 1e-6 for (_, cost, _), want in zip(results, expected)):
+                print(f"  ! 비용 불일치: {expected} vs {[cost for _, cost, _ in results]}")
+
+        print(f"{count:<8}{np.median(astar_ms):>16.2f}{np.median(nearest_ms):>16.2f}"
+              f"{np.mean(astar_expanded):>13.0f}{np.mean(nearest_expanded):>13.0f}")
+
+
+def bench_rdp(grid: np.ndarray, queries, length: int = 10000, repeats: int = 3) -> None:
+    """
+    웨이포인트 감소(RDP): 기존 재귀 구현 vs 구간 스택 + 벡터화 구현 (10k 점 경로)
+    walk: 8방향 격자 보행 경로 (탐색 결과와 같은 계단형), zigzag: 진폭이 점점 커져 분할이 한 점씩 일어나는 최악 경로
+    """
+    optimizer = PathOptimizer()
+    rng = np.random.default_rng(0)
+
+    # 지도 한 변이 경로 길이만큼인 큰 지도의 셀 경로 (정규화 좌표)
+    steps = rng.choice([-1, 0, 1], size=(length - 1, 2), p=[0.2, 0.3, 0.5])
+    walk = np.vstack([[0, 0], np.cumsum(steps, axis=0)]) / length
+    i = np.arange(length)
+    zigzag = np.c_[i / length, (-1.0) ** i * 1.001 ** i / 30000]
+
+    print(f"{'path':<8}{'points':>8}{'legacy(ms)':>12}{'new(ms)':>10}{'kept':>7}{'same':>6}")
+    for name, points in (('walk', walk), ('zigzag', zigzag)):
+        path = [tuple(p) for p in points.tolist()]
+        new_ms = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            reduced = optimizer.reduce_waypoints(path)
+            new_ms.append((time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        try:
+            expected = legacy_reduce_waypoints(path)
+            legacy_ms = f"{(time.perf_counter() - t0) * 1000:.1f}"
+            same = 'yes' if expected == reduced else 'NO'
+        except RecursionError:
+            legacy_ms, same = 'recursion', '-'
+
+        print(f"{name:<8}{len(path):>8}{legacy_ms:>12}{np.median(new_ms):>10.1f}{len(reduced):>7}{same:>6}")
+
+
+def bench_smoothing(grid: np.ndarray, queries) -> None:
+    """
+    경로 스무딩: 기존 균일 샘플링(웨이포인트 x 20) vs 곡률 기반 적응형 샘플링 + 충돌 구간 직선 대체
+    폴리라인 점 수, 장애물을 지나는 선분이 있는 경로 수, 스무딩 시간과 경로 길이 비교
+    """
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=True)
+    optimizer = PathOptimizer()
+    scale = max(grid.shape)
+
+    rows = {'legacy': ([], [], [], []), 'adaptive': ([], [], [], [])}
+    for start, end in queries:
+        path, _ = pathfinder.search(grid, start, end, 'astar')
+        unique = optimizer._remove_duplicates(path)
+        reduced = optimizer.reduce_waypoints(unique)
+        if len(reduced) < 4:
+            continue
+
+        for name, smooth in (('legacy', lambda: legacy_smooth_path(reduced)),
+                             ('adaptive', lambda: optimizer.smooth_path(reduced, 'medium', grid, unique))):
+            t0 = time.perf_counter()
+            polyline = smooth()
+            elapsed = (time.perf_counter() - t0) * 1000
+            points, collisions, times, lengths = rows[name]
+            points.append(len(polyline))
+            collisions.append(bool(optimizer._blocked_segments(np.asarray(polyline), grid).any()))
+            times.append(elapsed)
+            lengths.append(optimizer.calculate_distance(polyline) * scale)
+
+    print(f"{'smoother':<10}{'routes':>8}{'points':>9}{'colliding':>11}{'time(ms)':>10}{'length':>9}")
+    for name, (points, collisions, times, lengths) in rows.items():
+        print(f"{name:<10}{len(points):>8}{np.mean(points):>9.1f}{sum(collisions):>11}"
+              f"{np.median(times):>10.2f}{np.mean(lengths):>9.1f}")
+    print(f"polyline reduction: {np.mean(rows['legacy'][0]) / np.mean(rows['adaptive'][0]):.1f}x")
+
+
+def bench_wire(grid: np.ndarray, queries, repeats: int = 20) -> None:
+    """
+    경로 응답 직렬화: 형식별 바이트 수와 경로당 직렬화 시간 (json / polyline / msgpack / float32)
+    스무딩한 응답 경로와 (긴 경로 예시로) 스무딩 전 셀 경로 각각 측정하고,
+    SVG 경로 문자열 생성도 기존 점별 포맷 vs 템플릿 한 번 포맷으로 비교
+    """
+    raw_pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    optimizer = PathOptimizer()
+
+    smoothed, raw = [], []
+    for start, end in queries:
+        path, stats = raw_pathfinder.search(grid, start, end, 'astar')
+        optimized = optimizer.optimize_path(path, {}, grid=grid)
+        route = {
+            'path_id': 'bench',
+            'map_id': 'bench',
+            'polyline': optimized['smooth_path'],
+            'svg_path': optimized['svg_path'],
+            'metadata': {'distance_meters': optimized['distance'], 'turn_count': len(optimized['waypoints'])},
+            'search_stats': stats.to_dict(),
+            'cached': False,
+            'processing_time': 0.0
+        }
+        smoothed.append(route)
+        raw.append({**route, 'polyline': path, 'svg_path': optimizer.create_svg_path(path)})
+
+    formats = ['json', 'polyline', 'msgpack', 'float32'] if msgpack is not None else ['json', 'polyline', 'float32']
+    if msgpack is None:
+        print("msgpack 미설치 - msgpack 형식 제외")
+
+    for label, routes in (('smoothed', smoothed), ('raw cells', raw)):
+        print(f"{label}: {len(routes)} routes, {np.mean([len(r['polyline']) for r in routes]):.1f} points/route")
+        print(f"  {'format':<10}{'bytes':>9}{'ratio':>8}{'us/route':>10}")
+        json_bytes = None
+        for fmt in formats:
+            t0 = time.perf_counter()
+            for _ in range(repeats):
+                sizes = [len(encode_route(route, fmt)) for route in routes]
+            elapsed = (time.perf_counter() - t0) / (repeats * len(routes)) * 1e6
+            json_bytes = json_bytes or np.mean(sizes)
+            print(f"  {fmt:<10}{np.mean(sizes):>9.0f}{json_bytes / np.mean(sizes):>8.1f}{elapsed:>10.1f}")
+
+        polylines = [route['polyline'] for route in routes]
+        for name, build in (('svg legacy', legacy_svg_path), ('svg', optimizer.create_svg_path)):
+            t0 = time.perf_counter()
+            for _ in range(repeats):
+                svgs = [build(polyline) for polyline in polylines]
+            elapsed = (time.perf_counter() - t0) / (repeats * len(polylines)) * 1e6
+            print(f"  {name:<18}{elapsed:>9.1f}")
+        if svgs != [legacy_svg_path(polyline) for polyline in polylines]:
+            print("  ! SVG 문자열 불일치")
+
+
+def bench_overlay(grid: np.ndarray, queries, half_size: float = 0.04) -> None:
+    """
+    회피/선호 영역 오버레이: 경로 가운데를 막는 회피 영역을 요청마다 지정
+    - 래스터화(cv2.fillPoly) 시간과 캐시 조회(영역 해시) 시간
+    - 기존 동작(영역 무시)에서 회피 영역을 지나는 경로 수 vs 오버레이 탐색 결과
+    - 통행 금지 영역 A* / 비용 영역(penalty) 가중치 A*의 탐색 시간과 경로 길이
+    """
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    height, width = grid.shape
+    cache: Dict[str, CostOverlay] = {}
+
+    rows = {'ignore': ([], [], []), 'blocked': ([], [], []), 'penalty': ([], [], [])}
+    build_ms, hit_us = [], []
+    for start, end in queries:
+        path, _ = pathfinder.search(grid, start, end, 'astar')
+        if path is None or len(path) < 3:
+            continue
+        mx, my = path[len(path) // 2]
+        x0, x1, y0, y1 = mx - half_size, mx + half_size, my - half_size, my + half_size
+        polygon = [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+        inside = np.zeros(grid.shape, dtype=bool)
+        inside[int(round(y0 * height)):int(round(y1 * height)) + 1, int(round(x0 * width)):int(round(x1 * width)) + 1] = True
+
+        t0 = time.perf_counter()
+        blocked = CostOverlay.build(grid, [polygon], None)
+        build_ms.append((time.perf_counter() - t0) * 1000)
+        penalty = CostOverlay.build(grid, [{'polygon': polygon, 'penalty': 5}], None)
+        cache[blocked.key] = blocked
+
+        t0 = time.perf_counter()
+        cache.get(overlay_key([polygon], None))
+        hit_us.append((time.perf_counter() - t0) * 1e6)
+
+        runs = (('ignore', lambda: pathfinder.search(grid, start, end, 'astar')),
+                ('blocked', lambda: pathfinder.search(grid, start, end, 'astar', overlay=blocked)),
+                ('penalty', lambda: pathfinder.search(grid, start, end, 'astar', cost_field=penalty.costs)))
+        for name, run in runs:
+            result, stats = run()
+            crossings, times, lengths = rows[name]
+            if result is None:
+                continue
+            cells = [_to_cell(grid, point) for point in result]
+            crossings.append(any(inside[y, x] and not blocked.grid[y, x] for x, y in cells))
+            times.append(stats.elapsed * 1000)
+            lengths.append(sum(math.dist(a, b) for a, b in zip(cells, cells[1:])))
+
+    print(f"rasterize: {np.median(build_ms):.2f} ms/overlay, cache hit: {np.median(hit_us):.1f} us")
+    print(f"{'mode':<10}{'routes':>8}{'crossing':>10}{'search(ms)':>12}{'length':>9}")
+    for name, (crossings, times, lengths) in rows.items():
+        print(f"{name:<10}{len(times):>8}{sum(crossings):>10}{np.median(times):>12.2f}{np.mean(lengths):>9.1f}")
+
+
+def bench_clearance(grid: np.ndarray, queries) -> None:
+    """
+    벽 간격 비용 필드: 생성 시간/크기, 요청마다 만들 때와 공유할 때의 준비 시간,
+    A* vs 벽 간격 가중치 A*의 탐색 시간·경로 길이·스무딩한 경로의 평균/최소 벽 거리(셀) 비교
+    """
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=True)
+    height, width = grid.shape
+    distances = ndimage.distance_transform_edt(np.pad(grid == 1, 1))[1:-1, 1:-1]
+
+    t0 = time.perf_counter()
+    clearance = ClearanceField.build(grid)
+    build_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    cost_field = clearance.cost_field()
+    prepare_ms = (time.perf_counter() - t0) * 1000
+    print(f"uint8 field (once per preprocessing): {build_ms:.1f} ms, {clearance.levels.nbytes / 1024:.0f} KiB")
+    print(f"float32 cost field (once per process): {prepare_ms:.2f} ms, {cost_field.values.nbytes / 1024:.0f} KiB")
+
+    def wall_distance(path):
+        # 경로 선분을 1셀 간격으로 샘플링한 점들의 장애물까지 거리
+        points = np.asarray(path) * [width, height]
+        samples = [points[-1]]
+        for a, b in zip(points, points[1:]):
+            count = max(2, int(np.hypot(*(b - a))) + 1)
+            samples.extend(a + (b - a) * t for t in np.linspace(0, 1, count, endpoint=False))
+        cells = np.clip(np.round(samples).astype(int), 0, [width - 1, height - 1])
+        values = distances[cells[:, 1], cells[:, 0]]
+        return values.mean(), values.min()
+
+    rows = {'astar': ([], [], [], [], []), 'clearance': ([], [], [], [], [])}
+    for start, end in queries:
+        for name, options in (('astar', {}), ('clearance', {'cost_field': cost_field})):
+            path, stats = pathfinder.search(grid, start, end, 'astar', **options)
+            if path is None:
+                continue
+            times, expansions, lengths, means, minimums = rows[name]
+            mean, minimum = wall_distance(path)
+            times.append(stats.elapsed * 1000)
+            expansions.append(stats.expansions)
+            lengths.append(sum(math.dist(a, b) for a, b in zip(path, path[1:])) * max(grid.shape))
+            means.append(mean)
+            minimums.append(minimum)
+
+    print(f"{'engine':<11}{'routes':>8}{'time(ms)':>10}{'expanded':>10}{'length':>9}{'wall mean':>11}{'wall min':>10}")
+    for name, (times, expansions, lengths, means, minimums) in rows.items():
+        print(f"{name:<11}{len(times):>8}{np.median(times):>10.2f}{np.mean(expansions):>10.0f}"
+              f"{np.mean(lengths):>9.1f}{np.mean(means):>11.2f}{np.mean(minimums):>10.2f}")
+
+
+def bench_profiles(grid: np.ndarray, queries) -> None:
+    """
+    접근성 프로필: 전처리 시 프로필별 침식/저장 비용, 요청마다 침식할 때와 저장된 프로필을 열 때의 준비 시간,
+    프로필별 경로 성공 수·길이와 경로가 지나는 최소 벽 거리(셀, 필요 거리 = (최소 폭 + 1) / 2)
+    """
+    # 직선화(가시선 스무딩)는 셀 경계를 반 셀 안쪽까지 스칠 수 있어 통로 폭은 셀 경로로 확인
+    pathfinder = AStarPathfinder(diagonal_movement=True, smooth_path=False)
+    height, width = grid.shape
+    distances = ndimage.distance_transform_edt(np.pad(grid == 1, 1))[1:-1, 1:-1]
+
+    def wall_minimum(path):
+        # 경로 선분을 0.5셀 간격으로 샘플링한 점들의 장애물까지 최소 거리
+        points = np.asarray(path) * [width, height]
+        samples = [points[-1]]
+        for a, b in zip(points, points[1:]):
+            count = max(2, int(np.hypot(*(b - a)) * 2) + 1)
+            samples.extend(a + (b - a) * t for t in np.linspace(0, 1, count, endpoint=False))
+        cells = np.clip(np.round(samples).astype(int), 0, [width - 1, height - 1])
+        return distances[cells[:, 1], cells[:, 0]].min()
+
+    with tempfile.TemporaryDirectory() as directory:
+        t0 = time.perf_counter()
+        MapAssetStore(directory, profiles={}).write('base', 'bench', grid)
+        base_ms = (time.perf_counter() - t0) * 1000
+        t0 = time.perf_counter()
+        store = MapAssetStore(directory)
+        store.write('bench', 'bench', grid)
+        write_ms = (time.perf_counter() - t0) * 1000
+        print(f"asset write: {base_ms:.1f} ms without profiles, {write_ms:.1f} ms with {len(store.profiles)} profiles")
+
+        print(f"{'profile':<12}{'width':>6}{'walkable':>10}{'erode(ms)':>11}{'open(ms)':>10}"
+              f"{'routes':>8}{'length':>9}{'wall min':>10}{'required':>10}")
+        for name, min_width in (('default', 1), *ROUTING_PROFILES.items()):
+            t0 = time.perf_counter()
+            eroded = erode_grid(grid, min_width)
+            ComponentIndex.build(eroded), SnapIndex.build(eroded)
+            erode_ms = (time.perf_counter() - t0) * 1000
+
+            t0 = time.perf_counter()
+            stored = store.load('bench', 'bench') if name == 'default' else store.load_profile('bench', 'bench', name)
+            open_ms = (time.perf_counter() - t0) * 1000
+
+            lengths, minimums = [], []
+            for start, end in queries:
+                path, _ = pathfinder.search(stored.grid, start, end, 'astar',
+                                            components=stored.components, snap_index=stored.snap_index)
+                if path is None:
+                    continue
+                lengths.append(sum(math.dist(a, b) for a, b in zip(path, path[1:])) * max(grid.shape))
+                minimums.append(wall_minimum(path))
+            print(f"{name:<12}{min_width:>6}{int(stored.grid.sum()):>10}{erode_ms:>11.1f}{open_ms:>10.2f}"
+                  f"{len(lengths):>4}/{len(queries):<3}{np.mean(lengths):>9.1f}{np.min(minimums):>10.2f}"
+                  f"{(min_width + 1) / 2:>10.1f}")
+
+
+BENCHMARKS = {
+    'astar': bench_astar,
+    'engines': bench_engines,
+    'ara': bench_ara,
+    'latency': bench_latency,
+    'hpa': bench_hpa,
+    'snap': bench_snap,
+    'alt': bench_alt,
+    'flowfield': bench_flowfield,
+    'matrix': bench_matrix,
+    'tour': bench_tour,
+    'executor': bench_executor,
+    'assets': bench_assets,
+    'alternatives': bench_alternatives,
+    'batch': bench_batch,
+    'isochrone': bench_isochrone,
+    'nearest': bench_nearest,
+    'rdp': bench_rdp,
+    'smoothing': bench_smoothing,
+    'wire': bench_wire,
+    'overlay': bench_overlay,
+    'clearance': bench_clearance,
+    'profiles': bench_profiles,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('--grid', help='grid.json 경로 (기본: 400x300 합성 쇼핑몰 그리드)')
+    parser.add_argument('--queries', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    grid = load_grid(args.grid)
+    queries = sample_queries(grid, args.queries, seed=args.seed)
+    print(f"grid: {grid.shape[1]}x{grid.shape[0]}, queries: {len(queries)}")
+    BENCHMARKS[args.benchmark](grid, queries)
+
+
+if __name__ == "__main__":
+    sys.exit(main())